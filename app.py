@@ -4,8 +4,15 @@ Tokenomics Analyzer - Application Streamlit
 Application pour analyser la viabilité de la tokenomics des projets crypto.
 """
 
+import re
+import secrets
+import time
+
 import streamlit as st
-from typing import Dict, Any
+from contextlib import nullcontext
+from typing import Dict, Any, List, Optional, Tuple
+
+import requests
 
 from tokenomics.scenarios import (
     get_scenario_categories,
@@ -27,8 +34,19 @@ from tokenomics.visualizations import (
     create_supply_distribution_chart,
     create_dilution_projection,
     create_score_breakdown_chart,
-    create_gauge_chart
+    create_gauge_chart,
+    create_supply_fan_chart,
+    create_score_trend_chart
 )
+from tokenomics.history import get_history_store
+from tokenomics.precompute import get_scenario_cache
+from tokenomics.reports import export_html
+from tokenomics.simulation import simulate_burn
+from tokenomics.solver import solve_target
+from tokenomics.trends import get_trend_store
+from tokenomics.vesting import buckets_from_params, locked_breakdown
+from tokenomics.instrumentation import span, collect, summarize, render_prometheus
+from tokenomics.profiling import profile_session
 
 
 # Configuration de la page
@@ -87,6 +105,120 @@ else:
     """, unsafe_allow_html=True)
 
 
+# Fragments (Streamlit >= 1.37) : un widget placé dans un fragment ne réexécute
+# que ce fragment. Seuls les panneaux qui portent des widgets en sont : un
+# panneau sans widget est de toute façon réexécuté avec le script qui l'appelle.
+fragment = st.fragment
+
+
+# ========== CACHES PARTAGÉS ENTRE SESSIONS ==========
+#
+# Les résultats réseau, les scores et les simulations passent par st.cache_data
+# (clé = arguments, copie renvoyée à chaque session) ; les figures des graphiques
+# par le cache de figures de tokenomics.visualizations, lui aussi partagé par
+# tout le processus. Un même calcul n'est fait qu'une fois, quel que soit le
+# nombre d'utilisateurs.
+
+# Durée de validité des données CoinGecko (secondes)
+MARKET_DATA_TTL = 300
+
+
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Session HTTP partagée : connexions keep-alive réutilisées vers CoinGecko."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _TokenNotFound(Exception):
+    """Échec de récupération (levé pour ne pas mettre l'échec en cache)."""
+
+
+@st.cache_data(ttl=MARKET_DATA_TTL, max_entries=500, show_spinner=False)
+def _fetch_token_params(coin_id: str) -> Dict[str, Any]:
+    data = fetch_coingecko_data(coin_id, session=get_http_session())
+    if not data:
+        raise _TokenNotFound(coin_id)
+    params = parse_coingecko_to_params(data)
+    return enhance_params_with_known_data(params, coin_id)
+
+
+def load_token_params(coin_id: str) -> Optional[Dict[str, Any]]:
+    """Paramètres d'un token CoinGecko (None si introuvable, échec non mis en cache)."""
+    try:
+        return _fetch_token_params(coin_id)
+    except _TokenNotFound:
+        return None
+
+
+@st.cache_data(ttl=3600, max_entries=200, show_spinner=False)
+def search_tokens(query: str) -> list:
+    """Recherche CoinGecko (résultats partagés pendant une heure)."""
+    return search_coingecko_coin(query, session=get_http_session())
+
+
+@st.cache_data(max_entries=100, show_spinner=False)
+def load_scenario_params(scenario_name: str) -> Dict[str, Any]:
+    """Paramètres d'un scénario préconfiguré (copie propre à chaque appel)."""
+    return get_scenario_params(scenario_name)
+
+
+@st.cache_data(max_entries=1000, show_spinner=False)
+def score_token(params: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """Score et recommandations d'un jeu de paramètres."""
+    score_data = calculate_viability_index(params)
+    return score_data, get_recommendations(score_data)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def run_burn_simulation(params: Dict[str, Any], years: int, paths: int, volatility: float) -> Dict[str, Any]:
+    """Simulation Monte Carlo du burn (graine fixe : résultat déterministe)."""
+    return simulate_burn(params, years=years, paths=paths, volume_volatility=volatility, seed=42)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def run_target_solver(params: Dict[str, Any], target: int, metric: str) -> Dict[str, Any]:
+    """Changement de paramètres minimal pour atteindre un score cible."""
+    return solve_target(params, target=target, metric=metric)
+
+
+@st.cache_data(ttl=600, max_entries=200, show_spinner=False)
+def load_score_trend(token_id: str) -> Dict[str, Any]:
+    """Historique du score d'un token (relu au plus toutes les 10 minutes)."""
+    return get_trend_store().query(token_id)
+
+
+# Format d'un code d'historique (clé de la base, jamais lu depuis l'URL)
+HISTORY_CODE_PATTERN = re.compile(r'^[0-9a-f]{16}$')
+
+
+def history_session_id() -> str:
+    """
+    Identifiant d'historique de la session.
+
+    Il ne figure pas dans l'URL (un lien partagé ou mis en favori ne donne pas
+    accès à l'historique) : l'utilisateur le retrouve sur un autre onglet ou
+    appareil en saisissant explicitement son code de restauration.
+    """
+    session_id = st.session_state.get('history_session')
+    if session_id is None:
+        session_id = secrets.token_hex(8)
+        st.session_state['history_session'] = session_id
+    return session_id
+
+
+def restore_history(code: str) -> bool:
+    """Adopte l'historique d'un code de restauration (False si le format est invalide)."""
+    code = code.strip().lower()
+    if not HISTORY_CODE_PATTERN.match(code):
+        return False
+    st.session_state['history_session'] = code
+    return True
+
+
 def init_session_state():
     """Initialise les variables de session."""
     if 'analysis_params' not in st.session_state:
@@ -98,7 +230,7 @@ def init_session_state():
 def load_scenario(scenario_name: str):
     """Charge un scénario préconfigé dans le state."""
     if scenario_name != "Aucun (configuration manuelle)":
-        params = get_scenario_params(scenario_name)
+        params = load_scenario_params(scenario_name)
         st.session_state.analysis_params = params
         st.session_state.current_scenario = scenario_name
     else:
@@ -165,12 +297,9 @@ def render_quick_analysis():
     if analyze_button and coin_input:
         with st.spinner(f"Récupération des données pour '{coin_input}'..."):
             # Tentative de récupération directe
-            data = fetch_coingecko_data(coin_input.lower())
+            params = load_token_params(coin_input.lower())
             
-            if data:
-                params = parse_coingecko_to_params(data)
-                params = enhance_params_with_known_data(params, coin_input.lower())
-                
+            if params:
                 st.success(f"✅ Données récupérées pour **{params['name']}** ({params['symbol']})")
                 
                 # Afficher les infos de base
@@ -226,7 +355,7 @@ def render_quick_analysis():
                 
                 # Recherche de tokens similaires
                 with st.spinner("Recherche de tokens similaires..."):
-                    results = search_coingecko_coin(coin_input)
+                    results = search_tokens(coin_input)
                     if results:
                         st.write("**🔍 Tokens similaires trouvés :**")
                         for result in results[:5]:
@@ -258,7 +387,7 @@ def render_manual_analysis():
     
     # Afficher la description du scénario si disponible
     if selected_scenario != "Aucun (configuration manuelle)":
-        params = get_scenario_params(selected_scenario)
+        params = load_scenario_params(selected_scenario)
         st.info(f"📄 **Description** : {params.get('description', 'N/A')}")
     
     st.divider()
@@ -455,115 +584,20 @@ def render_manual_analysis():
         render_analysis_results(params, selected_scenario)
 
 
-def generate_export_html(params: Dict[str, Any], score_data: Dict[str, Any], recommendations: list) -> str:
-    """Génère un HTML pour export/impression PDF."""
-    token_name = params.get('name', 'Token')
-    
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="utf-8">
-        <title>Tokenomics Analysis - {token_name}</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 40px; }}
-            h1 {{ color: #6366f1; }}
-            h2 {{ color: #4338ca; margin-top: 30px; }}
-            .score {{ font-size: 48px; font-weight: bold; color: #10b981; }}
-            .metric {{ display: inline-block; margin: 10px 20px; }}
-            .metric-label {{ font-weight: bold; }}
-            table {{ width: 100%; border-collapse: collapse; margin: 20px 0; }}
-            th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; }}
-            th {{ background-color: #6366f1; color: white; }}
-            .recommendation {{ margin: 10px 0; padding: 10px; background: #f3f4f6; border-radius: 5px; }}
-            @media print {{ body {{ margin: 20px; }} }}
-        </style>
-    </head>
-    <body>
-        <h1>🪙 Tokenomics Analysis Report</h1>
-        <h2>{token_name} ({params.get('symbol', 'N/A')})</h2>
-        <p><strong>Date:</strong> {__import__('datetime').datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-        
-        <h2>📊 Score Final</h2>
-        <div class="score">{score_data['final_score']}/100</div>
-        <p><strong>Verdict:</strong> {score_data['verdict']}</p>
-        
-        <h2>📈 Métriques Principales</h2>
-        <div class="metric">
-            <div class="metric-label">Prix:</div>
-            ${params.get('price_usd', 0):,.2f}
-        </div>
-        <div class="metric">
-            <div class="metric-label">Market Cap:</div>
-            ${params.get('market_cap_usd', 0):,.0f}
-        </div>
-        <div class="metric">
-            <div class="metric-label">Circulating Supply:</div>
-            {params['circulating_supply']:,.0f}
-        </div>
-        <div class="metric">
-            <div class="metric-label">Max Supply:</div>
-            {'Illimité' if params['max_supply'] == 0 else f"{params['max_supply']:,.0f}"}
-        </div>
-        
-        <h2>🎯 Scores Détaillés</h2>
-        <table>
-            <tr>
-                <th>Composante</th>
-                <th>Score</th>
-                <th>Pondération</th>
-                <th>Commentaire</th>
-            </tr>
-            <tr>
-                <td>Inflation</td>
-                <td>{score_data['inflation_score']:.1f}/100</td>
-                <td>{score_data['weights']['inflation']*100:.0f}%</td>
-                <td>{score_data['inflation_comment']}</td>
-            </tr>
-            <tr>
-                <td>Distribution</td>
-                <td>{score_data['distribution_score']:.1f}/100</td>
-                <td>{score_data['weights']['distribution']*100:.0f}%</td>
-                <td>{score_data['distribution_comment']}</td>
-            </tr>
-            <tr>
-                <td>Utilité</td>
-                <td>{score_data['utility_score']:.1f}/100</td>
-                <td>{score_data['weights']['utility']*100:.0f}%</td>
-                <td>{score_data['utility_comment']}</td>
-            </tr>
-            <tr>
-                <td>Gouvernance</td>
-                <td>{score_data['governance_score']:.1f}/100</td>
-                <td>{score_data['weights']['governance']*100:.0f}%</td>
-                <td>{score_data['governance_comment']}</td>
-            </tr>
-            <tr>
-                <td>Incitations</td>
-                <td>{score_data['incentives_score']:.1f}/100</td>
-                <td>{score_data['weights']['incentives']*100:.0f}%</td>
-                <td>{score_data['incentives_comment']}</td>
-            </tr>
-        </table>
-        
-        <h2>💡 Recommandations</h2>
-        {''.join([f'<div class="recommendation">{rec}</div>' for rec in recommendations])}
-        
-        <hr style="margin-top: 50px;">
-        <p style="text-align: center; color: gray;">
-            Généré par <strong>Tokenomics Analyzer</strong> | 
-            <a href="https://github.com/GuillaumeVerb/tokenomics-analysis">GitHub</a>
-        </p>
-        <p style="text-align: center; color: gray; font-size: 12px;">
-            ⚠️ Cet outil est fourni à titre éducatif. Pas de conseil en investissement. DYOR.
-        </p>
-    </body>
-    </html>
-    """
-    return html
+def render_analysis_results(params: Dict[str, Any], scenario_name: str = None):
+    """Affiche les résultats de l'analyse (profilée si le mode profiling est actif)."""
+    force_profiling = True if st.session_state.get('debug_profiling') else None
+    with profile_session("render_analysis_results", enabled=force_profiling) as report:
+        _render_analysis_results(params, scenario_name)
+    
+    if report is not None:
+        st.caption(
+            f"🔬 Profil enregistré : `{report.text_path}` "
+            f"({report.duration_s * 1000:.0f} ms, pic mémoire {report.peak_memory_bytes / 1024:.0f} Ko)"
+        )
 
 
-def render_analysis_results(params: Dict[str, Any], scenario_name: str = None):
+def _render_analysis_results(params: Dict[str, Any], scenario_name: str = None):
     """Affiche les résultats de l'analyse."""
     st.divider()
     
@@ -572,56 +606,21 @@ def render_analysis_results(params: Dict[str, Any], scenario_name: str = None):
     with col_header1:
         st.header("📊 Résultats de l'Analyse")
     
-    # Calcul du score
-    score_data = calculate_viability_index(params)
-    recommendations = get_recommendations(score_data)
-    
-    # Ajouter à l'historique
-    if 'history' not in st.session_state:
-        st.session_state['history'] = []
-    
-    import datetime
-    history_entry = {
-        'name': params.get('name', 'Token'),
-        'symbol': params.get('symbol', 'N/A'),
-        'score': score_data['final_score'],
-        'time': datetime.datetime.now().strftime('%H:%M'),
-        'params': params
-    }
-    
-    # Éviter les doublons (même token dans les 2 dernières entrées)
-    if not st.session_state['history'] or st.session_state['history'][-1]['symbol'] != history_entry['symbol']:
-        st.session_state['history'].append(history_entry)
+    # Calcul du score (précalculé pour un scénario non modifié)
+    cached = get_scenario_cache().lookup(scenario_name, params)
+    if cached is not None:
+        score_data = cached['score_data']
+        recommendations = cached['recommendations']
+    else:
+        score_data, recommendations = score_token(params)
     
-    # Limiter à 20 entrées max
-    if len(st.session_state['history']) > 20:
-        st.session_state['history'] = st.session_state['history'][-20:]
+    # Ajouter à l'historique (enregistrement compact, paramètres stockés hors session)
+    get_history_store().add(history_session_id(), params, score_data['final_score'])
     
-    # Bouton d'export
     with col_header2:
-        html_export = generate_export_html(params, score_data, recommendations)
-        st.download_button(
-            label="📥 Export PDF",
-            data=html_export,
-            file_name=f"tokenomics_{params.get('symbol', 'token')}_{__import__('datetime').datetime.now().strftime('%Y%m%d')}.html",
-            mime="text/html",
-            help="Téléchargez le rapport (ouvrez le fichier HTML et imprimez en PDF)",
-            use_container_width=True
-        )
+        render_export_panel(params, score_data, recommendations)
     
-    # Score final (grande jauge)
-    st.subheader("🎯 Score Final")
-    gauge_fig = create_gauge_chart(score_data['final_score'])
-    st.plotly_chart(gauge_fig, use_container_width=True)
-    
-    # Verdict
-    verdict_colors = {
-        'green': '🟢',
-        'orange': '🟠',
-        'red': '🔴'
-    }
-    verdict_emoji = verdict_colors.get(score_data['verdict_color'], '⚪')
-    st.markdown(f"### {verdict_emoji} {score_data['verdict']} — Score : **{score_data['final_score']}/100**")
+    render_gauge_panel(score_data)
     
     st.divider()
     
@@ -631,26 +630,10 @@ def render_analysis_results(params: Dict[str, Any], scenario_name: str = None):
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        breakdown_fig = create_score_breakdown_chart(score_data)
-        st.plotly_chart(breakdown_fig, use_container_width=True)
+        render_breakdown_panel(score_data)
     
     with col2:
-        st.markdown("#### 📋 Détails")
-        
-        components = [
-            ("Inflation", score_data['inflation_score'], score_data['inflation_comment']),
-            ("Distribution", score_data['distribution_score'], score_data['distribution_comment']),
-            ("Utilité", score_data['utility_score'], score_data['utility_comment']),
-            ("Gouvernance", score_data['governance_score'], score_data['governance_comment']),
-            ("Incitations", score_data['incentives_score'], score_data['incentives_comment']),
-            ("💰 Liquidité", score_data.get('liquidity_score', 0), score_data.get('liquidity_comment', 'N/A')),
-            ("🌍 Adoption", score_data.get('adoption_score', 0), score_data.get('adoption_comment', 'N/A')),
-            ("🔐 Sécurité", score_data.get('security_score', 0), score_data.get('security_comment', 'N/A'))
-        ]
-        
-        for name, score, comment in components:
-            with st.expander(f"**{name}** : {score:.1f}/100"):
-                st.write(comment)
+        render_score_details_panel(score_data)
     
     st.divider()
     
@@ -660,25 +643,123 @@ def render_analysis_results(params: Dict[str, Any], scenario_name: str = None):
     col1, col2 = st.columns(2)
     
     with col1:
-        supply_fig = create_supply_distribution_chart(
-            params['circulating_supply'],
-            params['total_supply'],
-            params['max_supply']
-        )
-        st.plotly_chart(supply_fig, use_container_width=True)
+        render_supply_panel(params)
     
     with col2:
-        dilution_fig = create_dilution_projection(
+        render_dilution_panel(
             params['circulating_supply'],
-            scenario_name=scenario_name if scenario_name and scenario_name != "Aucun (configuration manuelle)" else None,
-            inflation_rate=params['inflation_rate'],
-            years=5
+            scenario_name if scenario_name and scenario_name != "Aucun (configuration manuelle)" else None,
+            params['inflation_rate'],
+            cached['projection'] if cached is not None else None
         )
-        st.plotly_chart(dilution_fig, use_container_width=True)
+    
+    render_burn_simulation(params)
+    render_target_solver(params, score_data['final_score'])
+    render_score_trend(scenario_name)
     
     st.divider()
     
-    # Recommandations
+    render_recommendations_panel(recommendations)
+
+
+# ========== PANNEAUX DES RÉSULTATS ==========
+#
+# Chaque panneau ne dépend que de ses propres entrées. Ceux qui portent des
+# widgets (export, simulation, solveur) sont des fragments : une interaction
+# n'y réexécute que le panneau, pas le scoring ni les autres graphiques.
+
+@fragment
+def render_export_panel(params: Dict[str, Any], score_data: Dict[str, Any], recommendations: List[str]):
+    """Bouton d'export (rapport servi depuis le cache tant que les paramètres ne changent pas)."""
+    with span("export.html"):
+        html_export = export_html(params, score_data, recommendations)
+        st.download_button(
+            label="📥 Export PDF",
+            data=html_export,
+            file_name=f"tokenomics_{params.get('symbol', 'token')}_{__import__('datetime').datetime.now().strftime('%Y%m%d')}.html",
+            mime="text/html",
+            help="Téléchargez le rapport (ouvrez le fichier HTML et imprimez en PDF)",
+            use_container_width=True
+        )
+
+
+def render_gauge_panel(score_data: Dict[str, Any]):
+    """Score final (grande jauge) et verdict."""
+    st.subheader("🎯 Score Final")
+    gauge_fig = create_gauge_chart(score_data['final_score'])
+    with span("st.gauge"):
+        st.plotly_chart(gauge_fig, use_container_width=True)
+    
+    # Verdict
+    verdict_colors = {
+        'green': '🟢',
+        'orange': '🟠',
+        'red': '🔴'
+    }
+    verdict_emoji = verdict_colors.get(score_data['verdict_color'], '⚪')
+    st.markdown(f"### {verdict_emoji} {score_data['verdict']} — Score : **{score_data['final_score']}/100**")
+
+
+def render_breakdown_panel(score_data: Dict[str, Any]):
+    """Graphique des scores par composante."""
+    breakdown_fig = create_score_breakdown_chart(score_data)
+    with span("st.score_breakdown"):
+        st.plotly_chart(breakdown_fig, use_container_width=True)
+
+
+def render_score_details_panel(score_data: Dict[str, Any]):
+    """Détail des scores et commentaires par composante."""
+    st.markdown("#### 📋 Détails")
+    
+    components = [
+        ("Inflation", score_data['inflation_score'], score_data['inflation_comment']),
+        ("Distribution", score_data['distribution_score'], score_data['distribution_comment']),
+        ("Utilité", score_data['utility_score'], score_data['utility_comment']),
+        ("Gouvernance", score_data['governance_score'], score_data['governance_comment']),
+        ("Incitations", score_data['incentives_score'], score_data['incentives_comment']),
+        ("💰 Liquidité", score_data.get('liquidity_score', 0), score_data.get('liquidity_comment', 'N/A')),
+        ("🌍 Adoption", score_data.get('adoption_score', 0), score_data.get('adoption_comment', 'N/A')),
+        ("🔐 Sécurité", score_data.get('security_score', 0), score_data.get('security_comment', 'N/A'))
+    ]
+    
+    for name, score, comment in components:
+        with st.expander(f"**{name}** : {score:.1f}/100"):
+            st.write(comment)
+
+
+def render_supply_panel(params: Dict[str, Any]):
+    """Distribution de la supply (part bloquée détaillée par bucket de vesting)."""
+    with span("vesting.locked_breakdown"):
+        buckets = buckets_from_params(params)
+        breakdown = locked_breakdown(buckets) if buckets else None
+    supply_fig = create_supply_distribution_chart(
+        params['circulating_supply'], params['total_supply'], params['max_supply'],
+        locked_breakdown=breakdown
+    )
+    with span("st.supply_distribution"):
+        st.plotly_chart(supply_fig, use_container_width=True)
+
+
+def render_dilution_panel(
+    circulating_supply: float,
+    scenario_name: Optional[str],
+    inflation_rate: float,
+    projection: Optional[Dict[str, Any]] = None
+):
+    """Projection de dilution sur 5 ans."""
+    dilution_fig = create_dilution_projection(
+        circulating_supply,
+        scenario_name=scenario_name,
+        inflation_rate=inflation_rate,
+        years=5,
+        projection=projection
+    )
+    with span("st.dilution_projection"):
+        st.plotly_chart(dilution_fig, use_container_width=True)
+
+
+def render_recommendations_panel(recommendations: List[str]):
+    """Recommandations."""
     st.subheader("💡 Recommandations")
     
     if recommendations:
@@ -688,8 +769,85 @@ def render_analysis_results(params: Dict[str, Any], scenario_name: str = None):
         st.success("✅ Aucune recommandation spécifique. La tokenomics semble bien équilibrée.")
 
 
+@fragment
+def render_burn_simulation(params: Dict[str, Any]):
+    """Affiche la simulation Monte Carlo émissions vs burn piloté par le volume."""
+    with st.expander("🎲 Simulation stochastique du burn (Monte Carlo)"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            years = st.slider("Horizon (années)", 1, 10, 5, key="burn_sim_years")
+        with col2:
+            volatility = st.slider(
+                "Volatilité annuelle du volume", 0.0, 2.0, 0.8, 0.1,
+                key="burn_sim_volatility",
+                help="Écart-type annuel du log-volume. Le burn mensuel est proportionnel au volume simulé."
+            )
+        with col3:
+            paths = st.select_slider("Trajectoires", [1_000, 5_000, 10_000], value=10_000, key="burn_sim_paths")
+        
+        with span("simulation.burn"):
+            simulation = run_burn_simulation(params, years, paths, volatility)
+        
+        fan_fig = create_supply_fan_chart(simulation)
+        with span("st.supply_fan"):
+            st.plotly_chart(fan_fig, use_container_width=True)
+        
+        net = simulation['net_inflation_pct']
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Inflation nette médiane", f"{net[len(net) // 2]:+.1f}%")
+        col2.metric("Intervalle P5 – P95", f"{net[0]:+.1f}% / {net[-1]:+.1f}%")
+        col3.metric("Probabilité de déflation", f"{simulation['prob_deflation'] * 100:.0f}%")
+
+
+@fragment
+def render_target_solver(params: Dict[str, Any], current_score: float):
+    """Affiche le changement de paramètres le moins coûteux pour atteindre un score cible."""
+    with st.expander("🎯 Que faudrait-il pour atteindre un score cible ?"):
+        col1, col2 = st.columns(2)
+        with col1:
+            target = st.slider("Score cible", 0, 100, max(65, min(100, int(current_score) + 1)), key="solver_target")
+        with col2:
+            metric = st.selectbox(
+                "Métrique",
+                ['final_score', 'inflation_score', 'distribution_score', 'utility_score',
+                 'governance_score', 'incentives_score'],
+                key="solver_metric"
+            )
+        
+        with span("solver.solve_target"):
+            result = run_target_solver(params, target, metric)
+        
+        if not result['changes']:
+            st.success(f"✅ Cible déjà atteinte ({result['current_score']}/100)")
+            return
+        if not result['reachable']:
+            st.warning(f"⚠️ Cible inaccessible en ajustant les paramètres : meilleur score possible {result['score']}/100")
+        else:
+            st.info(f"Score obtenu : **{result['score']}/100** (coût du changement : {result['cost']})")
+        for name, change in result['changes'].items():
+            st.markdown(f"- `{name}` : {change['from']} → **{change['to']}**")
+
+
+def render_score_trend(token_id: str = None):
+    """Affiche l'historique du score d'un token (si présent dans le stockage des tendances)."""
+    store = get_trend_store()
+    if store is None or not token_id or token_id not in store:
+        return
+    
+    with st.expander("📅 Historique du score", expanded=True):
+        with span("trends.query"):
+            trend = load_score_trend(token_id)
+        if len(trend['date']) == 0:
+            st.info("Aucun historique pour ce token.")
+            return
+        trend_fig = create_score_trend_chart(trend)
+        with span("st.score_trend"):
+            st.plotly_chart(trend_fig, use_container_width=True)
+
+
+@fragment
 def render_comparison_mode():
-    """Affiche le mode de comparaison de 2 tokens."""
+    """Affiche le mode de comparaison de 2 tokens (fragment : les boutons ne réexécutent que ce mode)."""
     st.header("⚖️ Mode Comparaison")
     st.markdown("Comparez la tokenomics de 2 projets côte à côte.")
     
@@ -709,10 +867,8 @@ def render_comparison_mode():
     if analyze_a and token_a:
         with col1:
             with st.spinner(f"Analyse de {token_a}..."):
-                data_a = fetch_coingecko_data(token_a)
-                if data_a:
-                    params_a = parse_coingecko_to_params(data_a)
-                    params_a = enhance_params_with_known_data(params_a, token_a.lower())
+                params_a = load_token_params(token_a.lower())
+                if params_a:
                     st.session_state['comparison_a'] = params_a
                     st.success(f"✅ {params_a['name']} chargé")
                 else:
@@ -722,10 +878,8 @@ def render_comparison_mode():
     if analyze_b and token_b:
         with col2:
             with st.spinner(f"Analyse de {token_b}..."):
-                data_b = fetch_coingecko_data(token_b)
-                if data_b:
-                    params_b = parse_coingecko_to_params(data_b)
-                    params_b = enhance_params_with_known_data(params_b, token_b.lower())
+                params_b = load_token_params(token_b.lower())
+                if params_b:
                     st.session_state['comparison_b'] = params_b
                     st.success(f"✅ {params_b['name']} chargé")
                 else:
@@ -739,8 +893,8 @@ def render_comparison_mode():
         params_a = st.session_state['comparison_a']
         params_b = st.session_state['comparison_b']
         
-        score_a = calculate_viability_index(params_a)
-        score_b = calculate_viability_index(params_b)
+        score_a, _ = score_token(params_a)
+        score_b, _ = score_token(params_b)
         
         # Scores finaux
         col1, col2 = st.columns(2)
@@ -920,9 +1074,76 @@ def render_methodology():
         """)
 
 
+def render_timings_panel(records: list):
+    """Affiche les durées mesurées pendant ce rerun (panneau de debug)."""
+    st.divider()
+    with st.expander("⏱️ Durées par étape (ce rerun)", expanded=True):
+        if not records:
+            st.caption("Aucune étape mesurée pendant ce rerun.")
+        else:
+            rows = [
+                {
+                    'Étape': entry['stage'],
+                    'Appels': entry['calls'],
+                    'Total (ms)': round(entry['total_ms'], 2),
+                    'Max (ms)': round(entry['max_ms'], 2)
+                }
+                for entry in summarize(records)
+            ]
+            st.dataframe(rows, use_container_width=True, hide_index=True)
+        
+        st.caption("Métriques cumulées du processus (format Prometheus)")
+        st.code(render_prometheus(), language="text")
+
+
+def toggle_theme():
+    """Bascule entre thème clair et sombre (callback du bouton de la sidebar)."""
+    st.session_state['theme'] = 'light' if st.session_state['theme'] == 'dark' else 'dark'
+
+
+@fragment
+def render_history_panel():
+    """
+    Historique des analyses de la sidebar (paramètres relus seulement au rechargement).
+
+    Fragment : seuls le rechargement d'une analyse et la restauration d'un
+    historique réexécutent toute l'application.
+    """
+    history = get_history_store().recent(history_session_id(), limit=5)
+    st.divider()
+    st.markdown("### 📝 Historique")
+    with st.expander("🔑 Code de restauration", expanded=False):
+        st.caption("Saisissez ce code dans un autre onglet pour y retrouver cet historique. Ne le partagez pas.")
+        st.code(history_session_id(), language=None)
+        code = st.text_input("Restaurer un historique", key="history_restore_code", placeholder="Code à 16 caractères")
+        if st.button("Restaurer", key="history_restore"):
+            if restore_history(code):
+                st.rerun()
+            st.error("Code invalide (16 caractères hexadécimaux)")
+    if not history:
+        return
+    with st.expander("Dernières analyses", expanded=False):
+        for entry in history:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown(f"**{entry['name']}** ({entry['symbol']})")
+                st.caption(f"Score: {entry['score']:.1f}/100 • {time.strftime('%d/%m %H:%M', time.localtime(entry['created_at']))}")
+            with col2:
+                if st.button("🔄", key=f"reload_{entry['id']}", help="Recharger"):
+                    params = get_history_store().load_params(entry['params_hash'])
+                    if params is not None:
+                        st.session_state.analysis_params = params
+                        st.rerun()
+
+
 def main():
     """Fonction principale de l'application."""
     init_session_state()
+    
+    # Scores des scénarios préconfigurés : calculés une fois par processus
+    with span("precompute.scenarios"):
+        get_scenario_cache()
+    
     render_header()
     
     # Sidebar pour navigation
@@ -939,9 +1160,9 @@ def main():
                 st.session_state['theme'] = 'dark'
             
             # Bouton toggle
-            if st.button("🌓", help="Changer le thème", key="theme_toggle"):
-                st.session_state['theme'] = 'light' if st.session_state['theme'] == 'dark' else 'dark'
-                st.rerun()
+            # Le thème est basculé avant la réexécution (CSS appliqué en tête de script) :
+            # un seul passage du script au lieu de deux
+            st.button("🌓", help="Changer le thème", key="theme_toggle", on_click=toggle_theme)
         
         mode = st.radio(
             "Mode d'analyse",
@@ -960,20 +1181,17 @@ def main():
         
         st.divider()
         
-        # Historique des analyses
-        if 'history' in st.session_state and st.session_state['history']:
-            st.divider()
-            st.markdown("### 📝 Historique")
-            with st.expander("Dernières analyses", expanded=False):
-                for i, entry in enumerate(reversed(st.session_state['history'][-5:])):
-                    col1, col2 = st.columns([3, 1])
-                    with col1:
-                        st.markdown(f"**{entry['name']}** ({entry['symbol']})")
-                        st.caption(f"Score: {entry['score']:.1f}/100 • {entry['time']}")
-                    with col2:
-                        if st.button("🔄", key=f"reload_{i}", help="Recharger"):
-                            st.session_state.analysis_params = entry['params']
-                            st.rerun()
+        render_history_panel()
+        
+        st.divider()
+        
+        # Panneau de debug : durées par étape pour cette session
+        debug_timings = st.checkbox("⏱️ Debug : durées par étape", key="debug_timings")
+        st.checkbox(
+            "🔬 Debug : profiling (cProfile + tracemalloc)",
+            key="debug_profiling",
+            help="Enregistre un rapport par analyse dans le répertoire de profiling"
+        )
         
         st.divider()
         
@@ -985,15 +1203,19 @@ def main():
         - [Portfolio](https://guillaumeverbiguie.com)
         """)
     
-    # Affichage selon le mode
-    if mode == "⚡ Analyse Rapide (CoinGecko)":
-        render_quick_analysis()
-    elif mode == "🔧 Analyse Manuelle":
-        render_manual_analysis()
-    elif mode == "⚖️ Comparaison":
-        render_comparison_mode()
-    else:
-        render_methodology()
+    # Affichage selon le mode (spans collectées seulement si le debug est actif)
+    with collect() if debug_timings else nullcontext([]) as timing_records:
+        if mode == "⚡ Analyse Rapide (CoinGecko)":
+            render_quick_analysis()
+        elif mode == "🔧 Analyse Manuelle":
+            render_manual_analysis()
+        elif mode == "⚖️ Comparaison":
+            render_comparison_mode()
+        else:
+            render_methodology()
+    
+    if debug_timings:
+        render_timings_panel(timing_records)
     
     # Footer
     st.divider()
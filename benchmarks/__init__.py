@@ -0,0 +1,7 @@
+"""
+Suite de benchmarks de performance de Tokenomics Analyzer.
+
+Usage :
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --filter score --compare benchmarks/results/baseline.json
+"""
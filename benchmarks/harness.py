@@ -0,0 +1,198 @@
+"""
+Outils de mesure : exécution chronométrée, percentiles, stockage JSON et
+comparaison entre deux exécutions.
+"""
+
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, Any, List, Optional
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentile par interpolation linéaire sur une liste triée."""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+def measure(
+    fn: Callable[[], Any],
+    iterations: int = 200,
+    warmup: int = 10,
+    items_per_call: int = 1,
+    max_seconds: float = 10.0
+) -> Dict[str, Any]:
+    """
+    Chronomètre `fn` appel par appel.
+
+    Args:
+        fn: Fonction sans argument à mesurer
+        iterations: Nombre maximal d'appels mesurés
+        warmup: Appels non mesurés (caches, imports paresseux)
+        items_per_call: Éléments traités par appel (pour le débit)
+        max_seconds: Budget de temps, on s'arrête avant `iterations` s'il est dépassé
+
+    Returns:
+        Statistiques en millisecondes + débit en éléments/s
+    """
+    for _ in range(warmup):
+        fn()
+
+    timings = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        deadline = time.perf_counter() + max_seconds
+        for _ in range(iterations):
+            start = time.perf_counter_ns()
+            fn()
+            timings.append((time.perf_counter_ns() - start) / 1e6)
+            if time.perf_counter() > deadline:
+                break
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    timings.sort()
+    total_ms = sum(timings)
+    return {
+        'iterations': len(timings),
+        'items_per_call': items_per_call,
+        'mean_ms': total_ms / len(timings),
+        'min_ms': timings[0],
+        'p50_ms': _percentile(timings, 50),
+        'p90_ms': _percentile(timings, 90),
+        'p99_ms': _percentile(timings, 99),
+        'max_ms': timings[-1],
+        'throughput_per_s': len(timings) * items_per_call / (total_ms / 1000) if total_ms > 0 else 0.0,
+    }
+
+
+# Dépendances lourdes qui ne doivent être chargées que par les modules qui s'en servent
+HEAVY_MODULES = ('plotly', 'pandas', 'requests', 'streamlit')
+
+
+def import_time(module: str) -> Dict[str, Any]:
+    """
+    Importe `module` dans un interpréteur neuf avec `python -X importtime`.
+
+    Args:
+        module: Module à importer (ex: "tokenomics.scoring")
+
+    Returns:
+        {'cumulative_ms': temps d'import cumulé du module,
+         'heavy': dépendances lourdes (HEAVY_MODULES) chargées au passage}
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True
+    )
+    # Lignes "import time: self [us] | cumulative | imported package"
+    cumulative_us = 0
+    loaded = set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        name = name.strip()
+        loaded.add(name.split(".")[0])
+        if name == module:
+            cumulative_us = int(cumulative)
+    return {
+        'cumulative_ms': cumulative_us / 1000,
+        'heavy': sorted(loaded.intersection(HEAVY_MODULES)),
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment_info() -> Dict[str, Any]:
+    """Métadonnées de l'exécution (commit, machine, versions)."""
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': _git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def save_results(results: Dict[str, Dict[str, Any]], directory: str) -> str:
+    """
+    Enregistre les résultats dans `<directory>/<date>-<commit>.json`.
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    os.makedirs(directory, exist_ok=True)
+    env = environment_info()
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+    path = os.path.join(directory, f"{stamp}-{env['git_revision'] or 'nogit'}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'environment': env, 'results': results}, f, indent=2)
+    return path
+
+
+def compare_results(
+    current: Dict[str, Dict[str, Any]],
+    baseline_path: str,
+    threshold_pct: float = 10.0
+) -> List[str]:
+    """
+    Compare les p50 aux résultats de référence.
+
+    Args:
+        current: Résultats de l'exécution courante
+        baseline_path: Fichier JSON d'une exécution précédente
+        threshold_pct: Variation au-delà de laquelle un cas est signalé
+
+    Returns:
+        Liste des cas en régression (p50 plus lent que le seuil)
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+
+    regressions = []
+    print(f"\n{'Benchmark':<40} {'p50 réf.':>12} {'p50 actuel':>12} {'Δ':>9}")
+    for name, stats in current.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['p50_ms']
+        after = stats['p50_ms']
+        delta = (after / before - 1) * 100 if before > 0 else 0.0
+        flag = ""
+        if delta > threshold_pct:
+            flag = " ⚠️"
+            regressions.append(name)
+        elif delta < -threshold_pct:
+            flag = " ✅"
+        print(f"{name:<40} {before:>10.3f}ms {after:>10.3f}ms {delta:>+8.1f}%{flag}")
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, Any]]) -> None:
+    """Affiche un tableau récapitulatif."""
+    print(f"\n{'Benchmark':<40} {'p50':>10} {'p90':>10} {'p99':>10} {'débit/s':>12}")
+    for name, stats in results.items():
+        print(
+            f"{name:<40} {stats['p50_ms']:>8.3f}ms {stats['p90_ms']:>8.3f}ms "
+            f"{stats['p99_ms']:>8.3f}ms {stats['throughput_per_s']:>12,.0f}"
+        )
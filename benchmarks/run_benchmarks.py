@@ -0,0 +1,516 @@
+"""
+Benchmarks des étapes clés : fetch, parsing, scoring, projection et rendu.
+
+Usage :
+    python -m benchmarks.run_benchmarks [--filter NOM] [--quick]
+                                        [--compare FICHIER.json] [--threshold 10]
+
+Les résultats sont enregistrés dans benchmarks/results/ (un JSON par exécution)
+pour comparer deux commits avec --compare.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Callable, Dict, Any, List
+
+from benchmarks.harness import import_time, measure, save_results, compare_results, print_results
+
+import tokenomics.api as api
+from tokenomics.api import parse_coingecko_to_params, enhance_params_with_known_data, fetch_coingecko_data
+from tokenomics.scenarios import get_all_scenarios, get_scenario_params, get_inflation_projection, project_scenarios, project_supply
+from tokenomics.scoring import calculate_viability_index, get_recommendations
+from tokenomics.visualizations import (
+    create_gauge_chart,
+    create_score_breakdown_chart,
+    create_supply_distribution_chart,
+    create_dilution_projection,
+    create_inflation_comparison,
+    clear_figure_cache
+)
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+# Réponse CoinGecko représentative (champs utilisés par parse_coingecko_to_params)
+SAMPLE_COINGECKO_DATA = {
+    'id': 'ethereum',
+    'name': 'Ethereum',
+    'symbol': 'eth',
+    'market_cap_rank': 2,
+    'market_data': {
+        'circulating_supply': 120_000_000,
+        'total_supply': 120_000_000,
+        'max_supply': None,
+        'current_price': {'usd': 3500.0},
+        'market_cap': {'usd': 420_000_000_000},
+        'total_volume': {'usd': 15_000_000_000},
+        'price_change_percentage_24h': 1.2,
+        'price_change_percentage_7d': -3.4,
+        'price_change_percentage_30d': 8.9,
+        'ath_change_percentage': {'usd': -28.0},
+    }
+}
+
+# Registre des benchmarks : (nom, fabrique de callable, itérations, éléments par appel)
+BENCHMARKS = []
+
+
+def benchmark(name: str, iterations: int = 500, items_per_call: int = 1):
+    """
+    Déclare un benchmark. La fonction décorée fait la préparation (non
+    chronométrée) et retourne le callable à mesurer.
+    """
+    def decorator(factory: Callable[[], Callable[[], Any]]):
+        BENCHMARKS.append((name, factory, iterations, items_per_call))
+        return factory
+    return decorator
+
+
+# ========== PARSING & SCORING ==========
+
+@benchmark("parse_coingecko_to_params", iterations=5000)
+def _bench_parse():
+    return lambda: parse_coingecko_to_params(SAMPLE_COINGECKO_DATA)
+
+
+@benchmark("enhance_params_with_known_data", iterations=5000)
+def _bench_enhance():
+    params = parse_coingecko_to_params(SAMPLE_COINGECKO_DATA)
+    return lambda: enhance_params_with_known_data(dict(params), 'ethereum')
+
+
+@benchmark("calculate_viability_index", iterations=5000)
+def _bench_score():
+    params = get_scenario_params("Modèle Pendle-like")
+    return lambda: calculate_viability_index(params)
+
+
+@benchmark("calculate_viability_index[batch=1000]", iterations=50, items_per_call=1000)
+def _bench_score_batch():
+    scenarios = get_all_scenarios()
+    params_list = [get_scenario_params(scenarios[i % len(scenarios)]) for i in range(1000)]
+    return lambda: [calculate_viability_index(p) for p in params_list]
+
+
+@benchmark("score_vectorized[100k]", iterations=20, items_per_call=100_000)
+def _bench_score_vectorized():
+    import numpy as np
+    from tokenomics.scoring import calculate_viability_index_vectorized
+    rng = np.random.default_rng(0)
+    columns = get_scenario_params("Modèle Pendle-like")
+    columns.update(
+        inflation_rate=rng.uniform(-2, 30, 100_000),
+        team_allocation=rng.uniform(0, 40, 100_000),
+        vesting_years=rng.integers(0, 6, 100_000),
+        lock_duration_months=rng.integers(0, 48, 100_000),
+    )
+    return lambda: calculate_viability_index_vectorized(columns)
+
+
+@benchmark("calculate_viability_index[TokenParams]", iterations=5000)
+def _bench_score_token_params():
+    from tokenomics.params import TokenParams
+    params = TokenParams.from_dict(get_scenario_params("Modèle Pendle-like"))
+    return lambda: calculate_viability_index(params)
+
+
+@benchmark("TokenParams.from_dict", iterations=5000)
+def _bench_token_params():
+    from tokenomics.params import TokenParams
+    params = get_scenario_params("Modèle Pendle-like")
+    return lambda: TokenParams.from_dict(params)
+
+
+@benchmark("score_vectorized[records 100k]", iterations=20, items_per_call=100_000)
+def _bench_score_records():
+    from tokenomics.params import TokenParams, to_records, as_columns
+    from tokenomics.scoring import calculate_viability_index_vectorized
+    base = TokenParams.from_dict(get_scenario_params("Modèle Pendle-like"))
+    records = to_records([base.replace(market_cap_rank=1 + i % 2000) for i in range(100_000)])
+    return lambda: calculate_viability_index_vectorized(as_columns(records))
+
+
+# ========== SCÉNARIOS & PROJECTIONS ==========
+
+@benchmark("get_scenario_params", iterations=5000)
+def _bench_scenario_params():
+    return lambda: get_scenario_params("Inflation négative / burn dynamique")
+
+
+@benchmark("get_inflation_projection[20y]", iterations=5000)
+def _bench_projection():
+    return lambda: get_inflation_projection("Inflation avec halving", 20)
+
+
+@benchmark("project_scenarios[all, 20y daily]", iterations=200)
+def _bench_project_scenarios():
+    scenarios = get_all_scenarios()
+    return lambda: project_scenarios(scenarios, years=20, granularity='daily')
+
+
+@benchmark("simulate_vesting[1000x24, 60m]", iterations=20, items_per_call=1000)
+def _bench_vesting():
+    from tokenomics.vesting import simulate_vesting, find_unlock_events
+    buckets = [
+        {'name': f'bucket-{i}', 'amount': 1_000_000 * (i + 1), 'start_month': i % 7 - 3,
+         'cliff_months': 6 * (i % 3), 'vesting_months': 12 * (1 + i % 4),
+         'release': 'step' if i % 2 else 'linear', 'step_months': 3}
+        for i in range(24)
+    ]
+    schedules = [buckets] * 1000
+    circulating = [50_000_000] * 1000
+    return lambda: find_unlock_events(simulate_vesting(schedules, months=60, circulating_supply=circulating))
+
+
+@benchmark("simulate_burn[10k paths, 5y]", iterations=30)
+def _bench_burn_simulation():
+    from tokenomics.simulation import simulate_burn
+    params = dict(get_scenario_params("Inflation négative / burn dynamique"), volume_24h=1_000_000)
+    return lambda: simulate_burn(params, years=5, paths=10_000, seed=1)
+
+
+@benchmark("solve_target[65]", iterations=20)
+def _bench_solve_target():
+    from tokenomics.solver import solve_target
+    params = get_scenario_params("Meme coin")
+    return lambda: solve_target(params, target=65)
+
+
+@benchmark("trend_store.query[1000 tokens x 2 ans]", iterations=500)
+def _bench_trend_query():
+    import atexit
+    import shutil
+    import tempfile
+    import numpy as np
+    from tokenomics.sweep import SCORE_FIELDS
+    from tokenomics.trends import TrendStore, to_day
+    directory = tempfile.mkdtemp(prefix="tokenomics_trends_")
+    atexit.register(shutil.rmtree, directory, True)
+    store = TrendStore(directory)
+    tokens, days = 1000, 730
+    start = to_day("2023-01-01")
+    rng = np.random.default_rng(0)
+    store.append(
+        [f"token-{i}" for i in range(tokens) for _ in range(days)],
+        np.tile(np.arange(start, start + days), tokens),
+        {field: rng.uniform(0, 100, tokens * days) for field in SCORE_FIELDS}
+    )
+    return lambda: store.query("token-500", "2023-06-01", "2024-06-01")
+
+
+_UNIVERSE_PATH = None
+
+
+def _universe_100k() -> str:
+    """Univers de 100k tokens scoré et enregistré (construit une fois par exécution)."""
+    global _UNIVERSE_PATH
+    if _UNIVERSE_PATH is None:
+        import atexit
+        import shutil
+        import tempfile
+        from tokenomics.universe import TokenUniverse
+        directory = tempfile.mkdtemp(prefix="tokenomics_universe_")
+        atexit.register(shutil.rmtree, directory, True)
+        scenarios = get_all_scenarios()
+        base = [get_scenario_params(name) for name in scenarios]
+        universe = TokenUniverse.from_params(
+            (f"token-{i}", dict(base[i % len(base)], name=f"Token {i}", market_cap_rank=1 + i % 3000))
+            for i in range(100_000)
+        )
+        _UNIVERSE_PATH = universe.score().save(os.path.join(directory, "universe"))
+    return _UNIVERSE_PATH
+
+
+@benchmark("universe.load[100k][mmap]", iterations=200)
+def _bench_universe_load():
+    from tokenomics.universe import TokenUniverse
+    path = _universe_100k()
+    return lambda: TokenUniverse.load(path)
+
+
+@benchmark("score_matrix.open[100k]", iterations=500)
+def _bench_score_matrix_open():
+    from tokenomics.score_matrix import ScoreMatrix, write_universe_scores
+    from tokenomics.universe import TokenUniverse
+    path = _universe_100k() + ".tkm"
+    write_universe_scores(TokenUniverse.load(_universe_100k()), path)
+    return lambda: ScoreMatrix(path)
+
+
+@benchmark("score_matrix.get[100k]", iterations=5000)
+def _bench_score_matrix_get():
+    from tokenomics.score_matrix import ScoreMatrix, write_universe_scores
+    from tokenomics.universe import TokenUniverse
+    path = _universe_100k() + ".tkm"
+    write_universe_scores(TokenUniverse.load(_universe_100k()), path)
+    matrix = ScoreMatrix(path)
+    return lambda: matrix.get("token-54321")
+
+
+@benchmark("universe.score[100k]", iterations=20, items_per_call=100_000)
+def _bench_universe_score():
+    from tokenomics.universe import TokenUniverse
+    universe = TokenUniverse.load(_universe_100k(), mmap=False)
+    return universe.score
+
+
+@benchmark("universe.filter+sort[100k]", iterations=50, items_per_call=100_000)
+def _bench_universe_filter():
+    from tokenomics.universe import TokenUniverse
+    universe = TokenUniverse.load(_universe_100k(), mmap=False)
+    return lambda: universe.filter(universe['final_score'] >= 50, enriched=False).sort('final_score', descending=True)
+
+
+# ========== GRAPHIQUES ==========
+
+def _uncached(build):
+    """Construction complète : cache de figures vidé avant chaque appel."""
+    def run():
+        clear_figure_cache()
+        return build()
+    return run
+
+
+@benchmark("create_gauge_chart", iterations=100)
+def _bench_gauge():
+    return _uncached(lambda: create_gauge_chart(72.5))
+
+
+@benchmark("create_score_breakdown_chart", iterations=100)
+def _bench_breakdown():
+    score_data = calculate_viability_index(get_scenario_params("Modèle Pendle-like"))
+    return _uncached(lambda: create_score_breakdown_chart(score_data))
+
+
+@benchmark("create_supply_distribution_chart", iterations=100)
+def _bench_supply():
+    return _uncached(lambda: create_supply_distribution_chart(150_000_000, 200_000_000, 258_000_000))
+
+
+@benchmark("create_dilution_projection", iterations=100)
+def _bench_dilution():
+    return _uncached(lambda: create_dilution_projection(150_000_000, scenario_name="Modèle Pendle-like", years=5))
+
+
+@benchmark("create_dilution_projection[20 ans, daily]", iterations=20)
+def _bench_dilution_daily():
+    return _uncached(lambda: create_dilution_projection(150_000_000, scenario_name="Modèle Pendle-like", years=20, granularity='daily'))
+
+
+@benchmark("lttb[7301 -> 2000]", iterations=50)
+def _bench_lttb():
+    from tokenomics.downsampling import lttb_indices
+    projection = project_supply(150_000_000, [8.0] * 20, 'daily')
+    return lambda: lttb_indices(projection['time'], projection['supply'], 2000)
+
+
+@benchmark("charts[4 graphiques][cache]", iterations=100)
+def _bench_cached_charts():
+    score_data = calculate_viability_index(get_scenario_params("Modèle Pendle-like"))
+    
+    def run():
+        create_gauge_chart(score_data['final_score'])
+        create_score_breakdown_chart(score_data)
+        create_supply_distribution_chart(150_000_000, 200_000_000, 258_000_000)
+        create_dilution_projection(150_000_000, scenario_name="Modèle Pendle-like", years=5)
+    return run
+
+
+def _report_charts(count: int):
+    """Paramètres des 4 graphiques d'un rapport, pour `count` tokens différents."""
+    scenarios = get_all_scenarios()
+    inputs = []
+    for i in range(count):
+        params = get_scenario_params(scenarios[i % len(scenarios)])
+        params['inflation_rate'] += i * 0.01
+        inputs.append((params, calculate_viability_index(params)))
+    return inputs
+
+
+@benchmark("figures[4 graphiques x 100][go.Figure]", iterations=3, items_per_call=400)
+def _bench_figures_validated():
+    from tokenomics.visualizations import (
+        gauge_chart_spec, score_breakdown_spec, supply_distribution_spec, dilution_projection_spec, _to_figure
+    )
+    inputs = _report_charts(100)
+    
+    def run():
+        for params, score_data in inputs:
+            _to_figure(gauge_chart_spec(score_data['final_score'])).to_json()
+            _to_figure(score_breakdown_spec(score_data)).to_json()
+            _to_figure(supply_distribution_spec(
+                params['circulating_supply'], params['total_supply'], params['max_supply']
+            )).to_json()
+            _to_figure(dilution_projection_spec(
+                params['circulating_supply'], inflation_rate=params['inflation_rate']
+            )).to_json()
+    return run
+
+
+@benchmark("figures[4 graphiques x 1000][spec]", iterations=5, items_per_call=4000)
+def _bench_figures_spec():
+    from tokenomics.visualizations import (
+        gauge_chart_spec, score_breakdown_spec, supply_distribution_spec, dilution_projection_spec, spec_to_json
+    )
+    inputs = _report_charts(1000)
+    
+    def run():
+        for params, score_data in inputs:
+            spec_to_json(gauge_chart_spec(score_data['final_score']))
+            spec_to_json(score_breakdown_spec(score_data))
+            spec_to_json(supply_distribution_spec(
+                params['circulating_supply'], params['total_supply'], params['max_supply']
+            ))
+            spec_to_json(dilution_projection_spec(
+                params['circulating_supply'], inflation_rate=params['inflation_rate']
+            ))
+    return run
+
+
+@benchmark("render_reports[1000 tokens][site]", iterations=3, items_per_call=1000)
+def _bench_reports():
+    import atexit
+    import shutil
+    import tempfile
+    from tokenomics.reports import render_reports
+    directory = tempfile.mkdtemp(prefix="tokenomics_reports_")
+    atexit.register(shutil.rmtree, directory, True)
+    entries = [
+        {'id': f"token-{i}", 'params': params, 'scenario': None}
+        for i, (params, _) in enumerate(_report_charts(1000))
+    ]
+    return lambda: render_reports(entries, os.path.join(directory, "site"), progress=False)
+
+
+@benchmark("export_html", iterations=500)
+def _bench_export_html():
+    from tokenomics.reports import export_html, clear_export_cache
+    params = get_scenario_params("Modèle Pendle-like")
+    score_data = calculate_viability_index(params)
+    recommendations = get_recommendations(score_data)
+    
+    def run():
+        clear_export_cache()
+        return export_html(params, score_data, recommendations)
+    return run
+
+
+@benchmark("create_inflation_comparison[4 scénarios]", iterations=100)
+def _bench_comparison():
+    scenarios = ["Inflation stable 2% / an", "Inflation décroissante", "Inflation avec halving",
+                 "Inflation seasonal farming"]
+    return _uncached(lambda: create_inflation_comparison(scenarios, years=10))
+
+
+# ========== DÉMARRAGE À FROID ==========
+
+@benchmark("import tokenomics.scoring[cold]", iterations=50)
+def _bench_import_scoring():
+    # Interpréteur neuf à chaque appel : démarrage de Python + import (workers batch, invocations isolées)
+    profile = import_time("tokenomics.scoring")
+    print(f"   import tokenomics.scoring : {profile['cumulative_ms']:.1f} ms (-X importtime)", file=sys.stderr)
+    if profile['heavy']:
+        raise RuntimeError(f"tokenomics.scoring charge {', '.join(profile['heavy'])}")
+    return lambda: import_time("tokenomics.scoring")
+
+
+# ========== FETCH (serveur local simulant CoinGecko) ==========
+
+class _FakeCoinGeckoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    body = json.dumps(SAMPLE_COINGECKO_DATA).encode('utf-8')
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@benchmark("fetch_coingecko_data[local]", iterations=300)
+def _bench_fetch():
+    server = HTTPServer(("127.0.0.1", 0), _FakeCoinGeckoHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api.COINGECKO_API_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    return lambda: fetch_coingecko_data("ethereum")
+
+
+@benchmark("end_to_end[fetch+parse+score][local]", iterations=300)
+def _bench_end_to_end():
+    _bench_fetch()
+
+    def run():
+        data = fetch_coingecko_data("ethereum")
+        params = enhance_params_with_known_data(parse_coingecko_to_params(data), "ethereum")
+        return calculate_viability_index(params)
+    return run
+
+
+def run_benchmarks(name_filter: str = None, quick: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Exécute les benchmarks enregistrés.
+
+    Args:
+        name_filter: Sous-chaîne pour ne lancer qu'une partie des cas
+        quick: Divise le nombre d'itérations par 10
+
+    Returns:
+        {nom: statistiques}
+    """
+    results = {}
+    original_url = api.COINGECKO_API_URL
+    try:
+        for name, factory, iterations, items_per_call in BENCHMARKS:
+            if name_filter and name_filter not in name:
+                continue
+            if quick:
+                iterations = max(5, iterations // 10)
+            print(f"⏱️  {name}...", file=sys.stderr)
+            results[name] = measure(
+                factory(),
+                iterations=iterations,
+                warmup=min(10, iterations),
+                items_per_call=items_per_call
+            )
+    finally:
+        api.COINGECKO_API_URL = original_url
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de Tokenomics Analyzer")
+    parser.add_argument("--filter", help="Ne lancer que les benchmarks contenant ce texte")
+    parser.add_argument("--quick", action="store_true", help="10× moins d'itérations")
+    parser.add_argument("--compare", metavar="FICHIER", help="Résultats de référence (JSON)")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Seuil de régression sur le p50 en %% (défaut : 10)")
+    parser.add_argument("--output-dir", default=RESULTS_DIR, help="Répertoire des résultats")
+    parser.add_argument("--no-save", action="store_true", help="Ne pas enregistrer les résultats")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.filter, args.quick)
+    print_results(results)
+
+    if not args.no_save:
+        path = save_results(results, args.output_dir)
+        print(f"\n💾 Résultats enregistrés dans {path}")
+
+    if args.compare:
+        regressions = compare_results(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} régression(s) au-delà de {args.threshold:.0f}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,17 @@
 Script de test pour vérifier que tous les modules fonctionnent correctement.
 """
 
+import os
 import sys
+import tempfile
 from tokenomics.scenarios import get_all_scenarios, get_scenario_params, get_inflation_projection
 from tokenomics.scoring import calculate_viability_index
 from tokenomics.visualizations import (
     create_supply_distribution_chart,
     create_dilution_projection,
-    create_gauge_chart
+    create_gauge_chart,
+    create_score_breakdown_chart,
+    create_inflation_comparison
 )
 
 
@@ -121,6 +125,857 @@ def test_all_scenarios():
         return True
 
 
+def test_scenario_registry():
+    """Test du registre de scénarios (recherche par id, scénarios personnalisés)."""
+    print("\n🧪 Test du registre de scénarios...")
+    
+    import json
+    from tokenomics.scenarios import ScenarioRegistry, get_scenario, DEFAULT_SCENARIO_PARAMS
+    
+    scenario = get_scenario("pendle-like")
+    assert scenario is not None and scenario.name == "Modèle Pendle-like"
+    assert get_scenario_params("pendle-like") == get_scenario_params("Modèle Pendle-like")
+    assert get_inflation_projection("Inflation avec halving", years=5) == [20.0, 20.0, 10.0, 10.0, 5.0]
+    assert get_inflation_projection("Inflation décroissante", years=7)[-2:] == [1.0, 1.0]
+    print("  ✅ Recherche par nom et par id")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "custom.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'scenarios': [{
+                'id': 'custom-test',
+                'name': "Scénario test",
+                'projection': {'type': 'schedule', 'rates': [12, 9], 'tail': 3},
+                'params': {'inflation_rate': 12.0}
+            }]}, f)
+        
+        registry = ScenarioRegistry()
+        registry.load_file(path)
+        custom = registry.get("Scénario test")
+        assert custom.params['inflation_rate'] == 12.0
+        assert custom.params['team_allocation'] == DEFAULT_SCENARIO_PARAMS['team_allocation']
+        assert 0 <= calculate_viability_index(custom.params)['final_score'] <= 100
+        
+        try:
+            registry.load_file(path)
+            assert False, "id dupliqué accepté"
+        except ValueError:
+            pass
+    print("  ✅ Scénarios personnalisés chargés depuis JSON")
+
+
+def test_projection_engine():
+    """Test du moteur de projection (horizons, granularités, 2-D)."""
+    print("\n🧪 Test du moteur de projection...")
+    
+    from tokenomics.scenarios import project_supply, project_scenarios
+    
+    # Plus de troncature à 5 ans pour les scénarios structurels
+    assert len(get_inflation_projection("Modèle Pendle-like", years=20)) == 20
+    
+    yearly = project_supply(1_000_000, [10.0, 5.0], 'yearly')
+    monthly = project_supply(1_000_000, [10.0, 5.0], 'monthly')
+    assert abs(yearly['supply'][-1] - 1_155_000) < 1e-6
+    assert len(monthly['supply']) == 25
+    assert abs(monthly['supply'][12] - yearly['supply'][1]) < 1e-6
+    assert abs(monthly['supply'][-1] - yearly['supply'][-1]) < 1e-6
+    print("  ✅ Fins d'année identiques en pas annuel et mensuel")
+    
+    scenarios = get_all_scenarios()
+    projection = project_scenarios(scenarios, years=20, granularity='daily')
+    assert projection['supply'].shape == (len(scenarios), 20 * 365 + 1)
+    assert projection['inflation_rate'].shape == (len(scenarios), 20 * 365)
+    assert projection['supply'][0, 0] == get_scenario_params(scenarios[0])['circulating_supply']
+    print(f"  ✅ {len(scenarios)} scénarios projetés sur 20 ans au pas journalier")
+
+
+def test_vesting():
+    """Test du simulateur de vesting (cliff, linéaire, step, événements)."""
+    print("\n🧪 Test du simulateur de vesting...")
+    
+    from tokenomics.vesting import simulate_vesting, find_unlock_events, locked_breakdown
+    
+    buckets = [
+        {'name': 'team', 'amount': 120, 'cliff_months': 12, 'vesting_months': 24},
+        {'name': 'investors', 'amount': 60, 'vesting_months': 6, 'release': 'step', 'step_months': 3},
+        {'name': 'community', 'amount': 100, 'start_month': -2, 'tge_pct': 50, 'vesting_months': 10},
+    ]
+    simulation = simulate_vesting([buckets, []], months=24, circulating_supply=[1000, 500])
+    
+    team_and_investors = simulation['unlocked'][0] - simulation['unlocked'][0, 0]
+    assert simulation['unlocked'][0, 0] == 60  # community : TGE 50% + 2/10 du reste
+    assert abs(team_and_investors[3] - (30 + 15)) < 1e-9  # 1er step investors + 3 mois community
+    assert abs(simulation['monthly_unlock'][0, 11] - 60) < 1e-9  # fin du cliff team : 12/24 d'un coup
+    assert simulation['unlocked'][0, -1] == 280
+    assert (simulation['circulating'][1] == 500).all()
+    print("  ✅ Cliff, libération linéaire et par paliers")
+    
+    events = find_unlock_events(simulation, threshold_pct=5.0)
+    assert events and events[0]['month'] == 12 and events[0]['token'] == 0
+    assert locked_breakdown(buckets) == {'team': 120.0, 'investors': 60.0, 'community': 40.0}
+    print(f"  ✅ {len(events)} événement(s) d'unlock détecté(s)")
+    
+    # Camembert de supply : une part par bucket, couleurs réutilisées au-delà de la palette
+    from tokenomics.visualizations import LOCKED_BUCKET_COLORS, supply_distribution_spec
+    from tokenomics.vesting import buckets_from_params
+    params = get_scenario_params("Projet early-stage")
+    breakdown = locked_breakdown(buckets_from_params(params))
+    assert abs(sum(breakdown.values()) - (params['total_supply'] - params['circulating_supply'])) < 1e-6
+    many = {f"bucket {i}": 1.0 for i in range(40)}
+    trace = supply_distribution_spec(100.0, 140.0, 0, many)['data'][0]
+    assert len(trace['labels']) == len(trace['marker']['colors']) == 41
+    assert trace['marker']['colors'][1 + len(LOCKED_BUCKET_COLORS)] == LOCKED_BUCKET_COLORS[0]
+    print("  ✅ Part bloquée détaillée par bucket dans le camembert de supply")
+
+
+def test_burn_simulation():
+    """Test de la simulation Monte Carlo du burn."""
+    print("\n🧪 Test de la simulation stochastique...")
+    
+    from tokenomics.simulation import simulate_burn
+    
+    params = get_scenario_params("Inflation négative / burn dynamique")
+    params['volume_24h'] = 1_000_000
+    
+    # Sans volatilité : toutes les trajectoires suivent le calcul déterministe
+    simulation = simulate_burn(params, years=5, paths=100, volume_volatility=0.0, seed=1)
+    monthly = (1 + params['inflation_rate'] / 100) ** (1 / 12) - params['burn_rate'] / 100 / 12
+    expected = (monthly ** 60 - 1) * 100
+    assert all(abs(value - expected) < 1e-9 for value in simulation['net_inflation_pct'])
+    print("  ✅ Cas déterministe conforme")
+    
+    simulation = simulate_burn(params, years=5, paths=10_000, seed=1)
+    supply = simulation['supply']
+    assert supply.shape == (5, 61)
+    assert (supply[0] <= supply[2]).all() and (supply[2] <= supply[-1]).all()
+    assert simulation['volume'][2, 0] == 1_000_000
+    assert 0.0 <= simulation['prob_deflation'] <= 1.0
+    print(f"  ✅ 10 000 trajectoires, inflation nette médiane {simulation['net_inflation_pct'][2]:+.1f}%")
+
+
+def test_parameter_sweep():
+    """Test du scoring vectorisé et du balayage de grille."""
+    print("\n🧪 Test du balayage de paramètres...")
+    
+    import numpy as np
+    from tokenomics.scoring import calculate_viability_index_vectorized
+    from tokenomics.sweep import run_sweep, parse_range
+    
+    scenarios = get_all_scenarios()
+    columns = {key: np.array([get_scenario_params(s)[key] for s in scenarios]) for key in get_scenario_params(scenarios[0])}
+    vectorized = calculate_viability_index_vectorized(columns)
+    for i, scenario in enumerate(scenarios):
+        expected = calculate_viability_index(get_scenario_params(scenario))
+        assert vectorized['final_score'][i] == expected['final_score'], scenario
+        assert vectorized['incentives_score'][i] == expected['incentives_score'], scenario
+    print(f"  ✅ Scoring vectorisé identique au scoring scalaire ({len(scenarios)} scénarios)")
+    
+    ranges = dict(parse_range(spec) for spec in (
+        "inflation_rate=0:20:2.5", "team_allocation=5,15,25", "vesting_years=1:4:1", "incentive_lock=true,false"
+    ))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, "sweep.csv")
+        stats = run_sweep(ranges, output_path, base="pendle-like", min_score=55,
+                          chunk_size=50, processes=2, progress=False)
+        assert stats['points'] == 9 * 3 * 4 * 2
+        
+        import pandas as pd
+        df = pd.read_csv(output_path)
+        assert len(df) == stats['written'] and (df['final_score'] >= 55).all()
+        
+        best = get_scenario_params("pendle-like")
+        best.update(stats['best'])
+        assert calculate_viability_index(best)['final_score'] == stats['best_score']
+    print(f"  ✅ Grille de {stats['points']} points, {stats['written']} au-dessus de 55")
+
+
+def test_target_solver():
+    """Test du solveur inverse (score cible)."""
+    print("\n🧪 Test du solveur de score cible...")
+    
+    from tokenomics.solver import solve_target
+    
+    params = get_scenario_params("Meme coin")
+    current = calculate_viability_index(params)['final_score']
+    result = solve_target(params, target=current + 10)
+    assert result['reachable'] and result['cost'] > 0
+    assert result['score'] >= current + 10
+    assert calculate_viability_index(result['params'])['final_score'] == result['score']
+    for name, change in result['changes'].items():
+        assert params[name] == change['from'] and result['params'][name] == change['to']
+    print(f"  ✅ Meme coin : {current} → {result['score']} (coût {result['cost']}, {len(result['changes'])} changement(s))")
+    
+    already = solve_target(params, target=current)
+    assert already['reachable'] and already['cost'] == 0 and not already['changes']
+    
+    result = solve_target(params, target=80, metric='distribution_score', adjustable=['team_allocation', 'vesting_years'])
+    assert set(result['changes']) <= {'team_allocation', 'vesting_years'}
+    assert result['reachable'] == (result['score'] >= 80)
+    
+    impossible = solve_target(params, target=100, adjustable=['utility_gas'])
+    assert not impossible['reachable'] and impossible['score'] < 100
+    print("  ✅ Cible déjà atteinte, composante seule et cible inaccessible")
+    
+    # Drapeaux en entiers : traités comme des booléens ; paramètre nul : erreur explicite
+    as_ints = solve_target(dict(params, utility_gas=1), target=80)
+    assert as_ints == solve_target(dict(params, utility_gas=True), target=80)
+    try:
+        solve_target(dict(params, burn_rate=None), target=80)
+        assert False, "ValueError attendue"
+    except ValueError as e:
+        assert 'burn_rate' in str(e)
+    print("  ✅ Paramètres normalisés (drapeaux 0/1, valeurs nulles refusées)")
+
+
+def test_scenario_cache():
+    """Test du cache précalculé des scénarios."""
+    print("\n🧪 Test du cache de scénarios...")
+    
+    from tokenomics.precompute import build_scenario_cache, write_scenario_cache, load_scenario_cache
+    from tokenomics.scoring import get_recommendations
+    
+    cache = build_scenario_cache()
+    assert len(cache) == len(get_all_scenarios())
+    for scenario in get_all_scenarios():
+        params = get_scenario_params(scenario)
+        cached = cache.lookup(scenario, params)
+        assert cached['score_data'] == calculate_viability_index(params), scenario
+        assert cached['recommendations'] == get_recommendations(cached['score_data']), scenario
+    print(f"  ✅ {len(cache)} scénarios identiques au calcul direct")
+    
+    params = get_scenario_params("eth-like")
+    params['inflation_rate'] += 1
+    assert cache.lookup("eth-like", params) is None
+    assert cache.lookup("inconnu", params) is None
+    # Le nom entre dans le score de sécurité (base d'audits) : un autre nom n'est pas servi par le cache
+    assert cache.lookup("eth-like", dict(get_scenario_params("eth-like"), name="Uniswap")) is None
+    
+    cached = cache.get("eth-like")
+    cached['score_data']['final_score'] = -1
+    assert cache.get("eth-like")['score_data']['final_score'] != -1
+    try:
+        cached['projection']['supply'][0] = 0
+        assert False, "La projection en cache devrait être en lecture seule"
+    except ValueError:
+        pass
+    print("  ✅ Paramètres modifiés recalculés, entrées immuables")
+    
+    # Projection fournie (ex : celle du cache) : libellés alignés sur ses points, quel que soit `years`
+    from tokenomics.scenarios import project_supply
+    from tokenomics.visualizations import dilution_projection_spec
+    for trace in dilution_projection_spec(1e6, projection=project_supply(1e6, [5.0] * 10))['data']:
+        assert len(trace['x']) == len(trace['y']) == 11 and trace['x'][-1] == "Année 10"
+    print("  ✅ Projection fournie : axe des années cohérent")
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "scenario_cache.json")
+        write_scenario_cache(cache, path)
+        loaded = load_scenario_cache(path)
+        assert loaded.fingerprint == cache.fingerprint
+        assert loaded.get("eth-like")['score_data'] == cache.get("eth-like")['score_data']
+        assert load_scenario_cache(path, years=10) is None
+    print(f"  ✅ Artefact rechargé, empreinte {cache.fingerprint[:12]} vérifiée")
+
+
+def test_trend_store():
+    """Test du backfill et du stockage des tendances."""
+    print("\n🧪 Test de l'historique des scores...")
+    
+    import json
+    from tokenomics.trends import TrendStore, backfill
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshots_path = os.path.join(tmp_dir, "snapshots.jsonl")
+        expected = {}
+        with open(snapshots_path, 'w', encoding='utf-8') as f:
+            for day in range(10):
+                date = f"2024-01-{day + 1:02d}"
+                for scenario in ("eth-like", "meme-coin"):
+                    params = get_scenario_params(scenario)
+                    params['inflation_rate'] = float(day * 2)
+                    f.write(json.dumps({'date': date, 'id': scenario, 'params': params}) + "\n")
+                    expected[(scenario, date)] = calculate_viability_index(params)['final_score']
+        
+        store = TrendStore(os.path.join(tmp_dir, "trends"))
+        stats = backfill([snapshots_path], store, segment_rows=7, progress=False)
+        assert stats == {'written': 20, 'failed': 0}
+        
+        trend = store.query("eth-like", "2024-01-03", "2024-01-06")
+        assert [str(d) for d in trend['date']] == ["2024-01-03", "2024-01-04", "2024-01-05", "2024-01-06"]
+        for date, score in zip(trend['date'], trend['final_score']):
+            assert abs(score - expected[("eth-like", str(date))]) < 1e-4
+        print(f"  ✅ {stats['written']} lignes, requête par plage identique au scoring direct")
+        
+        # Ajout d'une correction : la ligne la plus récente l'emporte
+        store.append(["eth-like"], [int(trend['date'][0].astype(int))], {
+            field: [42.0] for field in trend if field != 'date'
+        })
+        assert store.query("eth-like", "2024-01-03", "2024-01-03")['final_score'][0] == 42.0
+        assert store.compact() == 20
+        reopened = TrendStore(os.path.join(tmp_dir, "trends"))
+        assert len(reopened.query("eth-like")['date']) == 10 and "inconnu" not in reopened
+        assert reopened.query("eth-like", "2024-01-03", "2024-01-03")['final_score'][0] == 42.0
+        print("  ✅ Correction prioritaire et compaction")
+
+        # Valeurs invalides : snapshot compté en échec, le reste du lot est scoré
+        invalid_path = os.path.join(tmp_dir, "invalid.jsonl")
+        with open(invalid_path, 'w', encoding='utf-8') as f:
+            for token_id, inflation_rate in (("null", None), ("texte", "5"), ("abc", "abc"), ("ok", 5.0)):
+                params = dict(get_scenario_params("eth-like"), inflation_rate=inflation_rate)
+                f.write(json.dumps({'date': "2024-02-01", 'id': token_id, 'params': params}) + "\n")
+        stats = backfill([invalid_path], store, progress=False)
+        assert stats == {'written': 2, 'failed': 2}
+        assert store.query("texte")['final_score'][0] == store.query("ok")['final_score'][0]
+        assert "null" not in store and "abc" not in store
+    print("  ✅ Snapshots invalides écartés sans interrompre le backfill")
+
+
+def test_figure_cache():
+    """Test du cache de figures Plotly."""
+    print("\n🧪 Test du cache de figures...")
+    
+    import json
+    from tokenomics.visualizations import clear_figure_cache, figure_cache_info
+    
+    clear_figure_cache()
+    score_data = calculate_viability_index(get_scenario_params("Modèle Pendle-like"))
+    first = create_score_breakdown_chart(score_data)
+    second = create_score_breakdown_chart(score_data)
+    assert figure_cache_info()['hits'] == 1 and figure_cache_info()['misses'] == 1
+    assert second is not first
+    assert json.loads(second.to_json()) == json.loads(first.to_json())
+    
+    # Modifier une figure servie ne modifie pas le cache
+    second.update_layout(title_text="modifié")
+    third = create_score_breakdown_chart(score_data)
+    assert third.layout.title.text != "modifié"
+    
+    # Entrées différentes : nouvelle figure
+    create_gauge_chart(score_data['final_score'])
+    create_gauge_chart(score_data['final_score'] + 1)
+    create_dilution_projection(1_000_000, scenario_name="Inflation avec halving", years=5)
+    info = figure_cache_info()
+    assert info['misses'] == 4 and info['size'] == 4
+    
+    # Comparaison : la clé inclut les projections des scénarios
+    scenarios = get_all_scenarios()[10:13]
+    create_inflation_comparison(scenarios, 10)
+    create_inflation_comparison(list(scenarios), 10)
+    create_inflation_comparison(scenarios[:2], 10)
+    info = figure_cache_info()
+    assert info['hits'] == 3 and info['misses'] == 6
+    print(f"  ✅ {info['hits']} hit(s), {info['misses']} miss(es), figures servies indépendantes")
+
+
+def test_figure_specs():
+    """Test des spécifications Plotly sans validation."""
+    print("\n🧪 Test des spécifications de graphiques...")
+    
+    import json
+    import numpy as np
+    from tokenomics import visualizations
+    from tokenomics.simulation import simulate_burn
+    from tokenomics.trends import from_days
+    
+    visualizations.clear_figure_cache()
+    params = get_scenario_params("Modèle Pendle-like")
+    score_data = calculate_viability_index(params)
+    simulation = simulate_burn(dict(params, volume_24h=1_000_000), years=2, paths=200, seed=1)
+    trend = {'date': from_days(np.arange(19_000, 19_030)), 'final_score': np.linspace(40, 70, 30)}
+    
+    charts = [
+        ('gauge_chart_spec', 'create_gauge_chart', (score_data['final_score'],)),
+        ('score_breakdown_spec', 'create_score_breakdown_chart', (score_data,)),
+        ('supply_distribution_spec', 'create_supply_distribution_chart', (150_000_000, 200_000_000, 258_000_000)),
+        ('dilution_projection_spec', 'create_dilution_projection', (150_000_000, "Modèle Pendle-like")),
+        ('dilution_projection_spec', 'create_dilution_projection', (150_000_000, None, 8.0, 3, 'monthly')),
+        ('inflation_comparison_spec', 'create_inflation_comparison', (get_all_scenarios()[10:14], 10)),
+        ('inflation_comparison_spec', 'create_inflation_comparison', (get_all_scenarios()[10:14], 20, 'daily')),
+        ('dilution_projection_spec', 'create_dilution_projection', (150_000_000, None, 8.0, 20, 'daily')),
+        ('supply_fan_spec', 'create_supply_fan_chart', (simulation,)),
+        ('score_trend_spec', 'create_score_trend_chart', (trend,)),
+    ]
+    for spec_name, create_name, args in charts:
+        spec = getattr(visualizations, spec_name)(*args)
+        fig = getattr(visualizations, create_name)(*args)
+        assert json.loads(visualizations.spec_to_json(spec)) == json.loads(fig.to_json()), spec_name
+    print(f"  ✅ {len(charts)} spécifications identiques aux figures validées")
+
+
+def test_downsampling():
+    """Test de la réduction LTTB et du rendu WebGL des longues séries."""
+    print("\n🧪 Test de la réduction des séries...")
+    
+    import numpy as np
+    from tokenomics.downsampling import lttb, lttb_indices
+    from tokenomics.visualizations import MAX_TRACE_POINTS, dilution_projection_spec
+    
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 500)
+    y[4_321] = 5.0
+    indices = lttb_indices(x, y, 500)
+    assert len(indices) == 500 and indices[0] == 0 and indices[-1] == len(x) - 1
+    assert np.all(np.diff(indices) > 0)
+    assert 4_321 in indices, "Le pic doit être conservé"
+    assert np.argmin(y) in indices or y[indices].min() < -0.99
+    assert len(lttb(x[:100], y[:100], 500)[0]) == 100
+    print("  ✅ LTTB conserve extrémités et pics")
+    
+    spec = dilution_projection_spec(150_000_000, None, 8.0, 20, 'daily')
+    for trace in spec['data']:
+        assert trace['type'] == 'scattergl' and len(trace['x']) == MAX_TRACE_POINTS
+    assert spec['data'][0]['x'][-1] == 20.0
+    short = dilution_projection_spec(150_000_000, None, 8.0, 3, 'monthly')
+    assert all(trace['type'] == 'scatter' for trace in short['data'])
+    print(f"  ✅ Projection 20 ans journalière : {MAX_TRACE_POINTS} points WebGL par trace")
+
+
+def test_reports():
+    """Test des rapports statiques de portefeuille."""
+    print("\n🧪 Test des rapports de portefeuille...")
+    
+    import json
+    import zipfile
+    from tokenomics.reports import render_reports, scenario_entries, load_portfolio
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        portfolio_path = os.path.join(tmp_dir, "portfolio.jsonl")
+        with open(portfolio_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'id': 'maison', 'params': get_scenario_params("meme-coin")}) + "\n")
+            f.write(json.dumps({'id': 'incomplet', 'params': {'inflation_rate': 5}}) + "\n")
+            f.write(json.dumps(dict(get_scenario_params("eth-like"), name="Ether <b>", symbol="ETH")) + "\n")
+        entries = scenario_entries(["eth-like", "meme-coin"]) + load_portfolio(portfolio_path)
+        assert [entry['id'] for entry in entries] == ["eth-like", "meme-coin", "maison", "ETH"]
+        
+        output_path = os.path.join(tmp_dir, "rapports.zip")
+        stats = render_reports(entries, output_path, processes=1, progress=False)
+        assert stats['reports'] == 4 and stats['failed'] == 0
+        with zipfile.ZipFile(output_path) as archive:
+            names = set(archive.namelist())
+            assert {'index.html', 'assets/plotly.min.js', 'tokens/eth-like.html', 'tokens/eth.html'} <= names
+            page = archive.read('tokens/eth.html').decode('utf-8')
+            index = archive.read('index.html').decode('utf-8')
+        assert 'Ether &lt;b&gt;' in page and page.count('<script src=') == 2
+        assert 'plotly.min.js' in page and len(page) < 50_000, "Le bundle Plotly doit être partagé"
+        score = calculate_viability_index(get_scenario_params("meme-coin"))['final_score']
+        assert f"{score:.1f}" in index and 'href="tokens/maison.html"' in index
+    print(f"  ✅ {stats['reports']} rapports, bundle Plotly partagé ({stats['bytes'] / 1e6:.1f} Mo au total)")
+
+
+def test_export_html():
+    """Test de l'export HTML unitaire (gabarit précompilé et cache)."""
+    print("\n🧪 Test de l'export HTML...")
+    
+    from tokenomics.reports import export_html, clear_export_cache
+    
+    clear_export_cache()
+    params = dict(get_scenario_params("eth-like"), name="Ether <script>", symbol="ETH")
+    document = export_html(params)
+    assert "Ether &lt;script&gt;" in document and "<script>" not in document
+    assert f"{calculate_viability_index(params)['final_score']}/100" in document
+    assert document.count("<tr>") == 9, "En-tête + 8 composantes"
+    
+    # Mêmes paramètres : document servi par le cache, mais daté du nouvel export
+    import datetime
+    from unittest import mock
+    from tokenomics import reports
+    later = mock.Mock(wraps=datetime)
+    later.datetime.now.return_value = datetime.datetime(2031, 5, 4, 12, 30)
+    with mock.patch.object(reports, 'datetime', later):
+        redated = export_html(dict(params))
+    date = document.split("Date :</strong> ")[1][:16]
+    assert len(reports._export_cache) == 1 and redated == document.replace(date, "2031-05-04 12:30")
+    assert export_html(dict(params, inflation_rate=params['inflation_rate'] + 1)) != document
+    print("  ✅ Document échappé, complet et servi depuis le cache (date à jour)")
+
+
+def test_history_store():
+    """Test de l'historique SQLite des analyses."""
+    print("\n🧪 Test de l'historique des analyses...")
+    
+    import sqlite3
+    from tokenomics.history import HistoryStore
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "history.db")
+        store = HistoryStore(path, limit=3)
+        params = get_scenario_params("eth-like")
+        digest = store.add("alice", params, 70.0)
+        assert store.add("alice", dict(params), 70.0) is None, "Doublon de la dernière analyse"
+        assert store.add("bob", params, 70.0) == digest
+        for rate in (1.0, 2.0, 3.0):
+            store.add("alice", dict(params, inflation_rate=rate), 60.0 + rate)
+        
+        recent = store.recent("alice")
+        assert [entry['score'] for entry in recent] == [63.0, 62.0, 61.0] and 'params' not in recent[0]
+        assert len(store.recent("bob")) == 1
+        with sqlite3.connect(path) as conn:
+            # Paramètres partagés par empreinte, orphelins supprimés
+            assert conn.execute("SELECT COUNT(*) FROM params").fetchone()[0] == 4
+        
+        reopened = HistoryStore(path, limit=3)
+        assert reopened.load_params(recent[0]['params_hash'])['inflation_rate'] == 3.0
+        assert reopened.load_params(digest) == params and reopened.load_params("inconnu") is None
+        print("  ✅ Enregistrements compacts, dédoublonnés et persistants")
+        
+        # Expiration : la session abandonnée de bob disparaît avec ses paramètres non partagés
+        store.add("bob", dict(params, inflation_rate=9.0), 50.0)
+        with sqlite3.connect(path) as conn:
+            conn.execute("UPDATE history SET created_at = created_at - 86400 * 60 WHERE session = 'bob'")
+        assert store.purge(max_age=86400 * 30) == 2
+        assert store.recent("bob") == [] and len(store.recent("alice")) == 3
+        assert store.load_params(digest) is None
+        with sqlite3.connect(path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM params").fetchone()[0] == 3
+    print("  ✅ Analyses expirées purgées avec leurs paramètres orphelins")
+
+
+def test_token_params():
+    """Test de la représentation typée des paramètres (TokenParams)."""
+    print("\n🧪 Test de TokenParams...")
+    
+    import pickle
+    from tokenomics.params import TokenParams, to_records, from_records, as_columns
+    from tokenomics.scoring import calculate_viability_index_vectorized
+    
+    tokens = []
+    for scenario in get_all_scenarios():
+        params = get_scenario_params(scenario)
+        token = TokenParams.from_dict(dict(params, projection="ignoré"))
+        assert calculate_viability_index(token) == calculate_viability_index(params), scenario
+        assert {key: value for key, value in token.to_dict().items() if key in params} == params
+        assert pickle.loads(pickle.dumps(token)) == token and not hasattr(token, '__dict__')
+        tokens.append(token)
+    
+    token = tokens[0]
+    assert token['market_cap_rank'] == token.get('market_cap_rank') == 999
+    assert token.replace(team_allocation=12.5).team_allocation == 12.5 and token.team_allocation != 12.5
+    for bad in ({'team_allocation': 140}, {'circulating_supply': -1}, {'inflation_rate': 'élevée'},
+                {'burn_rate': float('nan')}, {'vesting_years': None}, {'couleur': 'bleu'}):
+        try:
+            TokenParams(**dict(token.to_dict(), **bad))
+            assert False, f"Paramètres invalides acceptés : {bad}"
+        except ValueError:
+            pass
+    try:
+        token.inflation_rate = 1.0
+        assert False, "TokenParams modifiable"
+    except AttributeError:
+        pass
+    
+    records = to_records(tokens)
+    assert len(records) == len(tokens) and 'description' not in records.dtype.names
+    assert from_records(records)[1].replace(description=tokens[1].description) == tokens[1]
+    columns = as_columns(records)
+    assert columns['inflation_rate'].base is records, "Vue sans copie"
+    vectorized = calculate_viability_index_vectorized(columns)['final_score']
+    assert list(vectorized) == [calculate_viability_index(t)['final_score'] for t in tokens]
+    print(f"  ✅ {len(tokens)} scénarios : scores identiques (dict, TokenParams, tableau structuré)")
+
+
+def test_token_universe():
+    """Test de l'univers de tokens en colonnes (filtres, tri, mmap)."""
+    print("\n🧪 Test de TokenUniverse...")
+    
+    import numpy as np
+    from tokenomics.universe import TokenUniverse, UNCATEGORIZED
+    
+    scenarios = get_all_scenarios()
+    tokens = {
+        coin_id: dict(get_scenario_params(scenarios[i % len(scenarios)]),
+                      name=coin_id.capitalize(), market_cap_rank=i + 1, is_enriched=i % 2 == 0)
+        for i, coin_id in enumerate(["ethereum", "bitcoin", "uniswap", "aave", "dogecoin", "mon-token"])
+    }
+    universe = TokenUniverse.from_params(tokens, source='coingecko').score()
+    for coin_id, params in tokens.items():
+        expected = calculate_viability_index(params)['final_score']
+        assert abs(universe['final_score'][universe.find(coin_id)] - expected) < 1e-4, coin_id
+    
+    assert universe['inflation_rate'].base is universe.params, "Vue sans copie"
+    groups = universe.groupby_category()
+    assert sorted(groups["💰 DeFi Protocols"].ids) == ["aave", "uniswap"] and list(groups[UNCATEGORIZED].ids) == ["mon-token"]
+    stats = universe.category_stats()
+    assert stats["🔷 Layer 1 Blockchains"]['count'] == 2
+    
+    best = universe.filter(universe['final_score'] >= 0, enriched=True).sort('final_score', descending=True)
+    assert len(best) == 3 and np.all(np.diff(best['final_score']) <= 0)
+    assert list(universe.filter(category="🐕 Memecoins").ids) == ["dogecoin"]
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "universe")
+        universe.save(path)
+        universe.save(path)  # remplacement d'un univers existant
+        loaded = TokenUniverse.load(path)
+        assert isinstance(loaded['final_score'], np.memmap)
+        assert list(loaded.ids) == list(universe.ids) and np.array_equal(loaded.scores, universe.scores)
+        assert loaded.token(0).name == "Ethereum" and loaded.category_names()[5] == UNCATEGORIZED
+        del loaded
+    print(f"  ✅ {len(universe)} tokens : scores, regroupements et mmap cohérents")
+
+
+def test_score_matrix():
+    """Test de la matrice des scores sur disque (mmap, remplacement atomique)."""
+    print("\n🧪 Test de la matrice des scores...")
+    
+    import numpy as np
+    from tokenomics.cli import main as cli_main
+    from tokenomics.score_matrix import ScoreMatrix, get_score_matrix, write_score_matrix
+    from tokenomics.server import ScoringService, ServiceError
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "scores.tkm")
+        assert cli_main(["refresh", "--scenarios", "all", "-o", path, "-q"]) == 0
+        
+        matrix = ScoreMatrix(path)
+        assert len(matrix) == len(get_all_scenarios()) and matrix.is_current()
+        assert isinstance(matrix.column('final_score'), np.memmap)
+        expected = calculate_viability_index(get_scenario_params("eth-like"))
+        assert matrix.get("eth-like") == {field: expected[field] for field in matrix.fields}
+        assert list(matrix.lookup(["eth-like", "inconnu"]) >= 0) == [True, False] and matrix.get("inconnu") is None
+        
+        previous = os.environ.get("TOKENOMICS_SCORE_MATRIX")
+        os.environ["TOKENOMICS_SCORE_MATRIX"] = path
+        try:
+            service = ScoringService()
+            assert service.precomputed("eth-like")['scores']['final_score'] == expected['final_score']
+            
+            # Le job remplace le fichier : les lecteurs voient la nouvelle matrice, l'ancienne reste lisible
+            write_score_matrix(path, ["mon-token"], {field: [42.0] for field in matrix.fields})
+            assert get_score_matrix().get("mon-token")['final_score'] == 42.0
+            assert matrix.get("eth-like") is not None
+            try:
+                service.precomputed("eth-like")
+                assert False, "ServiceError attendue"
+            except ServiceError as e:
+                assert e.status == 404
+            
+            # Fichier absent : signalé une seule fois, relu dès qu'il apparaît
+            import contextlib
+            import io
+            missing = os.path.join(tmp_dir, "absente.tkm")
+            os.environ["TOKENOMICS_SCORE_MATRIX"] = missing
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                assert get_score_matrix() is None and get_score_matrix() is None
+            assert stderr.getvalue().count("Matrice de scores ignorée") == 1
+            write_score_matrix(missing, ["mon-token"], {field: [7.0] for field in matrix.fields})
+            assert get_score_matrix().get("mon-token")['final_score'] == 7.0
+        finally:
+            if previous is None:
+                os.environ.pop("TOKENOMICS_SCORE_MATRIX")
+            else:
+                os.environ["TOKENOMICS_SCORE_MATRIX"] = previous
+        
+        try:
+            write_score_matrix(path, ["a", "a"], {field: [1.0, 2.0] for field in matrix.fields})
+            assert False, "Ids en double acceptés"
+        except ValueError:
+            pass
+        del matrix
+    print("  ✅ Ouverture mmap, recherche par id et rechargement après rafraîchissement")
+
+
+def test_lazy_imports():
+    """Test des imports paresseux (démarrage à froid de la bibliothèque)."""
+    print("\n🧪 Test des imports paresseux...")
+    
+    import subprocess
+    
+    code = (
+        "import sys, tokenomics.scoring, tokenomics.api, tokenomics.cli, tokenomics.batch; "
+        "print(','.join(m for m in ('plotly', 'pandas', 'requests') if m in sys.modules))"
+    )
+    root = os.path.dirname(os.path.abspath(__file__))
+    loaded = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True,
+        env=dict(os.environ, PYTHONPATH=root)
+    ).stdout.strip()
+    assert loaded == "", f"Dépendances chargées à l'import : {loaded}"
+    
+    loaded = subprocess.run(
+        [sys.executable, "-c", "import sys, tokenomics.scoring; print('numpy' in sys.modules)"],
+        capture_output=True, text=True, check=True, env=dict(os.environ, PYTHONPATH=root)
+    ).stdout.strip()
+    assert loaded == "False", "NumPy chargé par le chemin scalaire"
+    print("  ✅ plotly, pandas et requests chargés uniquement à l'usage")
+
+
+def test_batch_scenarios():
+    """Test du scoring batch (scénarios, sans réseau) et de la reprise."""
+    print("\n🧪 Test du module batch...")
+    
+    import json
+    from tokenomics.batch import run_batch, Checkpoint
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = os.path.join(tmp_dir, "scores.jsonl")
+        scenarios = get_all_scenarios()
+        
+        # Simuler un job interrompu : un scénario déjà dans le checkpoint
+        checkpoint = Checkpoint(f"{output_path}.checkpoint.jsonl")
+        checkpoint.append({'id': scenarios[0], 'final_score': 42.0})
+        checkpoint.close()
+        
+        stats = run_batch(scenarios=scenarios, output_path=output_path, cache_dir=None, progress=False)
+        assert stats['skipped'] == 1
+        assert stats['scored'] == len(scenarios) - 1
+        assert stats['written'] == len(scenarios)
+        assert not os.path.exists(f"{output_path}.checkpoint.jsonl")
+        print(f"  ✅ {stats['written']} scénarios exportés (1 repris du checkpoint)")
+        
+        # Crash en cours d'écriture : dernière ligne tronquée, recalculée à la reprise
+        with open(f"{output_path}.checkpoint.jsonl", 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'id': scenarios[1], 'final_score': 42.0}) + "\n")
+            f.write(f'{{"id": "{scenarios[0]}", "final_score": 4')
+        stats = run_batch(scenarios=scenarios[:3], output_path=output_path, cache_dir=None, progress=False)
+        assert stats == {'written': 3, 'scored': 2, 'skipped': 1, 'failed': 0}, stats
+        with open(output_path, encoding='utf-8') as f:
+            assert sorted(json.loads(line)['id'] for line in f) == sorted(scenarios[:3])
+        print("  ✅ Reprise après une ligne tronquée : aucun résultat perdu")
+        
+        # Journal d'un autre job : seuls les éléments demandés sont écrits
+        with open(f"{output_path}.checkpoint.jsonl", 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'id': "autre-job", 'final_score': 1.0}) + "\n")
+        stats = run_batch(scenarios=scenarios[:2], output_path=output_path, cache_dir=None, progress=False)
+        assert stats['written'] == 2
+        with open(output_path, encoding='utf-8') as f:
+            assert "autre-job" not in f.read()
+        print("  ✅ Journal d'un autre job ignoré dans la sortie")
+        
+        csv_path = os.path.join(tmp_dir, "scores.csv")
+        stats = run_batch(scenarios=scenarios, output_path=csv_path, cache_dir=None, progress=False)
+        with open(csv_path, encoding='utf-8') as f:
+            assert len(f.readlines()) == len(scenarios) + 1
+        print("  ✅ Export CSV correct")
+
+
+def test_scoring_service():
+    """Test de la logique du service HTTP (sans réseau)."""
+    print("\n🧪 Test du service de scoring...")
+    
+    from tokenomics.server import ScoringService, ServiceError
+    
+    service = ScoringService()
+    params = get_scenario_params("Modèle Pendle-like")
+    
+    result = service.score(params)
+    assert result['score_data']['final_score'] == calculate_viability_index(params)['final_score']
+    assert isinstance(result['recommendations'], list)
+    print(f"  ✅ /score : {result['score_data']['final_score']:.1f}/100")
+    
+    results = service.score_batch({'items': [params, {'inflation_rate': 5.0}]})
+    assert 'score_data' in results[0] and 'error' in results[1]
+    print("  ✅ /score/batch : erreurs isolées par élément")
+    
+    try:
+        service.score("pas un dict")
+        assert False, "ServiceError attendue"
+    except ServiceError as e:
+        assert e.status == 400
+    
+    assert len(service.scenarios()) == len(get_all_scenarios())
+    print("  ✅ /scenarios et validation des paramètres")
+
+    # Transport HTTP : Content-Length négatif refusé, délestage en 503 quand le serveur est saturé
+    import http.client
+    import threading
+    from tokenomics.server import PooledHTTPServer
+
+    server = PooledHTTPServer(("127.0.0.1", 0), service, workers=1, queue_size=2, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        def request(method, path, headers=None):
+            connection = http.client.HTTPConnection("127.0.0.1", server.server_address[1], timeout=5)
+            connection.request(method, path, headers=headers or {})
+            response = connection.getresponse()
+            response.read()
+            connection.close()
+            return response.status
+
+        assert request("POST", "/score", {"Content-Length": "-1"}) == 400
+        
+        # Corps non lu (413, route inconnue) : connexion fermée, le corps n'est pas traité comme une requête
+        import socket
+        smuggled = b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+        for head in (b"POST /score HTTP/1.1\r\nHost: x\r\nContent-Length: 2000000\r\n\r\n",
+                     b"POST /inconnue HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n" % len(smuggled)):
+            with socket.create_connection(("127.0.0.1", server.server_address[1]), timeout=5) as sock:
+                sock.sendall(head + smuggled)
+                received = b""
+                while True:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        break
+                    received += chunk
+            assert received.count(b"HTTP/1.1 ") == 1 and b'"status": "ok"' not in received, received
+        assert request("GET", "/health") == 200
+        # Toutes les places occupées (y compris celles libérées par les connexions qui se ferment)
+        held = 0
+        while server._slots.acquire(timeout=0.5):
+            held += 1
+        try:
+            assert held == 3 and request("GET", "/health") == 503 and server.rejected == 1
+        finally:
+            for _ in range(held):
+                server._slots.release()
+        assert request("GET", "/health") == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+    print("  ✅ HTTP : Content-Length invalide (400), délestage au-delà de la file (503)")
+
+
+def test_instrumentation():
+    """Test des spans de timing et de l'export Prometheus."""
+    print("\n🧪 Test de l'instrumentation...")
+    
+    from tokenomics.instrumentation import collect, span, summarize, render_prometheus, is_enabled
+    
+    assert not is_enabled() or os.environ.get("TOKENOMICS_TIMING")
+    
+    with collect() as records:
+        with span("test.outer"):
+            calculate_viability_index(get_scenario_params("Projet early-stage"))
+    
+    stages = [r['stage'] for r in records]
+    assert stages == ["score.viability_index", "test.outer"], stages
+    assert records[0]['depth'] == 1 and records[1]['depth'] == 0
+    assert summarize(records)[0]['stage'] == "test.outer"
+    print(f"  ✅ Spans collectées : {', '.join(stages)}")
+    
+    metrics = render_prometheus()
+    assert 'tokenomics_stage_duration_seconds_count{stage="test.outer"}' in metrics
+    print("  ✅ Export Prometheus")
+
+
+def test_profiling():
+    """Test du mode profiling (rapports et rétention)."""
+    print("\n🧪 Test du profiling...")
+    
+    from tokenomics.profiling import profile_session
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with profile_session("désactivé", enabled=False, directory=tmp_dir) as report:
+            pass
+        assert report is None and os.listdir(tmp_dir) == []
+        
+        # Fichiers étrangers aux captures : jamais supprimés par la rétention
+        for name in ("requirements.txt", "0-notes.prof"):
+            open(os.path.join(tmp_dir, name), 'w').close()
+        
+        for i in range(3):
+            with profile_session(f"analyse {i}", enabled=True, directory=tmp_dir, keep=2) as report:
+                calculate_viability_index(get_scenario_params("Projet early-stage"))
+        
+        assert len(os.listdir(tmp_dir)) == 6, os.listdir(tmp_dir)
+        assert {"requirements.txt", "0-notes.prof"} <= set(os.listdir(tmp_dir))
+        with open(report.text_path, encoding='utf-8') as f:
+            content = f.read()
+        assert "calculate_viability_index" in content and "sites d'allocation" in content
+        print("  ✅ Rapports cProfile/tracemalloc écrits, rétention appliquée")
+
+
 def main():
     """Exécute tous les tests."""
     print("=" * 60)
@@ -132,6 +987,28 @@ def main():
         test_scoring()
         test_visualizations()
         test_all_scenarios()
+        test_scenario_registry()
+        test_projection_engine()
+        test_vesting()
+        test_burn_simulation()
+        test_parameter_sweep()
+        test_target_solver()
+        test_scenario_cache()
+        test_trend_store()
+        test_figure_cache()
+        test_figure_specs()
+        test_downsampling()
+        test_reports()
+        test_export_html()
+        test_history_store()
+        test_token_params()
+        test_token_universe()
+        test_score_matrix()
+        test_lazy_imports()
+        test_batch_scenarios()
+        test_scoring_service()
+        test_instrumentation()
+        test_profiling()
         
         print("\n" + "=" * 60)
         print("✅ TOUS LES TESTS SONT PASSÉS")
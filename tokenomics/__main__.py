@@ -0,0 +1,11 @@
+"""
+Point d'entrée `python -m tokenomics`.
+"""
+
+import sys
+
+from tokenomics.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,17 @@
 Module d'intégration avec l'API CoinGecko pour récupérer les données de tokenomics.
 """
 
-import requests
-from typing import Dict, Any, Optional
+import os
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+from tokenomics.instrumentation import timed
+
+if TYPE_CHECKING:
+    import requests
+
+
+# URL de base de l'API (surchargeable pour un proxy, un mirror ou un serveur de test local)
+COINGECKO_API_URL = os.environ.get("COINGECKO_API_URL", "https://api.coingecko.com/api/v3")
 
 
 # Mapping des symboles populaires vers les IDs CoinGecko
@@ -78,21 +87,26 @@ def normalize_coin_input(user_input: str) -> str:
     return normalized
 
 
-def fetch_coingecko_data(coin_id: str) -> Optional[Dict[str, Any]]:
+@timed("coingecko.fetch")
+def fetch_coingecko_data(coin_id: str, session: Optional['requests.Session'] = None) -> Optional[Dict[str, Any]]:
     """
     Récupère les données d'un token depuis l'API CoinGecko.
     
     Args:
         coin_id: Identifiant CoinGecko du token (ex: "ethereum", "bitcoin") ou symbole (ex: "ETH", "BTC")
+        session: Session HTTP partagée (connexions keep-alive) ; défaut : requête isolée
         
     Returns:
         Dictionnaire avec les données ou None si erreur
     """
+    # Chargé à l'appel : importer l'API (CLI, serveur, workers) ne coûte pas requests
+    import requests
+    
     # Normaliser l'input (gérer les symboles)
     coin_id = normalize_coin_input(coin_id)
     
     try:
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
+        url = f"{COINGECKO_API_URL}/coins/{coin_id}"
         params = {
             "localization": "false",
             "tickers": "false",
@@ -102,7 +116,7 @@ def fetch_coingecko_data(coin_id: str) -> Optional[Dict[str, Any]]:
             "sparkline": "false"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = (session or requests).get(url, params=params, timeout=10)
         response.raise_for_status()
         
         return response.json()
@@ -112,6 +126,7 @@ def fetch_coingecko_data(coin_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+@timed("coingecko.parse")
 def parse_coingecko_to_params(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convertit les données CoinGecko en paramètres pour l'analyse.
@@ -249,21 +264,25 @@ def parse_coingecko_to_params(data: Dict[str, Any]) -> Dict[str, Any]:
     return params
 
 
-def search_coingecko_coin(query: str) -> list:
+@timed("coingecko.search")
+def search_coingecko_coin(query: str, session: Optional['requests.Session'] = None) -> list:
     """
     Recherche un token sur CoinGecko.
     
     Args:
         query: Terme de recherche
+        session: Session HTTP partagée ; défaut : requête isolée
         
     Returns:
         Liste de résultats [{id, symbol, name}]
     """
+    import requests
+    
     try:
-        url = "https://api.coingecko.com/api/v3/search"
+        url = f"{COINGECKO_API_URL}/search"
         params = {"query": query}
         
-        response = requests.get(url, params=params, timeout=10)
+        response = (session or requests).get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
@@ -281,6 +300,7 @@ def search_coingecko_coin(query: str) -> list:
         return []
 
 
+@timed("params.enhance")
 def enhance_params_with_known_data(params: Dict[str, Any], coin_id: str) -> Dict[str, Any]:
     """
     Améliore les paramètres avec des données connues pour certains tokens populaires.
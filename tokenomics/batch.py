@@ -0,0 +1,441 @@
+"""
+Module de traitement par lot (batch) pour scorer des listes de tokens.
+
+Récupère les données CoinGecko en parallèle (avec cache disque), calcule le
+Tokenomics Viability Index de chaque token et écrit les résultats en flux
+vers un fichier CSV, JSONL ou Parquet.
+
+Les résultats sont d'abord journalisés dans un fichier de checkpoint
+(`<sortie>.checkpoint.jsonl`) : si le job est interrompu, une relance avec
+les mêmes arguments reprend là où il s'était arrêté sans refaire les appels
+réseau déjà effectués.
+"""
+
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple
+
+from tokenomics.api import (
+    fetch_coingecko_data,
+    parse_coingecko_to_params,
+    enhance_params_with_known_data,
+    normalize_coin_input
+)
+from tokenomics.profiling import profiled
+from tokenomics.scoring import calculate_viability_index
+from tokenomics.scenarios import get_scenario_params
+
+
+# Colonnes exportées pour chaque token (ordre stable pour CSV/Parquet)
+RESULT_FIELDS = [
+    'id', 'source', 'name', 'symbol', 'market_cap_rank', 'is_enriched',
+    'final_score', 'verdict',
+    'inflation_score', 'distribution_score', 'utility_score', 'governance_score',
+    'incentives_score', 'liquidity_score', 'adoption_score', 'security_score',
+    'circulating_supply', 'total_supply', 'max_supply', 'inflation_rate',
+    'price_usd', 'market_cap_usd', 'volume_24h',
+]
+
+SUPPORTED_FORMATS = ('csv', 'jsonl', 'parquet')
+
+# Types Parquet des colonnes non numériques (les autres sont en float64)
+_PARQUET_TYPES = {
+    'id': 'string',
+    'source': 'string',
+    'name': 'string',
+    'symbol': 'string',
+    'verdict': 'string',
+    'market_cap_rank': 'int64',
+    'is_enriched': 'bool',
+}
+
+
+class FetchCache:
+    """
+    Cache disque des réponses CoinGecko (un fichier JSON par token).
+
+    Les entrées plus anciennes que `ttl_seconds` sont ignorées
+    (ttl_seconds=None = pas d'expiration).
+    """
+
+    def __init__(self, directory: str, ttl_seconds: Optional[float] = 24 * 3600):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, coin_id: str) -> str:
+        safe_id = "".join(c if c.isalnum() or c in '-_.' else '_' for c in coin_id)
+        return os.path.join(self.directory, f"{safe_id}.json")
+
+    def get(self, coin_id: str) -> Optional[Dict[str, Any]]:
+        """Retourne les données en cache ou None si absentes/expirées."""
+        path = self._path(coin_id)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if self.ttl_seconds is not None and time.time() - entry.get('fetched_at', 0) > self.ttl_seconds:
+            return None
+        return entry.get('data')
+
+    def set(self, coin_id: str, data: Dict[str, Any]) -> None:
+        """Enregistre les données (écriture atomique)."""
+        path = self._path(coin_id)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'fetched_at': time.time(), 'data': data}, f)
+        os.replace(tmp_path, path)
+
+
+def fetch_many(
+    coin_ids: Iterable[str],
+    max_workers: int = 4,
+    cache: Optional[FetchCache] = None
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Récupère les données CoinGecko de plusieurs tokens en parallèle.
+
+    Args:
+        coin_ids: IDs CoinGecko (déjà normalisés)
+        max_workers: Nombre de requêtes simultanées
+        cache: Cache disque optionnel
+
+    Returns:
+        Itérateur de (coin_id, données ou None), dans l'ordre de complétion
+    """
+    def _fetch(coin_id: str) -> Optional[Dict[str, Any]]:
+        if cache is not None:
+            cached = cache.get(coin_id)
+            if cached is not None:
+                return cached
+        data = fetch_coingecko_data(coin_id)
+        if data is not None and cache is not None:
+            cache.set(coin_id, data)
+        return data
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch, coin_id): coin_id for coin_id in coin_ids}
+        for future in as_completed(futures):
+            coin_id = futures[future]
+            try:
+                yield coin_id, future.result()
+            except Exception as e:
+                print(f"Erreur inattendue pour '{coin_id}' : {e}", file=sys.stderr)
+                yield coin_id, None
+
+
+def build_result_record(
+    record_id: str,
+    params: Dict[str, Any],
+    score_data: Dict[str, Any],
+    source: str
+) -> Dict[str, Any]:
+    """
+    Aplatit paramètres et scores en une ligne de résultat.
+
+    Args:
+        record_id: Identifiant du token ou nom du scénario
+        params: Paramètres utilisés pour le scoring
+        score_data: Résultats de calculate_viability_index()
+        source: "coingecko" ou "scenario"
+
+    Returns:
+        Dictionnaire avec les colonnes de RESULT_FIELDS
+    """
+    record = {
+        'id': record_id,
+        'source': source,
+        'name': params.get('name') or record_id,
+        'symbol': params.get('symbol', ''),
+        'market_cap_rank': params.get('market_cap_rank'),
+        'is_enriched': params.get('is_enriched', False),
+        'circulating_supply': params.get('circulating_supply'),
+        'total_supply': params.get('total_supply'),
+        'max_supply': params.get('max_supply'),
+        'inflation_rate': params.get('inflation_rate'),
+        'price_usd': params.get('price_usd'),
+        'market_cap_usd': params.get('market_cap_usd'),
+        'volume_24h': params.get('volume_24h'),
+    }
+    for field in RESULT_FIELDS:
+        if field in score_data:
+            record[field] = score_data[field]
+    return {field: record.get(field) for field in RESULT_FIELDS}
+
+
+def score_coingecko_data(coin_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convertit une réponse CoinGecko en ligne de résultat scorée."""
+    params = parse_coingecko_to_params(data)
+    params = enhance_params_with_known_data(params, coin_id)
+    score_data = calculate_viability_index(params)
+    return build_result_record(coin_id, params, score_data, 'coingecko')
+
+
+def score_scenario(scenario_name: str) -> Dict[str, Any]:
+    """Score un scénario préconfiguré et retourne sa ligne de résultat."""
+    params = get_scenario_params(scenario_name)
+    score_data = calculate_viability_index(params)
+    return build_result_record(scenario_name, params, score_data, 'scenario')
+
+
+def read_coin_list(path: str) -> List[str]:
+    """
+    Lit une liste de tokens (un par ligne, `#` pour les commentaires).
+
+    Args:
+        path: Chemin du fichier ("-" pour stdin)
+
+    Returns:
+        Liste des tokens (non normalisés)
+    """
+    f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+    try:
+        coins = []
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                coins.append(line)
+        return coins
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def infer_format(output_path: str) -> str:
+    """Déduit le format de sortie à partir de l'extension du fichier."""
+    extension = os.path.splitext(output_path)[1].lower().lstrip('.')
+    if extension == 'json':
+        extension = 'jsonl'
+    if extension not in SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Format de sortie non reconnu pour '{output_path}' "
+            f"(formats supportés : {', '.join(SUPPORTED_FORMATS)})"
+        )
+    return extension
+
+
+def _truncate_partial_line(path: str, block_size: int = 65536) -> None:
+    """Coupe le fichier après son dernier saut de ligne (ligne finale incomplète)."""
+    with open(path, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            f.seek(start)
+            block = f.read(position - start)
+            newline = block.rfind(b"\n")
+            if newline >= 0:
+                keep = start + newline + 1
+                break
+            position = start
+        else:
+            keep = 0
+        if keep < end:
+            f.truncate(keep)
+
+
+class Checkpoint:
+    """
+    Journal JSONL des résultats déjà calculés, utilisé pour la reprise.
+
+    Chaque ligne est un résultat complet : à la relance, les IDs présents
+    sont sautés et le fichier de sortie final est reconstruit à partir du
+    journal. Une dernière ligne tronquée par un crash est retirée à
+    l'ouverture : son élément est recalculé et les ajouts suivants
+    commencent sur une ligne propre.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done_ids = set()
+        if os.path.exists(path):
+            _truncate_partial_line(path)
+            for record in self.iter_records():
+                self.done_ids.add(record['id'])
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Relit le journal (une ligne tronquée par un crash est ignorée)."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.done_ids.add(record['id'])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def write_records(records: Iterable[Dict[str, Any]], output_path: str, fmt: str, chunk_size: int = 1000) -> int:
+    """
+    Écrit les résultats en flux vers le fichier de sortie.
+
+    Args:
+        records: Itérable de lignes de résultat
+        output_path: Fichier de sortie
+        fmt: "csv", "jsonl" ou "parquet"
+        chunk_size: Taille des row groups Parquet
+
+    Returns:
+        Nombre de lignes écrites
+    """
+    count = 0
+    tmp_path = f"{output_path}.tmp"
+
+    if fmt == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("L'export Parquet nécessite pyarrow : pip install pyarrow")
+
+        schema = pa.schema([(field, _PARQUET_TYPES.get(field, 'float64')) for field in RESULT_FIELDS])
+        buffer = []
+        with pq.ParquetWriter(tmp_path, schema) as writer:
+            for record in records:
+                buffer.append(record)
+                count += 1
+                if len(buffer) >= chunk_size:
+                    writer.write_table(pa.Table.from_pylist(buffer, schema=schema))
+                    buffer.clear()
+            if buffer:
+                writer.write_table(pa.Table.from_pylist(buffer, schema=schema))
+
+    else:
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            if fmt == 'csv':
+                writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS)
+                writer.writeheader()
+                for record in records:
+                    writer.writerow(record)
+                    count += 1
+            else:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    count += 1
+
+    os.replace(tmp_path, output_path)
+    return count
+
+
+class ProgressReporter:
+    """Affiche l'avancement du job sur stderr."""
+
+    def __init__(self, total: int, enabled: bool = True, every: int = 25):
+        self.total = total
+        self.enabled = enabled
+        self.every = every
+        self.done = 0
+        self.failed = 0
+        self.start = time.time()
+
+    def update(self, ok: bool = True) -> None:
+        self.done += 1
+        if not ok:
+            self.failed += 1
+        if self.enabled and (self.done % self.every == 0 or self.done == self.total):
+            elapsed = time.time() - self.start
+            rate = self.done / elapsed if elapsed > 0 else 0.0
+            pct = self.done / self.total * 100 if self.total else 100.0
+            print(
+                f"[{self.done}/{self.total}] {pct:.1f}% - {rate:.1f} tokens/s - {self.failed} échec(s)",
+                file=sys.stderr
+            )
+
+
+@profiled("batch.run_batch")
+def run_batch(
+    coins: Iterable[str] = (),
+    scenarios: Iterable[str] = (),
+    output_path: str = "scores.csv",
+    fmt: Optional[str] = None,
+    max_workers: int = 4,
+    cache_dir: Optional[str] = ".tokenomics_cache",
+    cache_ttl: Optional[float] = 24 * 3600,
+    progress: bool = True
+) -> Dict[str, int]:
+    """
+    Score une liste de tokens et/ou de scénarios et écrit les résultats.
+
+    Args:
+        coins: Tokens (symboles ou IDs CoinGecko)
+        scenarios: Noms de scénarios préconfigurés
+        output_path: Fichier de sortie (.csv, .jsonl ou .parquet)
+        fmt: Format forcé (sinon déduit de l'extension)
+        max_workers: Nombre de requêtes CoinGecko simultanées
+        cache_dir: Répertoire du cache disque (None = pas de cache)
+        cache_ttl: Durée de validité du cache en secondes
+        progress: Afficher l'avancement sur stderr
+
+    Returns:
+        Statistiques {'written', 'scored', 'skipped', 'failed'}
+    """
+    fmt = fmt or infer_format(output_path)
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Format non supporté : {fmt}")
+
+    # Dédoublonnage en conservant l'ordre
+    coin_ids = list(dict.fromkeys(normalize_coin_input(c) for c in coins))
+    scenario_names = list(dict.fromkeys(scenarios))
+
+    checkpoint = Checkpoint(f"{output_path}.checkpoint.jsonl")
+    pending_scenarios = [s for s in scenario_names if s not in checkpoint.done_ids]
+    pending_coins = [c for c in coin_ids if c not in checkpoint.done_ids]
+    skipped = len(scenario_names) + len(coin_ids) - len(pending_scenarios) - len(pending_coins)
+
+    reporter = ProgressReporter(len(pending_scenarios) + len(pending_coins), enabled=progress)
+    if progress and skipped:
+        print(f"Reprise depuis le checkpoint : {skipped} élément(s) déjà traité(s)", file=sys.stderr)
+
+    cache = FetchCache(cache_dir, cache_ttl) if cache_dir else None
+    failed = 0
+
+    try:
+        for scenario_name in pending_scenarios:
+            checkpoint.append(score_scenario(scenario_name))
+            reporter.update()
+
+        for coin_id, data in fetch_many(pending_coins, max_workers=max_workers, cache=cache):
+            if data is None:
+                failed += 1
+                reporter.update(ok=False)
+                continue
+            try:
+                checkpoint.append(score_coingecko_data(coin_id, data))
+                reporter.update()
+            except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+                print(f"Données inexploitables pour '{coin_id}' : {e}", file=sys.stderr)
+                failed += 1
+                reporter.update(ok=False)
+    finally:
+        checkpoint.close()
+
+    # Seuls les éléments demandés : un journal laissé par un autre job ne se mélange pas à la sortie
+    requested = set(scenario_names) | set(coin_ids)
+    written = write_records(
+        (record for record in checkpoint.iter_records() if record.get('id') in requested),
+        output_path, fmt
+    )
+
+    # Le journal n'est supprimé que si tout a été traité (sinon on garde la reprise)
+    if failed == 0:
+        os.remove(checkpoint.path)
+
+    return {
+        'written': written,
+        'scored': reporter.done - reporter.failed,
+        'skipped': skipped,
+        'failed': failed
+    }
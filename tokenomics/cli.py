@@ -0,0 +1,395 @@
+"""
+Interface en ligne de commande de Tokenomics Analyzer.
+
+Usage :
+    python -m tokenomics score btc eth sol -o scores.csv
+    python -m tokenomics score --input tokens.txt -o scores.parquet --workers 8
+    python -m tokenomics score --scenarios all -o scenarios.jsonl
+    python -m tokenomics sweep -p inflation_rate=0:30:0.5 -p vesting_years=0:6:1 --min-score 65 -o sweep.parquet
+    python -m tokenomics precompute -o scenario_cache.json
+    python -m tokenomics backfill snapshots/ --store trends/
+    python -m tokenomics report --scenarios all --portfolio tokens.jsonl -o rapports.zip
+    python -m tokenomics refresh btc eth --scenarios all -o scores.tkm
+    python -m tokenomics serve --port 8000 --processes 0
+"""
+
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from tokenomics import profiling
+from tokenomics.instrumentation import is_enabled as timing_enabled
+from tokenomics.scenarios import get_all_scenarios, get_registry
+
+
+def _cmd_score(args: argparse.Namespace) -> int:
+    """Sous-commande `score` : scoring batch vers CSV/JSONL/Parquet."""
+    from tokenomics.batch import run_batch, read_coin_list
+
+    if args.profile:
+        profiling.set_enabled(True)
+
+    coins = list(args.coins)
+    if args.input:
+        coins.extend(read_coin_list(args.input))
+
+    scenarios = []
+    if args.scenarios:
+        if args.scenarios == ['all']:
+            scenarios = get_all_scenarios()
+        else:
+            registry = get_registry()
+            unknown = [s for s in args.scenarios if s not in registry]
+            if unknown:
+                print(f"Scénario(s) inconnu(s) : {', '.join(unknown)}", file=sys.stderr)
+                return 2
+            # Les ids stables sont acceptés, les sorties utilisent le nom affiché
+            scenarios = [registry.get(s).name for s in args.scenarios]
+
+    if not coins and not scenarios:
+        print("Aucun token ni scénario à scorer.", file=sys.stderr)
+        return 2
+
+    stats = run_batch(
+        coins=coins,
+        scenarios=scenarios,
+        output_path=args.output,
+        fmt=args.format,
+        max_workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_ttl=args.cache_ttl,
+        progress=not args.quiet
+    )
+
+    if not args.quiet:
+        print(
+            f"✅ {stats['written']} ligne(s) écrite(s) dans {args.output} "
+            f"({stats['scored']} scoré(s), {stats['skipped']} repris du checkpoint, "
+            f"{stats['failed']} échec(s))",
+            file=sys.stderr
+        )
+    return 1 if stats['failed'] else 0
+
+
+def _cmd_sweep(args: argparse.Namespace) -> int:
+    """Sous-commande `sweep` : balayage d'une grille de paramètres."""
+    from tokenomics.sweep import run_sweep, parse_range
+
+    if args.profile:
+        profiling.set_enabled(True)
+
+    base = args.base
+    if base is not None and base not in get_registry():
+        print(f"Scénario inconnu : {base}", file=sys.stderr)
+        return 2
+
+    try:
+        ranges = dict(parse_range(spec) for spec in args.param)
+        stats = run_sweep(
+            ranges,
+            output_path=args.output,
+            base=base,
+            fmt=args.format,
+            min_score=args.min_score,
+            chunk_size=args.chunk_size,
+            processes=args.processes,
+            progress=not args.quiet
+        )
+    except ValueError as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 2
+
+    if not args.quiet:
+        print(f"✅ {stats['written']} point(s) écrit(s) sur {stats['points']} dans {args.output}", file=sys.stderr)
+        if stats['best'] is not None:
+            print(f"Meilleur score : {stats['best_score']:.1f} avec {stats['best']}", file=sys.stderr)
+    return 0
+
+
+def _cmd_precompute(args: argparse.Namespace) -> int:
+    """Sous-commande `precompute` : artefact des scores des scénarios."""
+    from tokenomics.precompute import build_scenario_cache, write_scenario_cache
+
+    cache = build_scenario_cache()
+    try:
+        write_scenario_cache(cache, args.output)
+    except OSError as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+
+    print(f"✅ {len(cache)} scénario(s) précalculé(s) dans {args.output} (empreinte {cache.fingerprint[:12]})",
+          file=sys.stderr)
+    return 0
+
+
+def _cmd_backfill(args: argparse.Namespace) -> int:
+    """Sous-commande `backfill` : historique des scores depuis des snapshots."""
+    from tokenomics.trends import TrendStore, backfill
+
+    store = TrendStore(args.store)
+    try:
+        stats = backfill(args.snapshots, store, segment_rows=args.segment_rows, progress=not args.quiet)
+    except OSError as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+    if args.compact:
+        store.compact()
+
+    if not args.quiet:
+        print(f"✅ {stats['written']} ligne(s) ajoutée(s) à {args.store} ({stats['failed']} échec(s))", file=sys.stderr)
+    return 1 if stats['failed'] else 0
+
+
+def _cmd_report(args: argparse.Namespace) -> int:
+    """Sous-commande `report` : rapports HTML statiques d'un portefeuille."""
+    from tokenomics.reports import render_reports, scenario_entries, load_portfolio, coin_entries
+
+    if args.profile:
+        profiling.set_enabled(True)
+
+    names = get_all_scenarios() if args.scenarios == ['all'] else (args.scenarios or [])
+    entries = scenario_entries(names)
+    failed = len(names) - len(entries)
+    try:
+        for path in args.portfolio or []:
+            entries.extend(load_portfolio(path))
+    except (OSError, ValueError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 2
+    if args.coins:
+        fetched, fetch_failed = coin_entries(
+            args.coins,
+            max_workers=args.workers,
+            cache_dir=None if args.no_cache else args.cache_dir
+        )
+        entries.extend(fetched)
+        failed += fetch_failed
+
+    if not entries:
+        print("Aucun token à inclure dans le rapport.", file=sys.stderr)
+        return 2
+
+    try:
+        stats = render_reports(
+            entries,
+            args.output,
+            processes=args.processes,
+            chunk_size=args.chunk_size,
+            images=args.images,
+            progress=not args.quiet
+        )
+    except (ImportError, ValueError, OSError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 2 if isinstance(e, (ImportError, ValueError)) else 1
+
+    failed += stats['failed']
+    if not args.quiet:
+        print(
+            f"✅ {stats['reports']} rapport(s) dans {args.output} "
+            f"({stats['bytes'] / 1e6:.1f} Mo, {failed} échec(s))",
+            file=sys.stderr
+        )
+    return 1 if failed else 0
+
+
+def _cmd_refresh(args: argparse.Namespace) -> int:
+    """Sous-commande `refresh` : matrice des scores d'un univers de tokens."""
+    from tokenomics.reports import scenario_entries, load_portfolio, coin_entries
+    from tokenomics.score_matrix import write_universe_scores
+    from tokenomics.universe import TokenUniverse
+
+    universes = []
+    names = get_all_scenarios() if args.scenarios == ['all'] else (args.scenarios or [])
+    sources = [(scenario_entries(names), 'scenario')]
+    failed = len(names) - len(sources[0][0])
+    try:
+        if args.universe:
+            universes.append(TokenUniverse.load(args.universe, mmap=False))
+        for path in args.portfolio or []:
+            sources.append((load_portfolio(path), 'manual'))
+    except (OSError, ValueError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 2
+    if args.coins:
+        fetched, fetch_failed = coin_entries(
+            args.coins,
+            max_workers=args.workers,
+            cache_dir=None if args.no_cache else args.cache_dir
+        )
+        sources.append((fetched, 'coingecko'))
+        failed += fetch_failed
+
+    try:
+        for entries, source in sources:
+            if entries:
+                universes.append(TokenUniverse.from_params(
+                    [(entry['id'], entry['params']) for entry in entries], source=source
+                ))
+        if not universes:
+            print("Aucun token à scorer.", file=sys.stderr)
+            return 2
+        # Un id présent dans plusieurs sources : la dernière (tokens CoinGecko) l'emporte
+        universe = TokenUniverse.concat(universes).deduplicate().score()
+        if args.save_universe:
+            universe.save(args.save_universe)
+        write_universe_scores(universe, args.output)
+    except ValueError as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"✅ {len(universe)} token(s) scoré(s) dans {args.output} ({failed} échec(s))", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def _cmd_serve(args: argparse.Namespace) -> int:
+    """Sous-commande `serve` : service HTTP JSON."""
+    from tokenomics.server import serve
+
+    serve(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        processes=args.processes,
+        quiet=args.quiet,
+        queue_size=args.queue_size
+    )
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Construit le parser argparse avec toutes les sous-commandes."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tokenomics",
+        description="Tokenomics Analyzer - outils en ligne de commande"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    score = subparsers.add_parser("score", help="Scorer une liste de tokens ou de scénarios")
+    score.add_argument("coins", nargs="*", help="Symboles ou IDs CoinGecko (btc, ethereum, ...)")
+    score.add_argument("-i", "--input", help="Fichier de tokens, un par ligne ('-' pour stdin)")
+    score.add_argument("-s", "--scenarios", nargs="+", metavar="NOM",
+                       help="Scénarios à scorer, par nom ou id ('all' pour tous)")
+    score.add_argument("-o", "--output", default="scores.csv",
+                       help="Fichier de sortie .csv, .jsonl ou .parquet (défaut : scores.csv)")
+    score.add_argument("-f", "--format", choices=["csv", "jsonl", "parquet"],
+                       help="Format de sortie (défaut : déduit de l'extension)")
+    score.add_argument("-w", "--workers", type=int, default=4,
+                       help="Requêtes CoinGecko simultanées (défaut : 4)")
+    score.add_argument("--cache-dir", default=".tokenomics_cache",
+                       help="Répertoire du cache des réponses CoinGecko")
+    score.add_argument("--cache-ttl", type=float, default=24 * 3600,
+                       help="Durée de validité du cache en secondes (défaut : 24h)")
+    score.add_argument("--no-cache", action="store_true", help="Désactiver le cache disque")
+    score.add_argument("-q", "--quiet", action="store_true", help="Ne pas afficher la progression")
+    score.add_argument("--profile", action="store_true",
+                       help="Capturer un profil cProfile/tracemalloc (voir TOKENOMICS_PROFILE_DIR)")
+    score.set_defaults(func=_cmd_score)
+
+    sweep = subparsers.add_parser("sweep", help="Scorer une grille cartésienne de paramètres")
+    sweep.add_argument("-p", "--param", action="append", required=True, metavar="NOM=PLAGE",
+                       help="Plage d'un paramètre : nom=début:fin:pas (fin incluse) ou nom=v1,v2,... (répétable)")
+    sweep.add_argument("-b", "--base", help="Scénario (nom ou id) fournissant les autres paramètres")
+    sweep.add_argument("-o", "--output", default="sweep.parquet",
+                       help="Fichier de sortie .parquet ou .csv (défaut : sweep.parquet)")
+    sweep.add_argument("-f", "--format", choices=["parquet", "csv"],
+                       help="Format de sortie (défaut : déduit de l'extension)")
+    sweep.add_argument("--min-score", type=float, help="N'écrire que les points avec un score >= MIN_SCORE")
+    sweep.add_argument("--chunk-size", type=int, default=250_000, help="Points par bloc (défaut : 250000)")
+    sweep.add_argument("--processes", type=int, default=None,
+                       help="Processus de calcul (défaut : un par cœur)")
+    sweep.add_argument("-q", "--quiet", action="store_true", help="Ne pas afficher la progression")
+    sweep.add_argument("--profile", action="store_true",
+                       help="Capturer un profil cProfile/tracemalloc (voir TOKENOMICS_PROFILE_DIR)")
+    sweep.set_defaults(func=_cmd_sweep)
+
+    precompute = subparsers.add_parser("precompute", help="Précalculer les scores des scénarios")
+    precompute.add_argument("-o", "--output", default="scenario_cache.json",
+                            help="Artefact JSON à charger via TOKENOMICS_SCENARIO_CACHE (défaut : scenario_cache.json)")
+    precompute.set_defaults(func=_cmd_precompute)
+
+    backfill = subparsers.add_parser("backfill", help="Rejouer des snapshots journaliers dans l'historique des scores")
+    backfill.add_argument("snapshots", nargs="+", help="Fichiers JSONL ou répertoires de snapshots")
+    backfill.add_argument("-s", "--store", default="trends", help="Répertoire du stockage (défaut : trends)")
+    backfill.add_argument("--segment-rows", type=int, default=500_000,
+                          help="Lignes par segment écrit (défaut : 500000)")
+    backfill.add_argument("--compact", action="store_true", help="Fusionner les segments après le backfill")
+    backfill.add_argument("-q", "--quiet", action="store_true", help="Ne pas afficher la progression")
+    backfill.set_defaults(func=_cmd_backfill)
+
+    report = subparsers.add_parser("report", help="Rapports HTML statiques d'un portefeuille (site ou .zip)")
+    report.add_argument("coins", nargs="*", help="Symboles ou IDs CoinGecko (btc, ethereum, ...)")
+    report.add_argument("-s", "--scenarios", nargs="+", metavar="NOM",
+                        help="Scénarios à inclure, par nom ou id ('all' pour tous)")
+    report.add_argument("-p", "--portfolio", action="append", metavar="FICHIER",
+                        help="Portefeuille .json/.jsonl de paramètres de tokens (répétable)")
+    report.add_argument("-o", "--output", default="rapports",
+                        help="Répertoire du site statique, ou archive .zip (défaut : rapports)")
+    report.add_argument("--images", choices=["png", "svg", "pdf"],
+                        help="Exporter aussi les graphiques en images (nécessite kaleido)")
+    report.add_argument("--processes", type=int, default=None,
+                        help="Processus de rendu (défaut : un par cœur)")
+    report.add_argument("--chunk-size", type=int, default=25, help="Tokens par tâche (défaut : 25)")
+    report.add_argument("-w", "--workers", type=int, default=4,
+                        help="Requêtes CoinGecko simultanées (défaut : 4)")
+    report.add_argument("--cache-dir", default=".tokenomics_cache",
+                        help="Répertoire du cache des réponses CoinGecko")
+    report.add_argument("--no-cache", action="store_true", help="Désactiver le cache disque")
+    report.add_argument("-q", "--quiet", action="store_true", help="Ne pas afficher la progression")
+    report.add_argument("--profile", action="store_true",
+                        help="Capturer un profil cProfile/tracemalloc (voir TOKENOMICS_PROFILE_DIR)")
+    report.set_defaults(func=_cmd_report)
+
+    refresh = subparsers.add_parser("refresh", help="Rescorer un univers de tokens et écrire la matrice des scores")
+    refresh.add_argument("coins", nargs="*", help="Symboles ou IDs CoinGecko (btc, ethereum, ...)")
+    refresh.add_argument("-s", "--scenarios", nargs="+", metavar="NOM",
+                         help="Scénarios à inclure, par nom ou id ('all' pour tous)")
+    refresh.add_argument("-p", "--portfolio", action="append", metavar="FICHIER",
+                         help="Portefeuille .json/.jsonl de paramètres de tokens (répétable)")
+    refresh.add_argument("-u", "--universe", metavar="RÉPERTOIRE",
+                         help="Univers enregistré (TokenUniverse.save) à rescorer")
+    refresh.add_argument("-o", "--output", default="scores.tkm",
+                         help="Matrice à charger via TOKENOMICS_SCORE_MATRIX (défaut : scores.tkm)")
+    refresh.add_argument("--save-universe", metavar="RÉPERTOIRE",
+                         help="Enregistrer aussi l'univers scoré (paramètres, métadonnées, scores)")
+    refresh.add_argument("-w", "--workers", type=int, default=4,
+                         help="Requêtes CoinGecko simultanées (défaut : 4)")
+    refresh.add_argument("--cache-dir", default=".tokenomics_cache",
+                         help="Répertoire du cache des réponses CoinGecko")
+    refresh.add_argument("--no-cache", action="store_true", help="Désactiver le cache disque")
+    refresh.add_argument("-q", "--quiet", action="store_true", help="Ne pas afficher la progression")
+    refresh.set_defaults(func=_cmd_refresh)
+
+    serve = subparsers.add_parser("serve", help="Lancer le service HTTP JSON")
+    serve.add_argument("--host", default="127.0.0.1", help="Adresse d'écoute (défaut : 127.0.0.1)")
+    serve.add_argument("-p", "--port", type=int, default=8000, help="Port d'écoute (défaut : 8000)")
+    serve.add_argument("-w", "--workers", type=int, default=None,
+                       help="Threads par processus (défaut : nombre de cœurs × 4)")
+    serve.add_argument("--processes", type=int, default=1,
+                       help="Processus partageant le socket, 0 = un par cœur (défaut : 1)")
+    serve.add_argument("--queue-size", type=int, default=None,
+                       help="Connexions en attente par processus avant de répondre 503 (défaut : workers × 2)")
+    serve.add_argument("-q", "--quiet", action="store_true", help="Désactiver les logs d'accès")
+    serve.set_defaults(func=_cmd_serve)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Point d'entrée de `python -m tokenomics`."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # TOKENOMICS_TIMING=1 : logs JSON des durées par étape sur stderr
+    if timing_enabled():
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        timing_logger = logging.getLogger("tokenomics.timing")
+        timing_logger.addHandler(handler)
+        timing_logger.setLevel(logging.INFO)
+
+    return args.func(args)
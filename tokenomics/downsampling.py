@@ -0,0 +1,67 @@
+"""
+Réduction de séries temporelles pour l'affichage.
+
+Algorithme LTTB (Largest-Triangle-Three-Buckets, S. Steinarsson, 2013) :
+la série est découpée en seaux ; dans chaque seau, on garde le point qui
+forme le plus grand triangle avec le point retenu dans le seau précédent et
+la moyenne du seau suivant. Les pics, creux et ruptures de pente sont
+conservés, contrairement à un sous-échantillonnage régulier.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Indices des points retenus par LTTB.
+
+    Args:
+        x: Abscisses croissantes (n,)
+        y: Ordonnées (n,)
+        n_out: Nombre de points à conserver (premier et dernier inclus)
+
+    Returns:
+        Indices croissants (min(n, n_out),)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # Seaux des points intermédiaires : [edges[i], edges[i + 1])
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    # Moyenne du seau suivant de chaque seau (le dernier point pour le dernier seau)
+    counts = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / counts, x[-1])[1:]
+    avg_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / counts, y[-1])[1:]
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        # Double de l'aire du triangle (a, point candidat, moyenne suivante)
+        area = np.abs(
+            (x[a] - avg_x[i]) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (avg_y[i] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Réduit une série à `n_out` points par LTTB.
+
+    Returns:
+        (x, y) réduits
+    """
+    indices = lttb_indices(x, y, n_out)
+    return np.asarray(x)[indices], np.asarray(y)[indices]
@@ -0,0 +1,211 @@
+"""
+Historique des analyses de l'application, stocké hors du processus (SQLite).
+
+Chaque analyse est un enregistrement compact (session, nom, symbole, score,
+date, empreinte des paramètres). Les paramètres ne sont stockés qu'une fois
+par empreinte de contenu et ne sont relus qu'au rechargement d'une analyse :
+la session Streamlit ne garde que son identifiant, la mémoire par utilisateur
+reste constante et l'historique survit aux redémarrages.
+
+La base (mode WAL) est partagée par tous les threads et processus qui
+servent l'application ; son chemin est donné par TOKENOMICS_HISTORY_DB.
+Les analyses de plus de HISTORY_MAX_AGE secondes sont purgées (au plus une
+fois par PURGE_INTERVAL lors d'un ajout) : les sessions abandonnées ne
+s'accumulent pas.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional
+
+from tokenomics.reports import params_hash
+
+
+# Analyses conservées par session
+HISTORY_LIMIT = 20
+
+# Âge maximal d'une analyse (30 jours), None pour tout conserver
+HISTORY_MAX_AGE = 30 * 24 * 3600
+
+# Intervalle minimal entre deux purges des analyses expirées (par processus)
+PURGE_INTERVAL = 3600
+
+# Empreintes par requête DELETE ... IN (limite de variables des anciens SQLite : 999)
+_HASH_CHUNK = 500
+
+DEFAULT_HISTORY_DB = ".tokenomics_history.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS params (
+    hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session TEXT NOT NULL,
+    name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    score REAL NOT NULL,
+    created_at REAL NOT NULL,
+    params_hash TEXT NOT NULL REFERENCES params(hash)
+);
+CREATE INDEX IF NOT EXISTS history_session ON history(session, id);
+CREATE INDEX IF NOT EXISTS history_params ON history(params_hash);
+CREATE INDEX IF NOT EXISTS history_created ON history(created_at);
+"""
+
+
+class HistoryStore:
+    """
+    Historique des analyses par session.
+
+    Args:
+        path: Fichier SQLite (créé au besoin)
+        limit: Nombre d'analyses conservées par session
+        max_age: Âge maximal d'une analyse en secondes (None : pas d'expiration)
+    """
+
+    def __init__(self, path: str, limit: int = HISTORY_LIMIT, max_age: Optional[float] = HISTORY_MAX_AGE):
+        self.path = path
+        self.limit = limit
+        self.max_age = max_age
+        self._last_purge = 0.0
+        self._local = threading.local()
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # Une connexion par thread (les connexions SQLite ne se partagent pas entre threads)
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def add(self, session_id: str, params: Dict[str, Any], score: float) -> Optional[str]:
+        """
+        Enregistre une analyse.
+
+        Une analyse identique à la dernière de la session (mêmes paramètres)
+        n'est pas dupliquée ; au-delà de `limit`, les plus anciennes sont supprimées.
+        Les analyses expirées de toutes les sessions sont purgées au passage
+        (au plus une fois par PURGE_INTERVAL).
+
+        Args:
+            session_id: Identifiant de l'utilisateur
+            params: Paramètres analysés
+            score: Score final
+
+        Returns:
+            Empreinte des paramètres, ou None si l'analyse était déjà la dernière
+        """
+        digest = params_hash(params)
+        with self._connection() as conn:
+            last = conn.execute(
+                "SELECT params_hash FROM history WHERE session = ? ORDER BY id DESC LIMIT 1", (session_id,)
+            ).fetchone()
+            if last is not None and last[0] == digest:
+                return None
+
+            conn.execute(
+                "INSERT OR IGNORE INTO params (hash, data) VALUES (?, ?)",
+                (digest, json.dumps(params, default=str, ensure_ascii=False))
+            )
+            conn.execute(
+                "INSERT INTO history (session, name, symbol, score, created_at, params_hash) VALUES (?, ?, ?, ?, ?, ?)",
+                (session_id, str(params.get('name', 'Token')), str(params.get('symbol', 'N/A')),
+                 float(score), time.time(), digest)
+            )
+            trimmed = conn.execute(
+                "SELECT id, params_hash FROM history WHERE session = ? ORDER BY id DESC LIMIT -1 OFFSET ?",
+                (session_id, self.limit)
+            ).fetchall()
+            if trimmed:
+                conn.executemany("DELETE FROM history WHERE id = ?", [(row[0],) for row in trimmed])
+                self._delete_orphans(conn, {row[1] for row in trimmed})
+
+        if self.max_age is not None and time.time() - self._last_purge >= PURGE_INTERVAL:
+            self.purge()
+        return digest
+
+    def purge(self, max_age: Optional[float] = None) -> int:
+        """
+        Supprime les analyses plus anciennes que `max_age` (toutes sessions).
+
+        Args:
+            max_age: Âge maximal en secondes (défaut : celui du store)
+
+        Returns:
+            Nombre d'analyses supprimées
+        """
+        max_age = self.max_age if max_age is None else max_age
+        self._last_purge = time.time()
+        if max_age is None:
+            return 0
+        cutoff = self._last_purge - max_age
+        with self._connection() as conn:
+            hashes = {row[0] for row in conn.execute(
+                "SELECT DISTINCT params_hash FROM history WHERE created_at < ?", (cutoff,)
+            )}
+            if not hashes:
+                return 0
+            deleted = conn.execute("DELETE FROM history WHERE created_at < ?", (cutoff,)).rowcount
+            self._delete_orphans(conn, hashes)
+        return deleted
+
+    @staticmethod
+    def _delete_orphans(conn: sqlite3.Connection, hashes: Iterable[str]) -> None:
+        """Supprime, parmi `hashes`, les paramètres qui ne sont plus référencés (index history_params)."""
+        hashes = list(hashes)
+        for start in range(0, len(hashes), _HASH_CHUNK):
+            chunk = hashes[start:start + _HASH_CHUNK]
+            conn.execute(
+                f"DELETE FROM params WHERE hash IN ({', '.join('?' * len(chunk))}) "
+                "AND NOT EXISTS (SELECT 1 FROM history WHERE history.params_hash = params.hash)",
+                chunk
+            )
+
+    def recent(self, session_id: str, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        Dernières analyses d'une session, de la plus récente à la plus ancienne.
+
+        Returns:
+            [{'id', 'name', 'symbol', 'score', 'created_at', 'params_hash'}] (sans les paramètres)
+        """
+        rows = self._connection().execute(
+            "SELECT id, name, symbol, score, created_at, params_hash FROM history "
+            "WHERE session = ? ORDER BY id DESC LIMIT ?",
+            (session_id, limit)
+        ).fetchall()
+        return [
+            {'id': row[0], 'name': row[1], 'symbol': row[2], 'score': row[3], 'created_at': row[4], 'params_hash': row[5]}
+            for row in rows
+        ]
+
+    def load_params(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Paramètres d'une analyse (None si l'empreinte est inconnue)."""
+        row = self._connection().execute("SELECT data FROM params WHERE hash = ?", (digest,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+
+_store: Optional[HistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_history_store() -> HistoryStore:
+    """Historique désigné par TOKENOMICS_HISTORY_DB (défaut : .tokenomics_history.db)."""
+    global _store
+    path = os.environ.get("TOKENOMICS_HISTORY_DB", DEFAULT_HISTORY_DB)
+    if _store is None or _store.path != path:
+        with _store_lock:
+            if _store is None or _store.path != path:
+                _store = HistoryStore(path)
+    return _store
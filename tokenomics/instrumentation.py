@@ -0,0 +1,209 @@
+"""
+Instrumentation légère des étapes d'une analyse (fetch, parsing, scoring,
+construction des graphiques, rendu Streamlit).
+
+Les mesures sont actives si :
+- la variable d'environnement TOKENOMICS_TIMING vaut 1/true (tout le processus), ou
+- un collecteur est ouvert avec `collect()` dans le contexte courant (ex : une
+  session Streamlit avec le panneau de debug activé).
+
+Désactivée, une span coûte un test booléen et une lecture de ContextVar.
+
+Chaque span mesurée est :
+- ajoutée au collecteur courant (détail par analyse),
+- agrégée dans un histogramme global exportable au format Prometheus,
+- écrite en JSON sur le logger `tokenomics.timing` (niveau INFO).
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Iterator
+
+
+logger = logging.getLogger("tokenomics.timing")
+
+# Bornes des buckets de l'histogramme (secondes)
+HISTOGRAM_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_enabled = os.environ.get("TOKENOMICS_TIMING", "").lower() in ("1", "true", "yes")
+_collector = ContextVar("tokenomics_timing_collector", default=None)
+_depth = ContextVar("tokenomics_timing_depth", default=0)
+
+_metrics_lock = threading.Lock()
+# stage -> [compteurs par bucket..., +Inf, somme des durées]
+_metrics: Dict[str, List[float]] = {}
+
+
+def set_enabled(enabled: bool) -> None:
+    """Active ou désactive la mesure pour tout le processus."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Indique si les spans sont mesurées dans le contexte courant."""
+    return _enabled or _collector.get() is not None
+
+
+class _NoopSpan:
+    """Span partagée retournée quand l'instrumentation est désactivée."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'start', 'token')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.token = _depth.set(_depth.get() + 1)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        _depth.reset(self.token)
+        _record(self.name, duration, _depth.get(), failed=exc_type is not None)
+        return False
+
+
+def span(name: str):
+    """
+    Context manager mesurant la durée d'une étape.
+
+    Args:
+        name: Nom de l'étape (ex : "coingecko.fetch", "chart.gauge")
+
+    Usage :
+        with span("score"):
+            score_data = calculate_viability_index(params)
+    """
+    if not _enabled and _collector.get() is None:
+        return _NOOP_SPAN
+    return _Span(name)
+
+
+def timed(name: str):
+    """Décorateur équivalent à `with span(name):` autour de la fonction."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled and _collector.get() is None:
+                return fn(*args, **kwargs)
+            with _Span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _record(name: str, duration: float, depth: int, failed: bool = False) -> None:
+    records = _collector.get()
+    if records is not None:
+        records.append({'stage': name, 'duration_ms': duration * 1000, 'depth': depth})
+
+    with _metrics_lock:
+        counts = _metrics.get(name)
+        if counts is None:
+            counts = _metrics[name] = [0] * (len(HISTOGRAM_BUCKETS) + 1) + [0.0]
+        for i, bound in enumerate(HISTOGRAM_BUCKETS):
+            if duration <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[len(HISTOGRAM_BUCKETS)] += 1
+        counts[-1] += duration
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({
+            'event': 'span',
+            'stage': name,
+            'duration_ms': round(duration * 1000, 3),
+            'depth': depth,
+            'failed': failed,
+        }))
+
+
+@contextmanager
+def collect() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Ouvre un collecteur pour le contexte courant (thread/session).
+
+    Les spans mesurées dans le bloc sont ajoutées à la liste retournée, dans
+    l'ordre de fin : {'stage', 'duration_ms', 'depth'}.
+    """
+    records = []
+    token = _collector.set(records)
+    try:
+        yield records
+    finally:
+        _collector.reset(token)
+
+
+def summarize(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Agrège les spans d'un collecteur par étape.
+
+    Returns:
+        Liste triée par durée totale décroissante : {'stage', 'calls', 'total_ms', 'max_ms'}
+    """
+    summary = {}
+    for record in records:
+        entry = summary.setdefault(record['stage'], {
+            'stage': record['stage'], 'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0
+        })
+        entry['calls'] += 1
+        entry['total_ms'] += record['duration_ms']
+        entry['max_ms'] = max(entry['max_ms'], record['duration_ms'])
+    return sorted(summary.values(), key=lambda e: e['total_ms'], reverse=True)
+
+
+def render_prometheus() -> str:
+    """
+    Exporte l'histogramme des durées au format texte Prometheus.
+
+    Returns:
+        Métrique `tokenomics_stage_duration_seconds` (buckets, sum, count)
+    """
+    lines = [
+        "# HELP tokenomics_stage_duration_seconds Durée des étapes d'analyse",
+        "# TYPE tokenomics_stage_duration_seconds histogram",
+    ]
+    with _metrics_lock:
+        snapshot = {stage: list(counts) for stage, counts in _metrics.items()}
+
+    for stage in sorted(snapshot):
+        counts = snapshot[stage]
+        label = stage.replace('\\', '\\\\').replace('"', '\\"')
+        cumulative = 0
+        for bound, count in zip(HISTOGRAM_BUCKETS, counts):
+            cumulative += count
+            lines.append(f'tokenomics_stage_duration_seconds_bucket{{stage="{label}",le="{bound}"}} {cumulative}')
+        cumulative += counts[len(HISTOGRAM_BUCKETS)]
+        lines.append(f'tokenomics_stage_duration_seconds_bucket{{stage="{label}",le="+Inf"}} {cumulative}')
+        lines.append(f'tokenomics_stage_duration_seconds_sum{{stage="{label}"}} {counts[-1]:.6f}')
+        lines.append(f'tokenomics_stage_duration_seconds_count{{stage="{label}"}} {cumulative}')
+
+    return "\n".join(lines) + "\n"
+
+
+def reset_metrics() -> None:
+    """Remet à zéro l'histogramme global."""
+    with _metrics_lock:
+        _metrics.clear()
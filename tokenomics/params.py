@@ -0,0 +1,244 @@
+"""
+Représentation typée des paramètres d'un token.
+
+`TokenParams` remplace le dictionnaire libre d'une quarantaine de clés là
+où beaucoup de tokens restent en mémoire : attributs en `__slots__` (pas de
+dictionnaire par instance), types et bornes vérifiés à la construction,
+valeurs par défaut des métriques optionnelles déjà appliquées.
+
+Conversions :
+- `TokenParams.from_dict(params)` / `params.to_dict()` : frontière avec
+  l'app, le service HTTP, les exports JSON (clés inconnues ignorées)
+- `to_records(tokens)` / `from_records(records)` : tableau structuré NumPy
+  (une ligne par token, ~340 octets), `as_columns(records)` en donne des vues
+  colonne par colonne pour calculate_viability_index_vectorized
+
+Les dictionnaires restent acceptés partout : calculate_viability_index lit
+indifféremment l'un ou l'autre.
+"""
+
+import math
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Mapping, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+_REQUIRED = object()
+
+# (nom, type, défaut) ; _REQUIRED : paramètre obligatoire (cf. scoring.REQUIRED_PARAMS)
+FIELDS = (
+    # Supply & émission
+    ('circulating_supply', float, _REQUIRED),
+    ('total_supply', float, _REQUIRED),
+    ('max_supply', float, _REQUIRED),
+    ('inflation_rate', float, _REQUIRED),
+    ('emission_years_left', float, _REQUIRED),
+    # Distribution
+    ('team_allocation', float, _REQUIRED),
+    ('vesting_years', float, _REQUIRED),
+    ('top_10_concentration', float, _REQUIRED),
+    # Utilité
+    ('utility_gas', bool, _REQUIRED),
+    ('utility_staking', bool, _REQUIRED),
+    ('utility_governance', bool, _REQUIRED),
+    ('utility_collateral', bool, _REQUIRED),
+    ('utility_discount', bool, _REQUIRED),
+    # Gouvernance
+    ('gov_timelock', bool, _REQUIRED),
+    ('gov_multisig', bool, _REQUIRED),
+    ('gov_dao_active', bool, _REQUIRED),
+    # Incitations
+    ('incentive_lock', bool, _REQUIRED),
+    ('incentive_staking', bool, _REQUIRED),
+    ('incentive_burn', bool, _REQUIRED),
+    ('lock_duration_months', float, _REQUIRED),
+    ('burn_rate', float, _REQUIRED),
+    # Marché (cf. scoring.OPTIONAL_PARAMS)
+    ('volume_24h', float, 0.0),
+    ('market_cap_usd', float, 0.0),
+    ('volume_to_market_cap', float, 0.0),
+    ('market_cap_rank', int, 999),
+    ('price_change_30d', float, 0.0),
+    ('price_usd', float, 0.0),
+    ('price_change_24h', float, 0.0),
+    ('price_change_7d', float, 0.0),
+    ('ath_change', float, 0.0),
+    # Métadonnées
+    ('name', str, ''),
+    ('symbol', str, ''),
+    ('description', str, ''),
+)
+
+FIELD_NAMES = tuple(name for name, _, _ in FIELDS)
+
+# Bornes vérifiées à la construction
+_NON_NEGATIVE = (
+    'circulating_supply', 'total_supply', 'max_supply', 'emission_years_left',
+    'vesting_years', 'lock_duration_months', 'burn_rate', 'volume_24h', 'market_cap_usd',
+)
+_PERCENTAGES = ('team_allocation', 'top_10_concentration')
+
+# Largeur des chaînes dans les tableaux structurés (tronquées au-delà ; description non stockée)
+RECORD_STRINGS = {'name': 'U32', 'symbol': 'U12'}
+
+
+class TokenParams:
+    """
+    Paramètres validés d'un token.
+
+    Args:
+        **values: Paramètres du schéma FIELDS (les optionnels absents ou None
+            prennent leur valeur par défaut)
+
+    Raises:
+        ValueError: Paramètre obligatoire manquant, inconnu, non numérique ou hors bornes
+    """
+
+    __slots__ = FIELD_NAMES
+
+    def __init__(self, **values: Any):
+        unknown = [key for key in values if key not in _FIELD_TYPES]
+        if unknown:
+            raise ValueError(f"TokenParams : paramètres inconnus ({', '.join(unknown)})")
+        missing = [name for name, _, default in FIELDS if default is _REQUIRED and values.get(name) is None]
+        if missing:
+            raise ValueError(f"TokenParams : paramètres manquants ({', '.join(missing)})")
+
+        for name, kind, default in FIELDS:
+            value = values.get(name)
+            if value is None:
+                value = default
+            elif kind is bool:
+                value = bool(value)
+            elif kind is str:
+                value = str(value)
+            else:
+                try:
+                    # Les entiers restent entiers (commentaires "5 ans", aller-retour exact avec les dicts)
+                    value = value if type(value) is int else kind(value)
+                except (TypeError, ValueError):
+                    raise ValueError(f"TokenParams : '{name}' doit être numérique ({value!r})") from None
+                if not math.isfinite(value):
+                    raise ValueError(f"TokenParams : '{name}' doit être fini ({value!r})")
+            object.__setattr__(self, name, value)
+
+        for name in _NON_NEGATIVE:
+            if getattr(self, name) < 0:
+                raise ValueError(f"TokenParams : '{name}' doit être positif ({getattr(self, name)!r})")
+        for name in _PERCENTAGES:
+            if not 0 <= getattr(self, name) <= 100:
+                raise ValueError(f"TokenParams : '{name}' doit être entre 0 et 100 ({getattr(self, name)!r})")
+
+    @classmethod
+    def from_dict(cls, params: Mapping[str, Any]) -> 'TokenParams':
+        """Construit depuis un dictionnaire de paramètres (clés hors schéma ignorées)."""
+        return cls(**{key: params[key] for key in FIELD_NAMES if key in params})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dictionnaire de paramètres (format des scénarios et de parse_coingecko_to_params)."""
+        return {name: getattr(self, name) for name in FIELD_NAMES}
+
+    def replace(self, **changes: Any) -> 'TokenParams':
+        """Copie modifiée (revalidée) ; les instances ne sont pas modifiées sur place."""
+        values = self.to_dict()
+        values.update(changes)
+        return TokenParams(**values)
+
+    # Lecture façon dictionnaire, pour le code qui consomme encore des paramètres en dict
+    def __getitem__(self, key: str) -> Any:
+        if key not in _FIELD_TYPES:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key) if key in _FIELD_TYPES else default
+
+    def __contains__(self, key: str) -> bool:
+        return key in _FIELD_TYPES
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("TokenParams est immuable : utiliser replace()")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, TokenParams):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in FIELD_NAMES)
+
+    def __hash__(self) -> int:
+        return hash(tuple(getattr(self, name) for name in FIELD_NAMES))
+
+    def __repr__(self) -> str:
+        return f"TokenParams(name={self.name!r}, symbol={self.symbol!r}, market_cap_rank={self.market_cap_rank})"
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in FIELD_NAMES)
+
+    def __setstate__(self, state) -> None:
+        for name, value in zip(FIELD_NAMES, state):
+            object.__setattr__(self, name, value)
+
+
+_FIELD_TYPES = {name: kind for name, kind, _ in FIELDS}
+
+
+# ========== TABLEAUX STRUCTURÉS ==========
+
+def records_dtype() -> 'np.dtype':
+    """Type NumPy d'une ligne (float64, int32, bool, chaînes de largeur fixe)."""
+    import numpy as np
+
+    columns = []
+    for name, kind, _ in FIELDS:
+        if kind is str:
+            if name in RECORD_STRINGS:
+                columns.append((name, RECORD_STRINGS[name]))
+        elif kind is bool:
+            columns.append((name, '?'))
+        elif kind is int:
+            columns.append((name, '<i4'))
+        else:
+            columns.append((name, '<f8'))
+    return np.dtype(columns)
+
+
+def to_records(tokens: Iterable[Union[TokenParams, Mapping[str, Any]]]) -> 'np.ndarray':
+    """
+    Range des tokens dans un tableau structuré.
+
+    Args:
+        tokens: TokenParams ou dictionnaires (validés au passage)
+
+    Returns:
+        Tableau (n,) de type records_dtype()
+    """
+    import numpy as np
+
+    dtype = records_dtype()
+    names = dtype.names
+    rows = []
+    for token in tokens:
+        if not isinstance(token, TokenParams):
+            token = TokenParams.from_dict(token)
+        rows.append(tuple(getattr(token, name) for name in names))
+    return np.array(rows, dtype=dtype)
+
+
+def from_records(records: 'np.ndarray') -> List[TokenParams]:
+    """Reconstruit les TokenParams d'un tableau structuré (description vide)."""
+    names = records.dtype.names
+    return [TokenParams(**dict(zip(names, row))) for row in records.tolist()]
+
+
+def as_columns(records: 'np.ndarray') -> Dict[str, 'np.ndarray']:
+    """
+    Vues (sans copie) des colonnes numériques et booléennes d'un tableau structuré.
+
+    Le résultat se passe tel quel à calculate_viability_index_vectorized
+    (sans 'name' : la sécurité suit alors l'heuristique sur le rang).
+    """
+    return {
+        name: records[name]
+        for name in records.dtype.names
+        if _FIELD_TYPES[name] is not str
+    }
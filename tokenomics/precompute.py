@@ -0,0 +1,250 @@
+"""
+Cache précalculé des scores des scénarios préconfigurés.
+
+Les scénarios du registre sont statiques : leur score, leurs recommandations
+et leur projection de dilution sont calculés une seule fois (au démarrage, ou
+à la construction via `python -m tokenomics precompute -o scenario_cache.json`)
+puis servis depuis un cache immuable.
+
+Le cache est signé par une empreinte SHA-256 du code de scoring et de
+projection (scoring.py, scenarios.py) et des définitions des scénarios :
+un artefact construit avec une autre version du code ou des scénarios est
+ignoré et le cache est reconstruit.
+
+Un résultat n'est servi que si les paramètres analysés sont identiques à ceux
+du scénario : un formulaire modifié à la main est toujours recalculé.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+from tokenomics import scenarios as scenarios_module
+from tokenomics import scoring as scoring_module
+from tokenomics.scenarios import get_registry, project_rates, project_supply
+from tokenomics.scoring import REQUIRED_PARAMS, OPTIONAL_PARAMS, calculate_viability_index, get_recommendations
+
+
+# Version du format de l'artefact (à incrémenter si sa structure change)
+CACHE_VERSION = 1
+
+# Horizon de la projection de dilution affichée dans l'application
+PROJECTION_YEARS = 5
+
+PROJECTION_FIELDS = ('time', 'supply', 'dilution_pct', 'inflation_rate')
+
+# Paramètres comparés pour décider si un résultat en cache s'applique
+# (le nom compris : le score de sécurité dépend de la base d'audits SECURITY_DB)
+_SCORED_PARAMS = tuple(REQUIRED_PARAMS) + tuple(OPTIONAL_PARAMS) + ('name',)
+
+
+def content_hash(years: int = PROJECTION_YEARS) -> str:
+    """
+    Empreinte du code de scoring/projection et des scénarios enregistrés.
+
+    Args:
+        years: Horizon de projection du cache
+
+    Returns:
+        Empreinte SHA-256 (hexadécimale)
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}:{years}".encode())
+    for module in (scoring_module, scenarios_module):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+
+    registry = get_registry()
+    definitions = [registry.get(name).to_dict() for name in registry.names()]
+    digest.update(json.dumps(definitions, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _readonly(values) -> np.ndarray:
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+class ScenarioCache:
+    """
+    Résultats précalculés des scénarios, indexés par nom et par id.
+
+    Les entrées ne sont jamais modifiées : `get` et `lookup` renvoient des
+    copies du score et des recommandations, et des tableaux en lecture seule
+    pour la projection.
+    """
+
+    __slots__ = ('fingerprint', 'years', '_entries')
+
+    def __init__(self, fingerprint: str, years: int, entries: Dict[str, Dict[str, Any]]):
+        self.fingerprint = fingerprint
+        self.years = years
+        index = {}
+        for entry in entries.values():
+            frozen = MappingProxyType({
+                'id': entry['id'],
+                'name': entry['name'],
+                'params': MappingProxyType(dict(entry['params'])),
+                'score_data': MappingProxyType(dict(entry['score_data'])),
+                'recommendations': tuple(entry['recommendations']),
+                'projection': MappingProxyType({
+                    field: _readonly(entry['projection'][field]) for field in PROJECTION_FIELDS
+                }),
+            })
+            index[entry['id']] = frozen
+            index[entry['name']] = frozen
+        self._entries = MappingProxyType(index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len({entry['id'] for entry in self._entries.values()})
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Résultat précalculé d'un scénario.
+
+        Args:
+            key: Nom ou id du scénario
+
+        Returns:
+            {'score_data', 'recommendations', 'projection'} ou None si inconnu
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return {
+            'score_data': dict(entry['score_data']),
+            'recommendations': list(entry['recommendations']),
+            'projection': dict(entry['projection']),
+        }
+
+    def lookup(self, key: Optional[str], params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Résultat précalculé si `params` correspond exactement au scénario `key`.
+
+        Args:
+            key: Nom ou id du scénario sélectionné (None = aucun)
+            params: Paramètres réellement analysés
+
+        Returns:
+            Même format que `get`, ou None (scénario inconnu ou paramètres modifiés)
+        """
+        entry = self._entries.get(key) if key else None
+        if entry is None:
+            return None
+        cached_params = entry['params']
+        if any(params.get(name) != cached_params.get(name) for name in _SCORED_PARAMS):
+            return None
+        return self.get(key)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Représentation JSON de l'artefact."""
+        entries = {entry['id']: entry for entry in self._entries.values()}
+        return {
+            'version': CACHE_VERSION,
+            'fingerprint': self.fingerprint,
+            'years': self.years,
+            'scenarios': [
+                {
+                    'id': entry['id'],
+                    'name': entry['name'],
+                    'params': dict(entry['params']),
+                    'score_data': dict(entry['score_data']),
+                    'recommendations': list(entry['recommendations']),
+                    'projection': {field: entry['projection'][field].tolist() for field in PROJECTION_FIELDS},
+                }
+                for entry in entries.values()
+            ],
+        }
+
+
+def build_scenario_cache(years: int = PROJECTION_YEARS) -> ScenarioCache:
+    """
+    Calcule score, recommandations et projection de tous les scénarios.
+
+    Args:
+        years: Horizon de la projection de dilution
+
+    Returns:
+        Cache immuable
+    """
+    registry = get_registry()
+    entries = {}
+    for name in registry.names():
+        scenario = registry.get(name)
+        score_data = calculate_viability_index(scenario.params)
+        projection = project_supply(
+            scenario.params['circulating_supply'],
+            project_rates(scenario.projection, years)
+        )
+        entries[scenario.id] = {
+            'id': scenario.id,
+            'name': scenario.name,
+            'params': scenario.params,
+            'score_data': score_data,
+            'recommendations': get_recommendations(score_data),
+            'projection': projection,
+        }
+    return ScenarioCache(content_hash(years), years, entries)
+
+
+def write_scenario_cache(cache: ScenarioCache, path: str) -> None:
+    """Écrit l'artefact JSON (écriture atomique)."""
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache.to_dict(), f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+
+
+def load_scenario_cache(path: str, years: int = PROJECTION_YEARS) -> Optional[ScenarioCache]:
+    """
+    Charge un artefact précalculé s'il correspond au code et aux scénarios actuels.
+
+    Args:
+        path: Fichier JSON produit par `write_scenario_cache`
+        years: Horizon de projection attendu
+
+    Returns:
+        Cache immuable, ou None si absent, illisible ou obsolète
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get('version') != CACHE_VERSION or data.get('fingerprint') != content_hash(years):
+        print(f"Cache de scénarios obsolète ignoré : {path}")
+        return None
+
+    entries = {entry['id']: entry for entry in data.get('scenarios', [])}
+    return ScenarioCache(data['fingerprint'], data['years'], entries)
+
+
+_cache: Optional[ScenarioCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_scenario_cache() -> ScenarioCache:
+    """
+    Retourne le cache des scénarios (construit au premier appel).
+
+    Si TOKENOMICS_SCENARIO_CACHE désigne un artefact à jour, il est chargé ;
+    sinon le cache est calculé en mémoire.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                path = os.environ.get("TOKENOMICS_SCENARIO_CACHE")
+                cache = load_scenario_cache(path) if path else None
+                _cache = cache if cache is not None else build_scenario_cache()
+    return _cache
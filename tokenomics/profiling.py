@@ -0,0 +1,205 @@
+"""
+Mode profiling : capture cProfile + tracemalloc d'une analyse ou d'un job batch.
+
+Activation :
+- variable d'environnement TOKENOMICS_PROFILE=1 (tout le processus),
+- `set_enabled(True)` (ex : option --profile de la CLI),
+- `enabled=True` passé explicitement (ex : case de debug dans la sidebar).
+
+Chaque capture écrit dans TOKENOMICS_PROFILE_DIR (défaut : .tokenomics_profiles) :
+- `<horodatage>-<label>.prof` : stats cProfile brutes, triables avec
+  `python -m pstats` ou snakeviz,
+- `<horodatage>-<label>.txt` : top des fonctions (temps cumulé et propre) et
+  top des sites d'allocation mémoire.
+
+Seules les TOKENOMICS_PROFILE_KEEP captures les plus récentes sont conservées.
+tracemalloc étant global au processus, une seule capture peut être active à la
+fois : les demandes concurrentes sont ignorées.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Iterator, Callable
+
+
+DEFAULT_PROFILE_DIR = ".tokenomics_profiles"
+DEFAULT_KEEP = 50
+
+# Nombre de lignes dans les rapports texte
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+
+_enabled = os.environ.get("TOKENOMICS_PROFILE", "").lower() in ("1", "true", "yes")
+_capture_lock = threading.Lock()
+
+
+def set_enabled(enabled: bool) -> None:
+    """Active ou désactive le profiling pour tout le processus."""
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """Indique si le profiling est activé globalement."""
+    return _enabled
+
+
+def get_profile_dir() -> str:
+    """Répertoire de sortie des rapports."""
+    return os.environ.get("TOKENOMICS_PROFILE_DIR", DEFAULT_PROFILE_DIR)
+
+
+class ProfileReport:
+    """Résultat d'une capture (chemins des fichiers et métriques globales)."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.prof_path = None
+        self.text_path = None
+        self.duration_s = 0.0
+        self.peak_memory_bytes = 0
+
+
+def _safe_label(label: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', label).strip('_') or "profile"
+
+
+# Préfixe des captures écrites par _write_reports (horodatage trié chronologiquement)
+_CAPTURE_STEM = re.compile(r'^\d{8}-\d{6}-\d{6}-[A-Za-z0-9_.-]+$')
+
+
+def apply_retention(directory: str, keep: int) -> None:
+    """
+    Supprime les captures les plus anciennes au-delà de `keep`.
+
+    Une capture = le couple .prof/.txt partageant le même préfixe. Seuls les
+    fichiers nommés comme ceux de _write_reports sont concernés : les autres
+    fichiers du répertoire ne sont jamais supprimés.
+    """
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+
+    stems = sorted({
+        stem for stem, extension in map(os.path.splitext, names)
+        if extension in ('.prof', '.txt') and _CAPTURE_STEM.match(stem)
+    })
+    for stem in stems[:max(0, len(stems) - keep)]:
+        for extension in ('.prof', '.txt'):
+            try:
+                os.remove(os.path.join(directory, stem + extension))
+            except OSError:
+                pass
+
+
+def _write_reports(report: ProfileReport, profiler: cProfile.Profile, snapshot, directory: str) -> None:
+    os.makedirs(directory, exist_ok=True)
+    stem = f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{_safe_label(report.label)}"
+    report.prof_path = os.path.join(directory, f"{stem}.prof")
+    report.text_path = os.path.join(directory, f"{stem}.txt")
+
+    profiler.dump_stats(report.prof_path)
+
+    buffer = io.StringIO()
+    buffer.write(f"Profil : {report.label}\n")
+    buffer.write(f"Durée : {report.duration_s * 1000:.1f} ms\n")
+    buffer.write(f"Pic mémoire (tracemalloc) : {report.peak_memory_bytes / 1024:.1f} Ko\n")
+
+    stats = pstats.Stats(profiler, stream=buffer)
+    stats.strip_dirs()
+    buffer.write(f"\n===== Top {TOP_FUNCTIONS} fonctions (temps cumulé) =====\n")
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+    buffer.write(f"\n===== Top {TOP_FUNCTIONS} fonctions (temps propre) =====\n")
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+
+    buffer.write(f"\n===== Top {TOP_ALLOCATIONS} sites d'allocation =====\n")
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ))
+    for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        buffer.write(f"{stat.size / 1024:10.1f} Ko  {stat.count:8d} blocs  {frame.filename}:{frame.lineno}\n")
+
+    with open(report.text_path, 'w', encoding='utf-8') as f:
+        f.write(buffer.getvalue())
+
+
+@contextmanager
+def profile_session(
+    label: str,
+    enabled: Optional[bool] = None,
+    directory: Optional[str] = None,
+    keep: Optional[int] = None
+) -> Iterator[Optional[ProfileReport]]:
+    """
+    Profile le bloc avec cProfile et tracemalloc.
+
+    Args:
+        label: Nom de la capture (utilisé dans le nom des fichiers)
+        enabled: Force l'activation (None = réglage global / variable d'environnement)
+        directory: Répertoire de sortie (défaut : get_profile_dir())
+        keep: Nombre de captures conservées (défaut : TOKENOMICS_PROFILE_KEEP ou 50)
+
+    Returns:
+        ProfileReport (complété à la sortie du bloc) ou None si pas de capture
+    """
+    if not (_enabled if enabled is None else enabled) or not _capture_lock.acquire(blocking=False):
+        yield None
+        return
+
+    report = ProfileReport(label)
+    started_tracemalloc = not tracemalloc.is_tracing()
+    try:
+        if started_tracemalloc:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield report
+        finally:
+            profiler.disable()
+            report.duration_s = time.perf_counter() - start
+            report.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            snapshot = tracemalloc.take_snapshot()
+            directory = directory or get_profile_dir()
+            _write_reports(report, profiler, snapshot, directory)
+            apply_retention(directory, keep if keep is not None else int(
+                os.environ.get("TOKENOMICS_PROFILE_KEEP", DEFAULT_KEEP)))
+    finally:
+        if started_tracemalloc:
+            tracemalloc.stop()
+        _capture_lock.release()
+
+
+def profiled(label: str, enabled: Optional[Callable[[], Optional[bool]]] = None):
+    """
+    Décorateur : profile chaque appel de la fonction.
+
+    Args:
+        label: Nom de la capture
+        enabled: Callable retournant l'activation forcée (None = réglage global)
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            force = enabled() if enabled is not None else None
+            if not (_enabled if force is None else force):
+                return fn(*args, **kwargs)
+            with profile_session(label, enabled=True):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
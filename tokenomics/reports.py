@@ -0,0 +1,735 @@
+"""
+Rapports statiques d'un portefeuille de tokens (site HTML ou archive .zip).
+
+    python -m tokenomics report --scenarios all --portfolio tokens.jsonl -o rapports.zip
+
+Chaque token produit une page `tokens/<slug>.html` (score, scores détaillés,
+recommandations et quatre graphiques interactifs) ; `index.html` résume le
+portefeuille (répartition des scores, tableau trié avec liens vers les pages).
+Toutes les pages partagent un seul bundle plotly.js et le template de mise en
+page Plotly (`assets/`) au lieu de les embarquer chacune : une page pèse
+quelques dizaines de Ko.
+
+Le rendu (scoring, spécifications Plotly sans validation, gabarits
+`string.Template` compilés une seule fois) est réparti par lots dans un pool
+de processus ; le processus principal écrit les fichiers dans un répertoire
+ou une archive, remplacés de façon atomique à la fin du job.
+
+`export_html` produit le rapport autonome d'un seul token (export de
+l'application), depuis un gabarit précompilé et mis en cache par empreinte
+des paramètres.
+
+Les images statiques des graphiques (PNG, SVG, PDF) nécessitent kaleido
+(`pip install kaleido`). Le rapport HTML s'imprime aussi directement en PDF
+depuis le navigateur.
+"""
+
+import datetime
+import hashlib
+import html
+import json
+import os
+import shutil
+import sys
+import threading
+import zipfile
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from string import Template
+from typing import Dict, Any, List, Optional, Iterable, Sequence, Tuple, Union
+
+from tokenomics.profiling import profiled
+from tokenomics.scenarios import get_registry
+from tokenomics.scoring import REQUIRED_PARAMS, calculate_viability_index, get_recommendations
+
+
+# Graphiques de chaque page token, dans l'ordre d'affichage
+REPORT_CHARTS = ('gauge', 'breakdown', 'supply', 'dilution')
+
+IMAGE_FORMATS = ('png', 'svg', 'pdf')
+
+# Tokens rendus par tâche du pool (amortit la sérialisation entre processus)
+DEFAULT_CHUNK_SIZE = 25
+
+# Composantes affichées dans les tableaux (libellé, clé de score_data/weights)
+_COMPONENTS = (
+    ('Inflation', 'inflation'),
+    ('Distribution', 'distribution'),
+    ('Utilité', 'utility'),
+    ('Gouvernance', 'governance'),
+    ('Incentives', 'incentives'),
+    ('Liquidité', 'liquidity'),
+    ('Adoption', 'adoption'),
+    ('Sécurité', 'security'),
+)
+
+_VERDICT_COLORS = {'green': '#10b981', 'orange': '#f59e0b', 'red': '#ef4444'}
+
+
+# ========== GABARITS ==========
+
+_STYLE = """
+body { font-family: Arial, sans-serif; margin: 40px; color: #111827; }
+h1 { color: #6366f1; }
+h2 { color: #4338ca; margin-top: 30px; }
+a { color: #4338ca; }
+.score { font-size: 48px; font-weight: bold; }
+.metric { display: inline-block; margin: 10px 20px; }
+.metric-label { font-weight: bold; }
+.charts { display: flex; flex-wrap: wrap; gap: 10px; }
+.chart { flex: 1 1 480px; min-width: 0; }
+table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+th, td { border: 1px solid #ddd; padding: 8px 12px; text-align: left; }
+th { background-color: #6366f1; color: white; }
+td.num { text-align: right; }
+.recommendation { margin: 10px 0; padding: 10px; background: #f3f4f6; border-radius: 5px; }
+footer { margin-top: 50px; text-align: center; color: gray; font-size: 12px; }
+@media print { body { margin: 20px; } .chart { break-inside: avoid; } }
+"""
+
+_TOKEN_PAGE = Template("""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>Tokenomics Analysis - $name</title>
+<link rel="stylesheet" href="../assets/report.css">
+<script src="../assets/plotly.min.js"></script>
+<script src="../assets/report.js"></script>
+</head>
+<body>
+<p><a href="../index.html">← Portefeuille</a></p>
+<h1>🪙 Tokenomics Analysis Report</h1>
+<h2>$name ($symbol)</h2>
+<p><strong>Date :</strong> $generated_at</p>
+
+<h2>📊 Score Final</h2>
+<div class="score" style="color: $verdict_color">$final_score/100</div>
+<p><strong>Verdict :</strong> $verdict</p>
+
+<h2>📈 Métriques Principales</h2>
+<div class="metric"><div class="metric-label">Prix :</div>$price</div>
+<div class="metric"><div class="metric-label">Market Cap :</div>$market_cap</div>
+<div class="metric"><div class="metric-label">Circulating Supply :</div>$circulating_supply</div>
+<div class="metric"><div class="metric-label">Max Supply :</div>$max_supply</div>
+
+<div class="charts">
+$chart_divs
+</div>
+
+<h2>🎯 Scores Détaillés</h2>
+<table>
+<tr><th>Composante</th><th>Score</th><th>Pondération</th><th>Commentaire</th></tr>
+$component_rows
+</table>
+
+<h2>💡 Recommandations</h2>
+$recommendations
+$images
+<footer>Généré par <strong>Tokenomics Analyzer</strong> |
+⚠️ Cet outil est fourni à titre éducatif. Pas de conseil en investissement. DYOR.</footer>
+<script>renderCharts($charts);</script>
+</body>
+</html>
+""")
+
+_SUMMARY_PAGE = Template("""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>Tokenomics Analysis - Portefeuille</title>
+<link rel="stylesheet" href="assets/report.css">
+<script src="assets/plotly.min.js"></script>
+<script src="assets/report.js"></script>
+</head>
+<body>
+<h1>🪙 Portefeuille : $count token(s)</h1>
+<p><strong>Date :</strong> $generated_at — score moyen <strong>$mean_score</strong>, médian <strong>$median_score</strong></p>
+<p>$verdict_counts</p>
+<div id="chart-histogram" class="chart"></div>
+
+<table>
+<tr><th>#</th><th>Token</th><th>Symbole</th><th>Score</th><th>Verdict</th>$component_headers</tr>
+$rows
+</table>
+$failures
+<footer>Généré par <strong>Tokenomics Analyzer</strong> |
+⚠️ Cet outil est fourni à titre éducatif. Pas de conseil en investissement. DYOR.</footer>
+<script>renderCharts($charts);</script>
+</body>
+</html>
+""")
+
+_REPORT_JS = Template("""window.TOKENOMICS_TEMPLATE = $template;
+
+function renderCharts(charts) {
+  Object.keys(charts).forEach(function (id) {
+    var spec = charts[id];
+    spec.layout.template = window.TOKENOMICS_TEMPLATE;
+    Plotly.newPlot(id, spec.data, spec.layout, {responsive: true, displaylogo: false});
+  });
+}
+""")
+
+
+# Rapport autonome d'un token (export depuis l'application) : styles intégrés, sans JS
+_EXPORT_PAGE = Template("""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<title>Tokenomics Analysis - $name</title>
+<style>
+""" + _STYLE.lstrip() + """</style>
+</head>
+<body>
+<h1>🪙 Tokenomics Analysis Report</h1>
+<h2>$name ($symbol)</h2>
+<p><strong>Date :</strong> $generated_at</p>
+
+<h2>📊 Score Final</h2>
+<div class="score" style="color: $verdict_color">$final_score/100</div>
+<p><strong>Verdict :</strong> $verdict</p>
+
+<h2>📈 Métriques Principales</h2>
+<div class="metric"><div class="metric-label">Prix :</div>$price</div>
+<div class="metric"><div class="metric-label">Market Cap :</div>$market_cap</div>
+<div class="metric"><div class="metric-label">Circulating Supply :</div>$circulating_supply</div>
+<div class="metric"><div class="metric-label">Max Supply :</div>$max_supply</div>
+
+<h2>🎯 Scores Détaillés</h2>
+<table>
+<tr><th>Composante</th><th>Score</th><th>Pondération</th><th>Commentaire</th></tr>
+$component_rows
+</table>
+
+<h2>💡 Recommandations</h2>
+$recommendations
+
+<footer>Généré par <strong>Tokenomics Analyzer</strong> |
+<a href="https://github.com/GuillaumeVerb/tokenomics-analysis">GitHub</a><br>
+⚠️ Cet outil est fourni à titre éducatif. Pas de conseil en investissement. DYOR.</footer>
+</body>
+</html>
+""")
+
+
+def _escape(value: Any) -> str:
+    return html.escape(str(value), quote=True)
+
+
+def _chart_json(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Spécification sans template (fourni une seule fois par assets/report.js)."""
+    return {
+        'data': spec['data'],
+        'layout': {key: value for key, value in spec['layout'].items() if key != 'template'},
+    }
+
+
+def _script_json(value: Any) -> str:
+    """JSON intégrable dans une balise <script> (tableaux numpy acceptés)."""
+    from plotly.io.json import to_json_plotly
+    return to_json_plotly(value).replace('</', '<\\/')
+
+
+def slugify(value: str) -> str:
+    """Nom de fichier sûr pour un identifiant de token."""
+    slug = "".join(c if c.isalnum() or c in '-_.' else '-' for c in str(value).strip().lower())
+    return slug.strip('-.') or 'token'
+
+
+# ========== PORTEFEUILLE ==========
+
+def _entry(entry_id: str, params: Dict[str, Any], scenario: Optional[str] = None) -> Dict[str, Any]:
+    return {'id': entry_id, 'params': params, 'scenario': scenario}
+
+
+def scenario_entries(names: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Entrées de portefeuille pour des scénarios préconfigurés.
+
+    Args:
+        names: Noms ou ids des scénarios (inconnus ignorés avec un message)
+    """
+    registry = get_registry()
+    entries = []
+    for name in names:
+        scenario = registry.get(name)
+        if scenario is None:
+            print(f"Scénario inconnu ignoré : {name}", file=sys.stderr)
+            continue
+        entries.append(_entry(scenario.id, scenario.params, scenario.name))
+    return entries
+
+
+def load_portfolio(path: str) -> List[Dict[str, Any]]:
+    """
+    Lit un portefeuille JSON (liste) ou JSONL (un token par ligne).
+
+    Chaque élément est soit {"id": ..., "params": {...}}, soit directement
+    un dictionnaire de paramètres de scoring (id = symbole ou nom).
+    Les éléments invalides sont ignorés avec un message.
+
+    Args:
+        path: Fichier .json ou .jsonl
+
+    Returns:
+        Entrées {'id', 'params', 'scenario'}
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.json'):
+            items = [(position, item) for position, item in enumerate(json.load(f), 1)]
+        else:
+            items = [(line_number, line) for line_number, line in enumerate(f, 1) if line.strip()]
+
+    entries = []
+    for position, item in items:
+        try:
+            if isinstance(item, str):
+                item = json.loads(item)
+            params = item.get('params', item) if isinstance(item, dict) else None
+            if not isinstance(params, dict):
+                raise ValueError("objet JSON attendu")
+            missing = [key for key in REQUIRED_PARAMS if key not in params]
+            if missing:
+                raise ValueError(f"paramètres manquants ({', '.join(missing)})")
+        except ValueError as e:
+            print(f"Token ignoré ({path}:{position}) : {e}", file=sys.stderr)
+            continue
+        entry_id = item.get('id') or params.get('symbol') or params.get('name') or f"token-{position}"
+        entries.append(_entry(str(entry_id), params))
+    return entries
+
+
+def coin_entries(
+    coins: Iterable[str],
+    max_workers: int = 4,
+    cache_dir: Optional[str] = ".tokenomics_cache",
+    cache_ttl: Optional[float] = 24 * 3600
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Entrées de portefeuille depuis CoinGecko (requêtes parallèles, cache disque).
+
+    Returns:
+        (entrées dans l'ordre demandé, nombre d'échecs)
+    """
+    from tokenomics.api import parse_coingecko_to_params, enhance_params_with_known_data, normalize_coin_input
+    from tokenomics.batch import FetchCache, fetch_many
+
+    coin_ids = list(dict.fromkeys(normalize_coin_input(c) for c in coins))
+    cache = FetchCache(cache_dir, cache_ttl) if cache_dir else None
+    fetched = {}
+    failed = 0
+    for coin_id, data in fetch_many(coin_ids, max_workers=max_workers, cache=cache):
+        try:
+            if data is None:
+                raise ValueError("données indisponibles")
+            params = parse_coingecko_to_params(data)
+            fetched[coin_id] = enhance_params_with_known_data(params, coin_id)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"Token ignoré '{coin_id}' : {e}", file=sys.stderr)
+            failed += 1
+    return [_entry(coin_id, fetched[coin_id]) for coin_id in coin_ids if coin_id in fetched], failed
+
+
+# ========== RENDU ==========
+
+def _format_usd(value: Optional[float], decimals: int) -> str:
+    return f"${value:,.{decimals}f}" if value else "N/A"
+
+
+def _report_fields(
+    params: Dict[str, Any],
+    score_data: Dict[str, Any],
+    recommendations: List[str],
+    name: str,
+    generated_at: str
+) -> Dict[str, Any]:
+    """Champs communs aux gabarits de rapport d'un token (valeurs déjà échappées)."""
+    weights = score_data.get('weights', {})
+    component_rows = "\n".join(
+        f"<tr><td>{label}</td><td>{score_data[f'{key}_score']:.1f}/100</td>"
+        f"<td>{weights.get(key, 0) * 100:.0f}%</td><td>{_escape(score_data.get(f'{key}_comment', ''))}</td></tr>"
+        for label, key in _COMPONENTS if f'{key}_score' in score_data
+    )
+    return {
+        'name': _escape(name),
+        'symbol': _escape(params.get('symbol') or 'N/A'),
+        'generated_at': generated_at,
+        'verdict_color': _VERDICT_COLORS.get(score_data['verdict_color'], '#111827'),
+        'final_score': score_data['final_score'],
+        'verdict': _escape(score_data['verdict']),
+        'price': _format_usd(params.get('price_usd'), 2),
+        'market_cap': _format_usd(params.get('market_cap_usd'), 0),
+        'circulating_supply': f"{params['circulating_supply']:,.0f}",
+        'max_supply': 'Illimité' if not params['max_supply'] else f"{params['max_supply']:,.0f}",
+        'component_rows': component_rows,
+        'recommendations': "\n".join(f'<div class="recommendation">{_escape(rec)}</div>' for rec in recommendations),
+    }
+
+
+def build_token_report(
+    entry: Dict[str, Any],
+    generated_at: str,
+    images: Optional[str] = None
+) -> Tuple[Dict[str, Any], List[Tuple[str, Union[str, bytes]]]]:
+    """
+    Score un token et produit sa page (et ses images).
+
+    Args:
+        entry: Entrée de portefeuille avec son 'slug'
+        generated_at: Date affichée
+        images: Format des images statiques ('png', 'svg', 'pdf') ou None
+
+    Returns:
+        (ligne du résumé, [(chemin relatif, contenu)])
+    """
+    from tokenomics.visualizations import (
+        gauge_chart_spec, score_breakdown_spec, supply_distribution_spec, dilution_projection_spec
+    )
+
+    params = entry['params']
+    slug = entry['slug']
+    score_data = calculate_viability_index(params)
+    recommendations = get_recommendations(score_data)
+
+    specs = {
+        'gauge': gauge_chart_spec(score_data['final_score']),
+        'breakdown': score_breakdown_spec(score_data),
+        'supply': supply_distribution_spec(params['circulating_supply'], params['total_supply'], params['max_supply']),
+        'dilution': dilution_projection_spec(
+            params['circulating_supply'], entry.get('scenario'), params['inflation_rate'], years=5
+        ),
+    }
+
+    files = []
+    image_links = ''
+    if images:
+        import plotly.io as pio
+        links = []
+        for chart in REPORT_CHARTS:
+            path = f"images/{slug}-{chart}.{images}"
+            files.append((path, pio.to_image(specs[chart], format=images, validate=False)))
+            links.append(f'<a href="../{path}">{chart}.{images}</a>')
+        image_links = f"<h2>🖼️ Images</h2>\n<p>{' | '.join(links)}</p>\n"
+
+    name = params.get('name') or entry.get('scenario') or entry['id']
+    symbol = params.get('symbol') or 'N/A'
+    page = _TOKEN_PAGE.substitute(
+        _report_fields(params, score_data, recommendations, name, generated_at),
+        chart_divs="\n".join(f'<div id="chart-{chart}" class="chart"></div>' for chart in REPORT_CHARTS),
+        images=image_links,
+        charts=_script_json({f"chart-{chart}": _chart_json(specs[chart]) for chart in REPORT_CHARTS}),
+    )
+    files.append((f"tokens/{slug}.html", page))
+
+    row = {
+        'id': entry['id'],
+        'slug': slug,
+        'name': name,
+        'symbol': symbol,
+        'final_score': score_data['final_score'],
+        'verdict': score_data['verdict'],
+        'verdict_color': score_data['verdict_color'],
+    }
+    for _, key in _COMPONENTS:
+        row[f'{key}_score'] = score_data.get(f'{key}_score')
+    return row, files
+
+
+def _render_chunk(entries: List[Dict[str, Any]], generated_at: str, images: Optional[str]) -> List[Tuple]:
+    """Tâche du pool : rend un lot de tokens (les erreurs sont renvoyées, pas levées)."""
+    results = []
+    for entry in entries:
+        try:
+            results.append(('ok',) + build_token_report(entry, generated_at, images))
+        except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+            results.append(('error', entry['id'], str(e)))
+    return results
+
+
+def build_summary_page(rows: List[Dict[str, Any]], generated_at: str, failures: Sequence[Tuple[str, str]] = ()) -> str:
+    """
+    Page de synthèse du portefeuille (index.html).
+
+    Args:
+        rows: Lignes produites par `build_token_report`
+        generated_at: Date affichée
+        failures: (id, erreur) des tokens non rendus
+
+    Returns:
+        Document HTML
+    """
+    import numpy as np
+    from tokenomics.visualizations import score_histogram_spec
+
+    rows = sorted(rows, key=lambda row: -row['final_score'])
+    scores = [row['final_score'] for row in rows]
+    verdicts: Dict[str, int] = {}
+    for row in rows:
+        verdicts[row['verdict']] = verdicts.get(row['verdict'], 0) + 1
+
+    table_rows = "\n".join(
+        f"<tr><td>{rank}</td><td><a href=\"tokens/{row['slug']}.html\">{_escape(row['name'])}</a></td>"
+        f"<td>{_escape(row['symbol'])}</td>"
+        f"<td class=\"num\" style=\"color: {_VERDICT_COLORS.get(row['verdict_color'], '#111827')}\">"
+        f"<strong>{row['final_score']:.1f}</strong></td><td>{_escape(row['verdict'])}</td>"
+        + "".join(
+            f"<td class=\"num\">{row[f'{key}_score']:.0f}</td>" if row.get(f'{key}_score') is not None else "<td></td>"
+            for _, key in _COMPONENTS
+        )
+        + "</tr>"
+        for rank, row in enumerate(rows, 1)
+    )
+    failure_block = ""
+    if failures:
+        items = "\n".join(f"<li>{_escape(token_id)} : {_escape(error)}</li>" for token_id, error in failures)
+        failure_block = f"<h2>⚠️ Tokens non rendus ({len(failures)})</h2>\n<ul>\n{items}\n</ul>\n"
+
+    return _SUMMARY_PAGE.substitute(
+        count=len(rows),
+        generated_at=generated_at,
+        mean_score=f"{np.mean(scores):.1f}" if scores else "N/A",
+        median_score=f"{np.median(scores):.1f}" if scores else "N/A",
+        verdict_counts=" · ".join(f"{_escape(verdict)} : {count}" for verdict, count in verdicts.items()),
+        component_headers="".join(f"<th>{label}</th>" for label, _ in _COMPONENTS),
+        rows=table_rows,
+        failures=failure_block,
+        charts=_script_json({'chart-histogram': _chart_json(score_histogram_spec(scores))}),
+    )
+
+
+def _asset_files() -> List[Tuple[str, str]]:
+    """Fichiers partagés par toutes les pages."""
+    from plotly.offline import get_plotlyjs
+    from tokenomics.visualizations import _layout_template
+
+    return [
+        ('assets/plotly.min.js', get_plotlyjs()),
+        ('assets/report.js', _REPORT_JS.substitute(template=_script_json(_layout_template()))),
+        ('assets/report.css', _STYLE.lstrip()),
+    ]
+
+
+class _ReportWriter:
+    """
+    Écrit les fichiers du rapport dans un répertoire ou une archive .zip.
+
+    Tout est écrit dans un emplacement temporaire remplacé à la fermeture :
+    un job interrompu laisse le rapport précédent intact.
+    """
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.is_zip = output_path.lower().endswith('.zip')
+        self.tmp_path = f"{output_path.rstrip(os.sep)}.tmp{os.getpid()}"
+        self.bytes_written = 0
+        if self.is_zip:
+            self._zip = zipfile.ZipFile(self.tmp_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+        else:
+            os.makedirs(self.tmp_path)
+
+    def write(self, relative_path: str, content: Union[str, bytes]) -> None:
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        self.bytes_written += len(data)
+        if self.is_zip:
+            self._zip.writestr(relative_path, data)
+            return
+        path = os.path.join(self.tmp_path, *relative_path.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    def close(self, commit: bool = True) -> None:
+        if self.is_zip:
+            self._zip.close()
+            if commit:
+                os.replace(self.tmp_path, self.output_path)
+            else:
+                os.remove(self.tmp_path)
+            return
+        if not commit:
+            shutil.rmtree(self.tmp_path, ignore_errors=True)
+            return
+        # Un répertoire ne peut pas être remplacé atomiquement s'il n'est pas vide
+        previous = None
+        if os.path.exists(self.output_path):
+            previous = f"{self.tmp_path}.old"
+            os.replace(self.output_path, previous)
+        os.replace(self.tmp_path, self.output_path)
+        if previous:
+            shutil.rmtree(previous, ignore_errors=True)
+
+
+def _require_kaleido() -> None:
+    try:
+        import kaleido  # noqa: F401
+    except ImportError:
+        raise ImportError("Les images statiques nécessitent kaleido : pip install kaleido")
+
+
+@profiled("reports.render_reports")
+def render_reports(
+    entries: Sequence[Dict[str, Any]],
+    output_path: str,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    images: Optional[str] = None,
+    progress: bool = True
+) -> Dict[str, Any]:
+    """
+    Rend les rapports d'un portefeuille et leur page de synthèse.
+
+    Args:
+        entries: Entrées {'id', 'params', 'scenario'} (voir load_portfolio,
+            scenario_entries, coin_entries)
+        output_path: Répertoire du site statique, ou fichier .zip
+        processes: Taille du pool (défaut : nombre de cœurs, 1 = sans pool)
+        chunk_size: Tokens par tâche du pool
+        images: Format des images des graphiques ('png', 'svg', 'pdf'), nécessite kaleido
+        progress: Afficher l'avancement sur stderr
+
+    Returns:
+        {'reports', 'failed', 'bytes', 'output'}
+    """
+    from tokenomics.batch import ProgressReporter
+
+    if images is not None:
+        if images not in IMAGE_FORMATS:
+            raise ValueError(f"Format d'image non supporté : {images} (formats : {', '.join(IMAGE_FORMATS)})")
+        _require_kaleido()
+
+    # Slugs uniques attribués avant la répartition dans le pool
+    entries = [dict(entry) for entry in entries]
+    used = set()
+    for entry in entries:
+        base = slug = slugify(entry['id'])
+        suffix = 1
+        while slug in used:
+            suffix += 1
+            slug = f"{base}-{suffix}"
+        used.add(slug)
+        entry['slug'] = slug
+
+    generated_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M')
+    processes = processes or os.cpu_count() or 1
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+    reporter = ProgressReporter(len(entries), enabled=progress, every=max(chunk_size, 25))
+    rows: List[Dict[str, Any]] = []
+    failures: List[Tuple[str, str]] = []
+
+    def consume(results: List[Tuple]) -> None:
+        for result in results:
+            if result[0] == 'ok':
+                _, row, files = result
+                for relative_path, content in files:
+                    writer.write(relative_path, content)
+                rows.append(row)
+                reporter.update()
+            else:
+                _, token_id, error = result
+                print(f"Rapport non rendu pour '{token_id}' : {error}", file=sys.stderr)
+                failures.append((token_id, error))
+                reporter.update(ok=False)
+
+    writer = _ReportWriter(output_path)
+    try:
+        for relative_path, content in _asset_files():
+            writer.write(relative_path, content)
+
+        if processes == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                consume(_render_chunk(chunk, generated_at, images))
+        else:
+            # Au plus 2 lots en attente par processus : mémoire bornée
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(executor.submit(_render_chunk, chunk, generated_at, images))
+                    if len(pending) >= processes * 2:
+                        consume(pending.popleft().result())
+                while pending:
+                    consume(pending.popleft().result())
+
+        writer.write('index.html', build_summary_page(rows, generated_at, failures))
+    except BaseException:
+        writer.close(commit=False)
+        raise
+    writer.close()
+
+    return {
+        'reports': len(rows),
+        'failed': len(failures),
+        'bytes': writer.bytes_written,
+        'output': output_path,
+    }
+
+
+# ========== EXPORT UNITAIRE ==========
+
+# Nombre de rapports exportés conservés en mémoire (0 = cache désactivé)
+EXPORT_CACHE_SIZE = 64
+
+# Document en cache découpé autour de la date, insérée à chaque export
+_export_cache: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+_export_lock = threading.Lock()
+
+# Marqueur de la date dans les documents en cache
+_DATE_MARKER = "\x00generated_at\x00"
+
+
+def params_hash(params: Dict[str, Any]) -> str:
+    """Empreinte stable d'un jeu de paramètres (clé du cache d'export)."""
+    payload = json.dumps(params, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def export_html(
+    params: Dict[str, Any],
+    score_data: Optional[Dict[str, Any]] = None,
+    recommendations: Optional[List[str]] = None
+) -> str:
+    """
+    Rapport HTML autonome d'un token, à imprimer en PDF depuis le navigateur.
+
+    Le document est produit depuis le gabarit précompilé et mis en cache par
+    empreinte des paramètres : un second export des mêmes paramètres (autre
+    rerun, autre session, job batch) réutilise le document déjà généré, seule
+    la date d'export est insérée à chaque appel.
+
+    Args:
+        params: Paramètres du token
+        score_data: Résultats de calculate_viability_index() (calculés si absents)
+        recommendations: Recommandations (calculées si absentes)
+
+    Returns:
+        Document HTML
+    """
+    generated_at = datetime.datetime.now().strftime('%Y-%m-%d %H:%M')
+    key = params_hash(params)
+    with _export_lock:
+        parts = _export_cache.get(key)
+        if parts is not None:
+            _export_cache.move_to_end(key)
+            return generated_at.join(parts)
+
+    if score_data is None:
+        score_data = calculate_viability_index(params)
+    if recommendations is None:
+        recommendations = get_recommendations(score_data)
+    parts = tuple(_EXPORT_PAGE.substitute(_report_fields(
+        params, score_data, recommendations,
+        params.get('name') or 'Token',
+        _DATE_MARKER
+    )).split(_DATE_MARKER))
+
+    if EXPORT_CACHE_SIZE > 0:
+        with _export_lock:
+            _export_cache[key] = parts
+            while len(_export_cache) > EXPORT_CACHE_SIZE:
+                _export_cache.popitem(last=False)
+    return generated_at.join(parts)
+
+
+def clear_export_cache() -> None:
+    """Vide le cache des rapports exportés."""
+    with _export_lock:
+        _export_cache.clear()
@@ -2,146 +2,91 @@
 Scénarios préconfigurés pour l'analyse de tokenomics.
 
 Deux catégories :
-- Catégorie A : Scénarios structurels (7)
+- Catégorie A : Scénarios structurels (10)
 - Catégorie B : Scénarios inflationnistes paramétriques (8)
+
+Les scénarios sont décrits par des données (id stable, nom affiché, catégorie,
+paramètres, spécification de projection d'inflation) et indexés une seule fois
+dans un registre : la recherche par nom ou par id est en O(1).
+
+Des scénarios personnalisés peuvent être ajoutés depuis des fichiers JSON ou
+YAML, via `load_scenarios_file()` ou la variable d'environnement
+TOKENOMICS_SCENARIOS_PATH (chemins séparés par os.pathsep) :
+
+    scenarios:
+      - id: mon-protocole
+        name: "Mon protocole"
+        category: "🧩 Scénarios personnalisés"
+        projection: {type: schedule, rates: [12, 9, 6], tail: 3}
+        params:
+          inflation_rate: 12.0
+          team_allocation: 18.0
+
+Les paramètres omis reprennent ceux du scénario par défaut.
+
+Types de projection :
+- constant : {"rate": r} → r chaque année
+- schedule : {"rates": [...], "tail": r} → taux listés, puis `tail` (sans
+  `tail`, le dernier taux listé est prolongé)
+- halving : {"initial_rate": r, "period_years": n} → taux divisé par 2 tous les n ans
+
+Le moteur de projection (`project_supply`, `project_scenarios`,
+`project_tokens`) calcule supply, dilution et inflation sur un horizon
+quelconque, au pas annuel, mensuel ou journalier, pour un ou plusieurs
+scénarios/tokens à la fois (tableaux NumPy 2-D, une ligne par série).
 """
 
-from typing import Dict, Any, List, Tuple
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional, Sequence, Union
 
+import numpy as np
 
-def get_scenario_categories() -> Dict[str, List[str]]:
-    """Retourne les catégories de scénarios."""
-    return {
-        "📊 Scénarios Structurels": [
-            "Projet early-stage",
-            "Token utilitaire fort (ETH-like)",
-            "Modèle DeFi inflationniste (Curve-like)",
-            "Modèle Pendle-like",
-            "Restaking / Sécurité économique (EigenLayer-like)",
-            "Gouvernance capturée",
-            "Token mature (Bitcoin/Ethereum-like)",
-            "Meme coin / Community token",
-            "RWA Tokenization",
-            "Modèle Hyperliquid (100% community)"
-        ],
-        "📈 Scénarios Inflationnistes": [
-            "Inflation stable 2% / an",
-            "Inflation stable 5% / an",
-            "Inflation stable 10% / an",
-            "Inflation haute 20% / an",
-            "Inflation décroissante",
-            "Inflation avec halving",
-            "Inflation seasonal farming",
-            "Inflation négative / burn dynamique"
-        ]
-    }
 
+STRUCTURAL_CATEGORY = "📊 Scénarios Structurels"
+INFLATIONARY_CATEGORY = "📈 Scénarios Inflationnistes"
+CUSTOM_CATEGORY = "🧩 Scénarios personnalisés"
 
-def get_all_scenarios() -> List[str]:
-    """Retourne la liste complète de tous les scénarios."""
-    categories = get_scenario_categories()
-    all_scenarios = []
-    for scenarios in categories.values():
-        all_scenarios.extend(scenarios)
-    return all_scenarios
+PROJECTION_TYPES = ('constant', 'schedule', 'halving')
 
+# Paramètres utilisés pour un nom inconnu et comme base des scénarios personnalisés
+DEFAULT_SCENARIO_PARAMS: Dict[str, Any] = {
+    "circulating_supply": 500_000_000,
+    "total_supply": 1_000_000_000,
+    "max_supply": 1_000_000_000,
+    "inflation_rate": 5.0,
+    "emission_years_left": 5,
+    "team_allocation": 15.0,
+    "vesting_years": 3,
+    "top_10_concentration": 30.0,
+    "utility_gas": False,
+    "utility_staking": True,
+    "utility_governance": True,
+    "utility_collateral": False,
+    "utility_discount": False,
+    "gov_timelock": True,
+    "gov_multisig": True,
+    "gov_dao_active": True,
+    "incentive_lock": False,
+    "incentive_staking": True,
+    "incentive_burn": False,
+    "lock_duration_months": 0,
+    "burn_rate": 0.0,
+    "description": "Scénario par défaut"
+}
 
-def get_inflation_projection(scenario_name: str, years: int = 5) -> List[float]:
-    """
-    Génère une projection d'inflation annuelle selon le scénario.
-    
-    Args:
-        scenario_name: Nom du scénario
-        years: Nombre d'années à projeter
-        
-    Returns:
-        Liste des taux d'inflation annuels (en %)
-    """
-    if scenario_name == "Inflation stable 2% / an":
-        return [2.0] * years
-    
-    elif scenario_name == "Inflation stable 5% / an":
-        return [5.0] * years
-    
-    elif scenario_name == "Inflation stable 10% / an":
-        return [10.0] * years
-    
-    elif scenario_name == "Inflation haute 20% / an":
-        return [20.0] * years
-    
-    elif scenario_name == "Inflation décroissante":
-        # 10% → 7% → 5% → 3% → 1%
-        base_rates = [10.0, 7.0, 5.0, 3.0, 1.0]
-        return base_rates[:years] + [1.0] * max(0, years - 5)
-    
-    elif scenario_name == "Inflation avec halving":
-        # Halving tous les 2 ans : 20% → 10% → 5% → 2.5% → 1.25%
-        rate = 20.0
-        rates = []
-        for i in range(years):
-            if i > 0 and i % 2 == 0:
-                rate = rate / 2
-            rates.append(rate)
-        return rates
-    
-    elif scenario_name == "Inflation seasonal farming":
-        # Forte inflation années 1-3, puis réduction brutale
-        rates = []
-        for i in range(years):
-            if i < 3:
-                rates.append(25.0)
-            else:
-                rates.append(5.0)
-        return rates
-    
-    elif scenario_name == "Inflation négative / burn dynamique":
-        # Inflation négative (burn > emission)
-        return [-2.0] * years
-    
-    # Par défaut pour les autres scénarios
-    elif "early-stage" in scenario_name:
-        return [15.0, 12.0, 10.0, 8.0, 6.0][:years]
-    
-    elif "ETH-like" in scenario_name or "mature" in scenario_name:
-        return [0.5, 0.5, 0.5, 0.5, 0.5][:years]
-    
-    elif "Curve-like" in scenario_name:
-        return [20.0, 18.0, 16.0, 14.0, 12.0][:years]
-    
-    elif "Pendle-like" in scenario_name:
-        return [3.0, 2.5, 2.0, 1.5, 1.0][:years]
-    
-    elif "EigenLayer-like" in scenario_name:
-        return [5.0, 4.0, 3.0, 2.0, 1.5][:years]
-    
-    elif "capturée" in scenario_name:
-        return [8.0, 7.0, 6.0, 5.0, 4.0][:years]
-    
-    elif "Meme coin" in scenario_name:
-        return [0.0] * years
-    
-    elif "RWA" in scenario_name:
-        return [0.0] * years
-    
-    elif "Hyperliquid" in scenario_name:
-        return [8.0, 7.5, 7.0, 6.5, 6.0][:years]
-    
-    else:
-        return [5.0] * years
+DEFAULT_PROJECTION: Dict[str, Any] = {"type": "constant", "rate": 5.0}
 
 
-def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
-    """
-    Retourne les paramètres d'un scénario préconfigé.
-    
-    Returns:
-        Dictionnaire contenant tous les paramètres du scénario
-    """
-    
+_BUILTIN_SCENARIOS: List[Dict[str, Any]] = [
     # ========== CATÉGORIE A : SCÉNARIOS STRUCTURELS ==========
-    
-    if scenario_name == "Projet early-stage":
-        return {
+    {
+        "id": "early-stage",
+        "name": "Projet early-stage",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [15.0, 12.0, 10.0, 8.0, 6.0]},
+        "params": {
             "circulating_supply": 100_000_000,
             "total_supply": 1_000_000_000,
             "max_supply": 1_000_000_000,
@@ -165,9 +110,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Projet en phase de lancement avec forte dilution à venir et gouvernance centralisée."
         }
-    
-    elif scenario_name == "Token utilitaire fort (ETH-like)":
-        return {
+    },
+    {
+        "id": "eth-like",
+        "name": "Token utilitaire fort (ETH-like)",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [0.5, 0.5, 0.5, 0.5, 0.5]},
+        "params": {
             "circulating_supply": 120_000_000,
             "total_supply": 120_000_000,
             "max_supply": 0,  # Pas de max supply
@@ -191,9 +140,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.3,
             "description": "Token avec utilité fondamentale forte (gas fees) et mécanismes de burn. Modèle Ethereum post-EIP1559."
         }
-    
-    elif scenario_name == "Modèle DeFi inflationniste (Curve-like)":
-        return {
+    },
+    {
+        "id": "curve-like",
+        "name": "Modèle DeFi inflationniste (Curve-like)",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [20.0, 18.0, 16.0, 14.0, 12.0]},
+        "params": {
             "circulating_supply": 400_000_000,
             "total_supply": 3_000_000_000,
             "max_supply": 3_000_000_000,
@@ -217,9 +170,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Forte inflation compensée par mécanismes de lock long terme. Rewards de farming élevées."
         }
-    
-    elif scenario_name == "Modèle Pendle-like":
-        return {
+    },
+    {
+        "id": "pendle-like",
+        "name": "Modèle Pendle-like",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [3.0, 2.5, 2.0, 1.5, 1.0]},
+        "params": {
             "circulating_supply": 150_000_000,
             "total_supply": 258_000_000,
             "max_supply": 258_000_000,
@@ -243,9 +200,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.5,
             "description": "Inflation faible, fees > emissions, mécanismes de lock productifs. Tokenomics soutenable."
         }
-    
-    elif scenario_name == "Restaking / Sécurité économique (EigenLayer-like)":
-        return {
+    },
+    {
+        "id": "eigenlayer-like",
+        "name": "Restaking / Sécurité économique (EigenLayer-like)",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [5.0, 4.0, 3.0, 2.0, 1.5]},
+        "params": {
             "circulating_supply": 200_000_000,
             "total_supply": 1_000_000_000,
             "max_supply": 1_000_000_000,
@@ -269,9 +230,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Token utilisé comme collatéral pour sécurité économique. Risque de slashing réel, inflation contrôlée."
         }
-    
-    elif scenario_name == "Gouvernance capturée":
-        return {
+    },
+    {
+        "id": "captured-governance",
+        "name": "Gouvernance capturée",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [8.0, 7.0, 6.0, 5.0, 4.0]},
+        "params": {
             "circulating_supply": 300_000_000,
             "total_supply": 1_000_000_000,
             "max_supply": 1_000_000_000,
@@ -295,9 +260,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Concentration excessive, gouvernance centralisée, pas de timelock. Red flags multiples."
         }
-    
-    elif scenario_name == "Token mature (Bitcoin/Ethereum-like)":
-        return {
+    },
+    {
+        "id": "mature",
+        "name": "Token mature (Bitcoin/Ethereum-like)",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [0.5, 0.5, 0.5, 0.5, 0.5]},
+        "params": {
             "circulating_supply": 19_000_000,
             "total_supply": 19_500_000,
             "max_supply": 21_000_000,
@@ -321,11 +290,105 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Token entièrement mature avec quasi-totalité de la supply émise et utilité claire. Gouvernance décentralisée via consensus."
         }
-    
+    },
+    # ========== NOUVEAUX SCÉNARIOS 2024-2025 ==========
+    {
+        "id": "meme-coin",
+        "name": "Meme coin / Community token",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "constant", "rate": 0.0},
+        "params": {
+            "circulating_supply": 420_690_000_000_000,  # Large supply typique des memecoins
+            "total_supply": 420_690_000_000_000,
+            "max_supply": 420_690_000_000_000,
+            "inflation_rate": 0.0,  # Pas d'émission
+            "emission_years_left": 0,
+            "team_allocation": 0.0,  # Fair launch
+            "vesting_years": 0,
+            "top_10_concentration": 55.0,  # Souvent concentré
+            "utility_gas": False,
+            "utility_staking": False,
+            "utility_governance": False,
+            "utility_collateral": False,
+            "utility_discount": False,
+            "gov_timelock": False,
+            "gov_multisig": True,
+            "gov_dao_active": False,
+            "incentive_lock": False,
+            "incentive_staking": False,
+            "incentive_burn": True,  # Souvent présent
+            "lock_duration_months": 0,
+            "burn_rate": 1.0,
+            "description": "Fair launch, pas d'allocation team, mais aucune utilité réelle. Valeur = narrative + communauté. Risque spéculatif élevé."
+        }
+    },
+    {
+        "id": "rwa",
+        "name": "RWA Tokenization",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "constant", "rate": 0.0},
+        "params": {
+            "circulating_supply": 100_000_000,
+            "total_supply": 100_000_000,
+            "max_supply": 100_000_000,
+            "inflation_rate": 0.0,
+            "emission_years_left": 0,
+            "team_allocation": 25.0,  # Équipe + partenaires traditionnels
+            "vesting_years": 4,
+            "top_10_concentration": 45.0,  # Institutionnels
+            "utility_gas": False,
+            "utility_staking": False,
+            "utility_governance": True,
+            "utility_collateral": True,  # Adossé à un actif réel
+            "utility_discount": False,
+            "gov_timelock": True,
+            "gov_multisig": True,
+            "gov_dao_active": False,  # Souvent hybride on-chain/off-chain
+            "incentive_lock": False,
+            "incentive_staking": False,
+            "incentive_burn": False,
+            "lock_duration_months": 0,
+            "burn_rate": 0.0,
+            "description": "Tokenization d'actifs réels (immobilier, commodités, obligations). Valeur adossée, mais gouvernance souvent centralisée. Compliance forte."
+        }
+    },
+    {
+        "id": "hyperliquid-like",
+        "name": "Modèle Hyperliquid (100% community)",
+        "category": STRUCTURAL_CATEGORY,
+        "projection": {"type": "schedule", "rates": [8.0, 7.5, 7.0, 6.5, 6.0]},
+        "params": {
+            "circulating_supply": 270_000_000,
+            "total_supply": 1_000_000_000,
+            "max_supply": 1_000_000_000,
+            "inflation_rate": 8.0,
+            "emission_years_left": 6,
+            "team_allocation": 0.0,  # 100% community
+            "vesting_years": 0,
+            "top_10_concentration": 15.0,  # Bien distribué
+            "utility_gas": True,
+            "utility_staking": True,
+            "utility_governance": True,
+            "utility_collateral": True,
+            "utility_discount": True,
+            "gov_timelock": True,
+            "gov_multisig": True,
+            "gov_dao_active": True,
+            "incentive_lock": True,
+            "incentive_staking": True,
+            "incentive_burn": True,
+            "lock_duration_months": 12,
+            "burn_rate": 0.8,
+            "description": "Distribution 100% communauté via points, 0% team/VC. Utilité forte (L1 gas + trading). Modèle innovant 2024."
+        }
+    },
     # ========== CATÉGORIE B : SCÉNARIOS INFLATIONNISTES ==========
-    
-    elif scenario_name == "Inflation stable 2% / an":
-        return {
+    {
+        "id": "inflation-2",
+        "name": "Inflation stable 2% / an",
+        "category": INFLATIONARY_CATEGORY,
+        "projection": {"type": "constant", "rate": 2.0},
+        "params": {
             "circulating_supply": 500_000_000,
             "total_supply": 1_000_000_000,
             "max_supply": 0,  # Pas de max
@@ -349,9 +412,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Inflation stable et modérée (2%/an), proche des monnaies 'soft inflation'. Soutenable long terme."
         }
-    
-    elif scenario_name == "Inflation stable 5% / an":
-        return {
+    },
+    {
+        "id": "inflation-5",
+        "name": "Inflation stable 5% / an",
+        "category": INFLATIONARY_CATEGORY,
+        "projection": {"type": "constant", "rate": 5.0},
+        "params": {
             "circulating_supply": 500_000_000,
             "total_supply": 1_000_000_000,
             "max_supply": 0,
@@ -375,9 +442,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Inflation modérée (5%/an). Soutenable si utilité forte et demande en croissance."
         }
-    
-    elif scenario_name == "Inflation stable 10% / an":
-        return {
+    },
+    {
+        "id": "inflation-10",
+        "name": "Inflation stable 10% / an",
+        "category": INFLATIONARY_CATEGORY,
+        "projection": {"type": "constant", "rate": 10.0},
+        "params": {
             "circulating_supply": 500_000_000,
             "total_supply": 1_000_000_000,
             "max_supply": 0,
@@ -401,9 +472,13 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Inflation forte (10%/an) typique de DeFi. Nécessite des mécanismes forts pour absorber la pression."
         }
-    
-    elif scenario_name == "Inflation haute 20% / an":
-        return {
+    },
+    {
+        "id": "inflation-20",
+        "name": "Inflation haute 20% / an",
+        "category": INFLATIONARY_CATEGORY,
+        "projection": {"type": "constant", "rate": 20.0},
+        "params": {
             "circulating_supply": 500_000_000,
             "total_supply": 1_000_000_000,
             "max_supply": 0,
@@ -427,9 +502,14 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Inflation très haute (20%/an). Modèle 'farming' insoutenable long terme sans demande massive."
         }
-    
-    elif scenario_name == "Inflation décroissante":
-        return {
+    },
+    {
+        "id": "inflation-decreasing",
+        "name": "Inflation décroissante",
+        "category": INFLATIONARY_CATEGORY,
+        # 10% → 7% → 5% → 3% → 1%, puis 1% / an
+        "projection": {"type": "schedule", "rates": [10.0, 7.0, 5.0, 3.0, 1.0], "tail": 1.0},
+        "params": {
             "circulating_supply": 500_000_000,
             "total_supply": 800_000_000,
             "max_supply": 1_000_000_000,
@@ -453,9 +533,14 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.2,
             "description": "Inflation décroissante (10% → 7% → 5% → 3% → 1%). Modèle Ethereum pré-EIP1559."
         }
-    
-    elif scenario_name == "Inflation avec halving":
-        return {
+    },
+    {
+        "id": "inflation-halving",
+        "name": "Inflation avec halving",
+        "category": INFLATIONARY_CATEGORY,
+        # Halving tous les 2 ans : 20% → 10% → 5% → 2.5% → 1.25%
+        "projection": {"type": "halving", "initial_rate": 20.0, "period_years": 2},
+        "params": {
             "circulating_supply": 500_000_000,
             "total_supply": 700_000_000,
             "max_supply": 1_000_000_000,
@@ -479,9 +564,14 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Halving tous les 2 ans (20% → 10% → 5% → 2.5%). Modèle Bitcoin adapté."
         }
-    
-    elif scenario_name == "Inflation seasonal farming":
-        return {
+    },
+    {
+        "id": "inflation-seasonal-farming",
+        "name": "Inflation seasonal farming",
+        "category": INFLATIONARY_CATEGORY,
+        # Forte inflation années 1-3, puis réduction brutale
+        "projection": {"type": "schedule", "rates": [25.0, 25.0, 25.0], "tail": 5.0},
+        "params": {
             "circulating_supply": 300_000_000,
             "total_supply": 500_000_000,
             "max_supply": 1_000_000_000,
@@ -505,9 +595,14 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 0.0,
             "description": "Forte inflation pendant 3 ans (farming), puis réduction brutale. DeFi 2020 style."
         }
-    
-    elif scenario_name == "Inflation négative / burn dynamique":
-        return {
+    },
+    {
+        "id": "inflation-negative-burn",
+        "name": "Inflation négative / burn dynamique",
+        "category": INFLATIONARY_CATEGORY,
+        # Inflation négative (burn > emission)
+        "projection": {"type": "constant", "rate": -2.0},
+        "params": {
             "circulating_supply": 500_000_000,
             "total_supply": 500_000_000,
             "max_supply": 500_000_000,
@@ -531,111 +626,407 @@ def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
             "burn_rate": 2.5,
             "description": "Burn > emissions = inflation négative. Supply diminue avec l'activité. EIP-1559 like."
         }
-    
-    # ========== NOUVEAUX SCÉNARIOS 2024-2025 ==========
-    
-    elif scenario_name == "Meme coin / Community token":
+    }
+]
+
+
+def _validate_projection(spec: Dict[str, Any], where: str) -> Dict[str, Any]:
+    if not isinstance(spec, dict) or spec.get('type') not in PROJECTION_TYPES:
+        raise ValueError(f"{where} : projection invalide (types acceptés : {', '.join(PROJECTION_TYPES)})")
+
+    kind = spec['type']
+    try:
+        if kind == 'constant':
+            return {'type': kind, 'rate': float(spec['rate'])}
+        if kind == 'schedule':
+            rates = [float(r) for r in spec['rates']]
+            if not rates:
+                raise ValueError(f"{where} : 'rates' ne peut pas être vide")
+            validated = {'type': kind, 'rates': rates}
+            if spec.get('tail') is not None:
+                validated['tail'] = float(spec['tail'])
+            return validated
+        period = int(spec.get('period_years', 2))
+        if period < 1:
+            raise ValueError(f"{where} : 'period_years' doit être >= 1")
+        return {'type': kind, 'initial_rate': float(spec['initial_rate']), 'period_years': period}
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"{where} : projection '{kind}' incomplète ({e})")
+
+
+def project_rates(spec: Dict[str, Any], years: int) -> np.ndarray:
+    """
+    Calcule les taux d'inflation annuels d'une spécification de projection.
+
+    Args:
+        spec: Spécification validée ({'type': 'constant' | 'schedule' | 'halving', ...})
+        years: Nombre d'années à projeter
+
+    Returns:
+        Tableau des taux d'inflation annuels (en %), de longueur `years`
+    """
+    kind = spec['type']
+    if kind == 'constant':
+        return np.full(years, spec['rate'], dtype=float)
+
+    if kind == 'schedule':
+        listed = spec['rates'][:years]
+        rates = np.full(years, spec.get('tail', spec['rates'][-1]), dtype=float)
+        rates[:len(listed)] = listed
+        return rates
+
+    # Halving : taux divisé par deux au début de chaque période
+    return spec['initial_rate'] / 2.0 ** (np.arange(years) // spec['period_years'])
+
+
+class Scenario:
+    """Scénario enregistré (données immuables après enregistrement)."""
+
+    __slots__ = ('id', 'name', 'category', 'params', 'projection')
+
+    def __init__(self, id: str, name: str, category: str, params: Dict[str, Any], projection: Dict[str, Any]):
+        self.id = id
+        self.name = name
+        self.category = category
+        self.params = params
+        self.projection = projection
+
+    def to_dict(self) -> Dict[str, Any]:
         return {
-            "circulating_supply": 420_690_000_000_000,  # Large supply typique des memecoins
-            "total_supply": 420_690_000_000_000,
-            "max_supply": 420_690_000_000_000,
-            "inflation_rate": 0.0,  # Pas d'émission
-            "emission_years_left": 0,
-            "team_allocation": 0.0,  # Fair launch
-            "vesting_years": 0,
-            "top_10_concentration": 55.0,  # Souvent concentré
-            "utility_gas": False,
-            "utility_staking": False,
-            "utility_governance": False,
-            "utility_collateral": False,
-            "utility_discount": False,
-            "gov_timelock": False,
-            "gov_multisig": True,
-            "gov_dao_active": False,
-            "incentive_lock": False,
-            "incentive_staking": False,
-            "incentive_burn": True,  # Souvent présent
-            "lock_duration_months": 0,
-            "burn_rate": 1.0,
-            "description": "Fair launch, pas d'allocation team, mais aucune utilité réelle. Valeur = narrative + communauté. Risque spéculatif élevé."
+            'id': self.id,
+            'name': self.name,
+            'category': self.category,
+            'projection': dict(self.projection),
+            'params': dict(self.params),
         }
+
+
+class ScenarioRegistry:
+    """
+    Registre des scénarios indexé par id et par nom.
+
+    L'ordre d'enregistrement est conservé (ordre d'affichage des catégories
+    et des scénarios dans l'interface).
+    """
+
+    def __init__(self):
+        self._by_key: Dict[str, Scenario] = {}
+        self._categories: Dict[str, List[str]] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def register(self, definition: Dict[str, Any], replace: bool = False, base_params: Optional[Dict[str, Any]] = None) -> Scenario:
+        """
+        Enregistre un scénario.
+
+        Args:
+            definition: {'id', 'name', 'category', 'params', 'projection'}
+            replace: Autorise le remplacement d'un scénario de même id
+            base_params: Paramètres complétant ceux de la définition
+
+        Returns:
+            Scénario enregistré
+        """
+        scenario_id = str(definition.get('id') or '').strip()
+        name = str(definition.get('name') or scenario_id).strip()
+        if not scenario_id:
+            raise ValueError(f"Scénario sans id : {definition!r}")
+
+        where = f"Scénario '{scenario_id}'"
+        params = definition.get('params') or {}
+        if not isinstance(params, dict):
+            raise ValueError(f"{where} : 'params' doit être un dictionnaire")
+        params = {**(base_params or {}), **params}
+        params.setdefault('description', name)
+
+        from tokenomics.scoring import REQUIRED_PARAMS
+        missing = [key for key in REQUIRED_PARAMS if key not in params]
+        if missing:
+            raise ValueError(f"{where} : paramètres manquants ({', '.join(missing)})")
+
+        scenario = Scenario(
+            scenario_id,
+            name,
+            str(definition.get('category') or CUSTOM_CATEGORY),
+            params,
+            _validate_projection(definition.get('projection', DEFAULT_PROJECTION), where)
+        )
+
+        with self._lock:
+            for key in (scenario_id, name):
+                owner = self._by_key.get(key)
+                if owner is not None and owner.id != scenario_id:
+                    raise ValueError(f"{where} : '{key}' déjà utilisé par '{owner.id}'")
+
+            previous = self._by_key.get(scenario_id)
+            if previous is not None:
+                if not replace:
+                    raise ValueError(f"{where} : id déjà enregistré")
+                self._unindex(previous)
+            self._by_key[scenario_id] = scenario
+            self._by_key[name] = scenario
+            self._categories.setdefault(scenario.category, []).append(name)
+            self._names.append(name)
+
+        return scenario
+
+    def _unindex(self, scenario: Scenario) -> None:
+        self._by_key.pop(scenario.id, None)
+        self._by_key.pop(scenario.name, None)
+        self._names.remove(scenario.name)
+        names = self._categories[scenario.category]
+        names.remove(scenario.name)
+        if not names:
+            del self._categories[scenario.category]
+
+    def get(self, key: str) -> Optional[Scenario]:
+        """Retourne le scénario correspondant à un nom ou un id (None si inconnu)."""
+        return self._by_key.get(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def names(self) -> List[str]:
+        return list(self._names)
+
+    def categories(self) -> Dict[str, List[str]]:
+        return {category: list(names) for category, names in self._categories.items()}
+
+    def load_file(self, path: str, replace: bool = False) -> List[Scenario]:
+        """
+        Charge des scénarios personnalisés depuis un fichier JSON ou YAML.
+
+        Le fichier contient une liste de définitions, ou un objet avec une clé
+        `scenarios`. Les paramètres omis reprennent DEFAULT_SCENARIO_PARAMS.
+
+        Args:
+            path: Chemin du fichier (.json, .yaml ou .yml)
+            replace: Autorise le remplacement de scénarios existants
+
+        Returns:
+            Scénarios enregistrés
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.lower().endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError("Le chargement de scénarios YAML nécessite PyYAML : pip install pyyaml")
+                data = yaml.safe_load(f)
+            else:
+                data = json.load(f)
+
+        if isinstance(data, dict):
+            data = data.get('scenarios')
+        if not isinstance(data, list):
+            raise ValueError(f"{path} : liste de scénarios attendue")
+
+        return [
+            self.register(definition, replace=replace, base_params=DEFAULT_SCENARIO_PARAMS)
+            for definition in data
+        ]
+
+
+_registry: Optional[ScenarioRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def _build_registry() -> ScenarioRegistry:
+    registry = ScenarioRegistry()
+    for definition in _BUILTIN_SCENARIOS:
+        registry.register(definition)
+
+    for path in os.environ.get("TOKENOMICS_SCENARIOS_PATH", "").split(os.pathsep):
+        if path:
+            try:
+                registry.load_file(path)
+            except (OSError, ValueError, ImportError) as e:
+                print(f"Erreur lors du chargement des scénarios {path}: {e}")
+
+    return registry
+
+
+def get_registry() -> ScenarioRegistry:
+    """Retourne le registre des scénarios (construit au premier appel)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = _build_registry()
+    return _registry
+
+
+def register_scenario(definition: Dict[str, Any], replace: bool = False) -> Scenario:
+    """
+    Enregistre un scénario personnalisé (paramètres omis = scénario par défaut).
+
+    Args:
+        definition: {'id', 'name', 'category', 'params', 'projection'}
+        replace: Autorise le remplacement d'un scénario de même id
+
+    Returns:
+        Scénario enregistré
+    """
+    return get_registry().register(definition, replace=replace, base_params=DEFAULT_SCENARIO_PARAMS)
+
+
+def load_scenarios_file(path: str, replace: bool = False) -> List[Scenario]:
+    """Charge des scénarios personnalisés depuis un fichier JSON ou YAML."""
+    return get_registry().load_file(path, replace=replace)
+
+
+def get_scenario(key: str) -> Optional[Scenario]:
+    """Retourne un scénario par nom ou par id (None si inconnu)."""
+    return get_registry().get(key)
+
+
+def get_scenario_categories() -> Dict[str, List[str]]:
+    """Retourne les catégories de scénarios."""
+    return get_registry().categories()
+
+
+def get_all_scenarios() -> List[str]:
+    """Retourne la liste complète de tous les scénarios."""
+    return get_registry().names()
+
+
+def get_inflation_projection(scenario_name: str, years: int = 5) -> List[float]:
+    """
+    Génère une projection d'inflation annuelle selon le scénario.
     
-    elif scenario_name == "RWA Tokenization":
-        return {
-            "circulating_supply": 100_000_000,
-            "total_supply": 100_000_000,
-            "max_supply": 100_000_000,
-            "inflation_rate": 0.0,
-            "emission_years_left": 0,
-            "team_allocation": 25.0,  # Équipe + partenaires traditionnels
-            "vesting_years": 4,
-            "top_10_concentration": 45.0,  # Institutionnels
-            "utility_gas": False,
-            "utility_staking": False,
-            "utility_governance": True,
-            "utility_collateral": True,  # Adossé à un actif réel
-            "utility_discount": False,
-            "gov_timelock": True,
-            "gov_multisig": True,
-            "gov_dao_active": False,  # Souvent hybride on-chain/off-chain
-            "incentive_lock": False,
-            "incentive_staking": False,
-            "incentive_burn": False,
-            "lock_duration_months": 0,
-            "burn_rate": 0.0,
-            "description": "Tokenization d'actifs réels (immobilier, commodités, obligations). Valeur adossée, mais gouvernance souvent centralisée. Compliance forte."
-        }
+    Args:
+        scenario_name: Nom ou id du scénario
+        years: Nombre d'années à projeter
+        
+    Returns:
+        Liste des taux d'inflation annuels (en %)
+    """
+    scenario = get_registry().get(scenario_name)
+    return project_rates(scenario.projection if scenario else DEFAULT_PROJECTION, years).tolist()
+
+
+def get_scenario_params(scenario_name: str) -> Dict[str, Any]:
+    """
+    Retourne les paramètres d'un scénario préconfigé.
     
-    elif scenario_name == "Modèle Hyperliquid (100% community)":
-        return {
-            "circulating_supply": 270_000_000,
-            "total_supply": 1_000_000_000,
-            "max_supply": 1_000_000_000,
-            "inflation_rate": 8.0,
-            "emission_years_left": 6,
-            "team_allocation": 0.0,  # 100% community
-            "vesting_years": 0,
-            "top_10_concentration": 15.0,  # Bien distribué
-            "utility_gas": True,
-            "utility_staking": True,
-            "utility_governance": True,
-            "utility_collateral": True,
-            "utility_discount": True,
-            "gov_timelock": True,
-            "gov_multisig": True,
-            "gov_dao_active": True,
-            "incentive_lock": True,
-            "incentive_staking": True,
-            "incentive_burn": True,
-            "lock_duration_months": 12,
-            "burn_rate": 0.8,
-            "description": "Distribution 100% communauté via points, 0% team/VC. Utilité forte (L1 gas + trading). Modèle innovant 2024."
-        }
+    Args:
+        scenario_name: Nom ou id du scénario (scénario par défaut si inconnu)
     
-    else:
-        # Scénario par défaut
-        return {
-            "circulating_supply": 500_000_000,
-            "total_supply": 1_000_000_000,
-            "max_supply": 1_000_000_000,
-            "inflation_rate": 5.0,
-            "emission_years_left": 5,
-            "team_allocation": 15.0,
-            "vesting_years": 3,
-            "top_10_concentration": 30.0,
-            "utility_gas": False,
-            "utility_staking": True,
-            "utility_governance": True,
-            "utility_collateral": False,
-            "utility_discount": False,
-            "gov_timelock": True,
-            "gov_multisig": True,
-            "gov_dao_active": True,
-            "incentive_lock": False,
-            "incentive_staking": True,
-            "incentive_burn": False,
-            "lock_duration_months": 0,
-            "burn_rate": 0.0,
-            "description": "Scénario par défaut"
+    Returns:
+        Dictionnaire contenant tous les paramètres du scénario (copie modifiable)
+    """
+    scenario = get_registry().get(scenario_name)
+    return dict(scenario.params if scenario else DEFAULT_SCENARIO_PARAMS)
+
+
+# ========== MOTEUR DE PROJECTION ==========
+
+# Nombre de pas par an selon la granularité
+GRANULARITIES = {'yearly': 1, 'monthly': 12, 'daily': 365}
+
+
+def project_supply(
+    initial_supply: Union[float, Sequence[float], np.ndarray],
+    annual_rates: Union[Sequence[float], np.ndarray],
+    granularity: str = 'yearly'
+) -> Dict[str, np.ndarray]:
+    """
+    Projette la supply par produit cumulé des facteurs de croissance.
+
+    Le taux annuel est réparti en taux composés équivalents par pas : les
+    valeurs de fin d'année sont identiques quelle que soit la granularité.
+
+    Args:
+        initial_supply: Supply de départ, scalaire ou tableau (n,)
+        annual_rates: Taux annuels en %, tableau (années,) ou (n, années)
+        granularity: 'yearly', 'monthly' ou 'daily'
+
+    Returns:
+        {
+            'time': instants en années (pas + 1,),
+            'supply': supply projetée (..., pas + 1), supply initiale en colonne 0,
+            'dilution_pct': dilution cumulée depuis le départ (..., pas + 1),
+            'inflation_rate': taux annuel en vigueur à chaque pas (..., pas)
         }
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Granularité inconnue : {granularity} (valeurs : {', '.join(GRANULARITIES)})")
+    steps = GRANULARITIES[granularity]
 
+    rates = np.asarray(annual_rates, dtype=float)
+    supply0 = np.asarray(initial_supply, dtype=float)[..., np.newaxis]
+
+    growth = (1.0 + rates / 100.0) ** (1.0 / steps)
+    if steps > 1:
+        growth = np.repeat(growth, steps, axis=-1)
+        rates = np.repeat(rates, steps, axis=-1)
+
+    factors = np.empty(growth.shape[:-1] + (growth.shape[-1] + 1,))
+    factors[..., 0] = 1.0
+    np.cumprod(growth, axis=-1, out=factors[..., 1:])
+
+    supply = supply0 * factors
+    return {
+        'time': np.arange(factors.shape[-1]) / steps,
+        'supply': supply,
+        'dilution_pct': np.broadcast_to((factors - 1.0) * 100.0, supply.shape),
+        'inflation_rate': np.broadcast_to(rates, supply.shape[:-1] + rates.shape[-1:]),
+    }
+
+
+def project_scenarios(
+    scenario_names: Sequence[str],
+    years: int = 5,
+    granularity: str = 'yearly',
+    initial_supply: Optional[Union[float, Sequence[float]]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Projette plusieurs scénarios en une seule passe (une ligne par scénario).
+
+    Args:
+        scenario_names: Noms ou ids des scénarios (inconnu = scénario par défaut)
+        years: Horizon en années
+        granularity: 'yearly', 'monthly' ou 'daily'
+        initial_supply: Supply de départ commune ou par scénario
+            (défaut : circulating_supply de chaque scénario)
+
+    Returns:
+        Résultat de `project_supply` avec des tableaux (n, pas + 1)
+    """
+    registry = get_registry()
+    scenarios = [registry.get(name) for name in scenario_names]
+
+    rates = np.empty((len(scenarios), years))
+    for i, scenario in enumerate(scenarios):
+        rates[i] = project_rates(scenario.projection if scenario else DEFAULT_PROJECTION, years)
+
+    if initial_supply is None:
+        initial_supply = [
+            (scenario.params if scenario else DEFAULT_SCENARIO_PARAMS)['circulating_supply']
+            for scenario in scenarios
+        ]
+    return project_supply(initial_supply, rates, granularity)
+
+
+def project_tokens(
+    params_list: Sequence[Dict[str, Any]],
+    years: int = 5,
+    granularity: str = 'yearly'
+) -> Dict[str, np.ndarray]:
+    """
+    Projette plusieurs tokens à taux d'inflation constant (une ligne par token).
+
+    Args:
+        params_list: Paramètres des tokens (circulating_supply, inflation_rate)
+        years: Horizon en années
+        granularity: 'yearly', 'monthly' ou 'daily'
+
+    Returns:
+        Résultat de `project_supply` avec des tableaux (n, pas + 1)
+    """
+    supply = np.fromiter((p['circulating_supply'] for p in params_list), dtype=float, count=len(params_list))
+    rates = np.fromiter((p['inflation_rate'] for p in params_list), dtype=float, count=len(params_list))
+    return project_supply(supply, np.repeat(rates[:, np.newaxis], years, axis=1), granularity)
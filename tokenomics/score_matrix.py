@@ -0,0 +1,303 @@
+"""
+Matrice des scores sur disque, ouverte en mmap.
+
+Un job de rafraîchissement (`python -m tokenomics refresh`) score un univers
+de tokens et écrit un fichier binaire versionné : ids des tokens et scores
+par composante. Les processus qui servent les scores (app, workers, CLI,
+service HTTP) l'ouvrent avec `np.memmap` : l'ouverture ne lit que l'en-tête,
+quelle que soit la taille de l'univers, et les processus d'une même machine
+partagent les pages du fichier via le cache de l'OS.
+
+Format (petit-boutiste) :
+
+    en-tête (4096 octets)  magic "TKSCORES", version, lignes, champs, largeur
+                           des ids, date, empreinte du code de scoring, puis
+                           noms des champs en JSON (complété par des zéros)
+    ids                    lignes × largeur octets (UTF-8, triés)
+    scores                 champs × lignes float32 (une colonne contiguë par score)
+
+Le fichier est écrit à côté de sa destination puis renommé (`os.replace`) :
+un lecteur voit l'ancienne ou la nouvelle matrice, jamais un fichier partiel.
+`get_score_matrix()` rouvre la matrice lorsque le fichier a été remplacé.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tokenomics import params as params_module
+from tokenomics import scoring as scoring_module
+from tokenomics import universe as universe_module
+from tokenomics.sweep import SCORE_FIELDS
+
+if TYPE_CHECKING:
+    from tokenomics.universe import TokenUniverse
+
+
+# Version du format (à incrémenter si sa structure change)
+SCORE_MATRIX_VERSION = 1
+
+MAGIC = b"TKSCORES"
+
+HEADER_SIZE = 4096
+
+# magic, version, lignes, champs, largeur des ids, date de création, empreinte
+_HEADER = struct.Struct("<8sIQHHd32s")
+
+# Alignement du début du bloc des scores
+_ALIGN = 64
+
+
+@lru_cache(maxsize=1)
+def scoring_fingerprint() -> bytes:
+    """
+    Empreinte SHA-256 du code qui produit les scores (une matrice d'un autre code est périmée).
+
+    Couvre le scoring, la validation des paramètres (TokenParams) et le
+    scoring en colonnes de TokenUniverse, utilisé par le job de rafraîchissement.
+    """
+    digest = hashlib.sha256(f"v{SCORE_MATRIX_VERSION}".encode())
+    for module in (scoring_module, params_module, universe_module):
+        with open(module.__file__, 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def _scores_offset(rows: int, id_width: int) -> int:
+    end = HEADER_SIZE + rows * id_width
+    return -(-end // _ALIGN) * _ALIGN
+
+
+def write_score_matrix(
+    path: str,
+    ids: Sequence[str],
+    scores: Mapping[str, Sequence[float]],
+    fields: Sequence[str] = SCORE_FIELDS
+) -> str:
+    """
+    Écrit une matrice de scores (remplacement atomique du fichier).
+
+    Args:
+        path: Fichier de destination
+        ids: Identifiants des tokens (uniques)
+        scores: {champ: scores alignés sur ids}
+        fields: Champs enregistrés (ordre des colonnes)
+
+    Returns:
+        Chemin du fichier écrit
+
+    Raises:
+        ValueError: Ids en double, champ manquant ou colonnes de tailles différentes
+    """
+    encoded = np.array([str(token_id).encode('utf-8') for token_id in ids], dtype=bytes)
+    if len(encoded) == 0:
+        encoded = np.empty(0, dtype='S1')
+    order = np.argsort(encoded, kind='stable')
+    encoded = encoded[order]
+    if len(encoded) > 1 and np.any(encoded[1:] == encoded[:-1]):
+        raise ValueError("Matrice de scores : ids en double")
+
+    missing = [field for field in fields if field not in scores]
+    if missing:
+        raise ValueError(f"Matrice de scores : champs manquants ({', '.join(missing)})")
+    columns = [np.asarray(scores[field], dtype='<f4') for field in fields]
+    if any(len(column) != len(encoded) for column in columns):
+        raise ValueError("Matrice de scores : colonnes de tailles différentes")
+
+    rows, id_width = len(encoded), encoded.dtype.itemsize
+    header = _HEADER.pack(MAGIC, SCORE_MATRIX_VERSION, rows, len(fields), id_width, time.time(), scoring_fingerprint())
+    header += json.dumps(list(fields)).encode('utf-8')
+    if len(header) > HEADER_SIZE:
+        raise ValueError("Matrice de scores : trop de champs pour l'en-tête")
+
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(header.ljust(HEADER_SIZE, b"\0"))
+            f.write(encoded.tobytes())
+            f.write(b"\0" * (_scores_offset(rows, id_width) - HEADER_SIZE - rows * id_width))
+            for column in columns:
+                f.write(column[order].tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def write_universe_scores(universe: 'TokenUniverse', path: str) -> str:
+    """
+    Écrit la matrice des scores d'un TokenUniverse (scoré au besoin).
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    if universe.scores is None:
+        universe.score()
+    return write_score_matrix(path, universe.ids.tolist(), {field: universe[field] for field in SCORE_FIELDS})
+
+
+class ScoreMatrix:
+    """
+    Matrice de scores ouverte en mmap (lecture seule).
+
+    Args:
+        path: Fichier écrit par write_score_matrix()
+
+    Raises:
+        ValueError: Fichier qui n'est pas une matrice de scores, ou d'une autre version
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+            stat = os.fstat(f.fileno())
+        if len(header) < HEADER_SIZE or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} n'est pas une matrice de scores")
+        _, version, rows, n_fields, id_width, created_at, fingerprint = _HEADER.unpack_from(header)
+        if version != SCORE_MATRIX_VERSION:
+            raise ValueError(f"{path} : version {version} (attendu : {SCORE_MATRIX_VERSION})")
+
+        self.version = version
+        self.created_at = created_at
+        self.fingerprint = fingerprint
+        self.fields = tuple(json.loads(header[_HEADER.size:].rstrip(b"\0").decode('utf-8')))
+        self._identity = (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+        if len(self.fields) != n_fields:
+            raise ValueError(f"{path} : en-tête incohérent")
+
+        if rows == 0:
+            self.ids = np.empty(0, dtype=f'S{id_width}')
+            self._scores = np.empty((n_fields, 0), dtype='<f4')
+        else:
+            self.ids = np.memmap(path, dtype=f'S{id_width}', mode='r', offset=HEADER_SIZE, shape=(rows,))
+            self._scores = np.memmap(
+                path, dtype='<f4', mode='r', offset=_scores_offset(rows, id_width), shape=(n_fields, rows)
+            )
+        self._field_index = {field: i for i, field in enumerate(self.fields)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, token_id: str) -> bool:
+        return self.index(token_id) is not None
+
+    def is_current(self) -> bool:
+        """Vrai si la matrice a été calculée avec le code de scoring actuel."""
+        return self.fingerprint == scoring_fingerprint()
+
+    def column(self, field: str) -> np.ndarray:
+        """Scores d'un champ (vue mmap, dans l'ordre de `ids`)."""
+        if field not in self._field_index:
+            raise KeyError(f"Champ inconnu : {field}")
+        return self._scores[self._field_index[field]]
+
+    def index(self, token_id: str) -> Optional[int]:
+        """Ligne d'un token (recherche dichotomique), None si absent."""
+        key = token_id.encode('utf-8')
+        if len(key) > self.ids.dtype.itemsize:
+            return None
+        position = int(np.searchsorted(self.ids, key))
+        if position < len(self.ids) and self.ids[position] == key:
+            return position
+        return None
+
+    def lookup(self, token_ids: Iterable[str]) -> np.ndarray:
+        """
+        Lignes de plusieurs tokens (vectorisé).
+
+        Returns:
+            Indices (n,), -1 pour les tokens absents
+        """
+        keys = np.array([str(token_id).encode('utf-8') for token_id in token_ids], dtype=bytes)
+        if len(keys) == 0 or len(self.ids) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+        positions = np.searchsorted(self.ids, keys)
+        clipped = np.minimum(positions, len(self.ids) - 1)
+        found = (positions < len(self.ids)) & (self.ids[clipped] == keys)
+        return np.where(found, clipped, -1)
+
+    def get(self, token_id: str) -> Optional[Dict[str, float]]:
+        """Scores d'un token ({champ: score}), None si absent."""
+        position = self.index(token_id)
+        if position is None:
+            return None
+        # Scores arrondis à 0.1 à l'écriture : on retire le bruit du float32
+        return {field: round(float(value), 1) for field, value in zip(self.fields, self._scores[:, position])}
+
+    def info(self) -> Dict[str, Any]:
+        """Métadonnées (taille, date, version du code de scoring)."""
+        return {
+            'path': self.path,
+            'tokens': len(self),
+            'fields': list(self.fields),
+            'created_at': self.created_at,
+            'current': self.is_current(),
+        }
+
+    def _is_replaced(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return True
+        return (stat.st_dev, stat.st_ino, stat.st_mtime_ns) != self._identity
+
+
+_matrix: Optional[ScoreMatrix] = None
+_matrix_lock = threading.Lock()
+# Dernier échec d'ouverture : (chemin, identité du fichier ou None s'il est absent)
+_failure: Optional[Tuple[str, Optional[Tuple[int, int, int]]]] = None
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+
+
+def get_score_matrix() -> Optional[ScoreMatrix]:
+    """
+    Matrice désignée par TOKENOMICS_SCORE_MATRIX (None si non configurée ou illisible).
+
+    La matrice est rouverte lorsque le job de rafraîchissement a remplacé le
+    fichier ; les lectures en cours gardent l'ancienne version. Un fichier
+    absent ou illisible n'est signalé qu'une fois : il n'est réessayé que
+    lorsqu'il apparaît ou change (simple stat par appel).
+    """
+    global _matrix, _failure
+    path = os.environ.get("TOKENOMICS_SCORE_MATRIX")
+    if not path:
+        return None
+    matrix = _matrix
+    if matrix is not None and matrix.path == path and not matrix._is_replaced():
+        return matrix
+    failure = _failure
+    if failure is not None and failure == (path, _file_identity(path)):
+        return None
+    with _matrix_lock:
+        if _matrix is None or _matrix.path != path or _matrix._is_replaced():
+            identity = _file_identity(path)
+            if _failure == (path, identity):
+                return None
+            try:
+                _matrix = ScoreMatrix(path)
+                _failure = None
+            except (OSError, ValueError) as e:
+                print(f"Matrice de scores ignorée ({path}) : {e}", file=sys.stderr)
+                _matrix = None
+                _failure = (path, identity)
+        return _matrix
@@ -12,7 +12,66 @@ Le score final (0-100) est calculé selon 8 composantes :
 8. Sécurité (5% bonus)
 """
 
-from typing import Dict, Any, Tuple
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Dict, Any, Tuple, Union
+
+from tokenomics.instrumentation import timed
+from tokenomics.params import TokenParams
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Paramètres obligatoires pour calculate_viability_index()
+# (les métriques de marché sont optionnelles et ont des valeurs par défaut)
+REQUIRED_PARAMS = (
+    'circulating_supply', 'total_supply', 'max_supply', 'inflation_rate', 'emission_years_left',
+    'team_allocation', 'vesting_years', 'top_10_concentration',
+    'utility_gas', 'utility_staking', 'utility_governance', 'utility_collateral', 'utility_discount',
+    'gov_timelock', 'gov_multisig', 'gov_dao_active',
+    'incentive_lock', 'incentive_staking', 'incentive_burn', 'lock_duration_months', 'burn_rate',
+)
+
+# Métriques de marché optionnelles et leurs valeurs par défaut
+OPTIONAL_PARAMS = {
+    'volume_24h': 0,
+    'market_cap_usd': 0,
+    'volume_to_market_cap': 0,
+    'market_cap_rank': 999,
+    'price_change_30d': 0,
+}
+
+# Lecture groupée des paramètres (un seul appel C par représentation)
+_required_values = itemgetter(*REQUIRED_PARAMS)
+_token_values = attrgetter(*REQUIRED_PARAMS, *OPTIONAL_PARAMS, 'name')
+
+# Pondérations (total = 105% avec bonus sécurité)
+SCORE_WEIGHTS = {
+    'inflation': 0.20,
+    'distribution': 0.15,
+    'utility': 0.20,
+    'governance': 0.10,
+    'incentives': 0.10,
+    'liquidity': 0.15,
+    'adoption': 0.10,
+    'security': 0.05  # Bonus
+}
+
+# Base de données des audits (à enrichir)
+SECURITY_DB = {
+    'ethereum': {'audits': 5, 'bug_bounty': True, 'bounty_amount': 10_000_000},
+    'bitcoin': {'audits': 10, 'bug_bounty': False, 'bounty_amount': 0},
+    'uniswap': {'audits': 4, 'bug_bounty': True, 'bounty_amount': 2_000_000},
+    'aave': {'audits': 6, 'bug_bounty': True, 'bounty_amount': 1_000_000},
+    'curve-dao-token': {'audits': 5, 'bug_bounty': True, 'bounty_amount': 500_000},
+    'maker': {'audits': 7, 'bug_bounty': True, 'bounty_amount': 10_000_000},
+    'chainlink': {'audits': 4, 'bug_bounty': True, 'bounty_amount': 1_000_000},
+    'lido-dao': {'audits': 4, 'bug_bounty': True, 'bounty_amount': 2_000_000},
+    'arbitrum': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 2_000_000},
+    'optimism': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 2_000_000},
+    'pendle': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 500_000},
+    'gmx': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 500_000},
+}
 
 
 def calculate_inflation_score(
@@ -379,85 +438,98 @@ def calculate_incentives_score(
     return score, comment
 
 
-def calculate_viability_index(params: Dict[str, Any]) -> Dict[str, Any]:
+@timed("score.viability_index")
+def calculate_viability_index(params: Union[Dict[str, Any], TokenParams]) -> Dict[str, Any]:
     """
     Calcule le Tokenomics Viability Index global.
     
     Args:
-        params: Dictionnaire contenant tous les paramètres
+        params: Dictionnaire contenant tous les paramètres, ou TokenParams
         
     Returns:
         Dictionnaire avec scores détaillés et index final
     """
+    if isinstance(params, TokenParams):
+        (circulating_supply, total_supply, max_supply, inflation_rate, emission_years_left,
+         team_allocation, vesting_years, top_10_concentration,
+         utility_gas, utility_staking, utility_governance, utility_collateral, utility_discount,
+         gov_timelock, gov_multisig, gov_dao_active,
+         incentive_lock, incentive_staking, incentive_burn, lock_duration_months, burn_rate,
+         volume_24h, market_cap_usd, volume_to_market_cap, market_cap_rank, price_change_30d,
+         name) = _token_values(params)
+    else:
+        (circulating_supply, total_supply, max_supply, inflation_rate, emission_years_left,
+         team_allocation, vesting_years, top_10_concentration,
+         utility_gas, utility_staking, utility_governance, utility_collateral, utility_discount,
+         gov_timelock, gov_multisig, gov_dao_active,
+         incentive_lock, incentive_staking, incentive_burn, lock_duration_months, burn_rate) = _required_values(params)
+        volume_24h = params.get('volume_24h', 0)
+        market_cap_usd = params.get('market_cap_usd', 0)
+        volume_to_market_cap = params.get('volume_to_market_cap', 0)
+        market_cap_rank = params.get('market_cap_rank', 999)
+        price_change_30d = params.get('price_change_30d', 0)
+        name = params.get('name', '')
+    
     # Calcul des scores par catégorie
     inflation_score, inflation_comment = calculate_inflation_score(
-        params['circulating_supply'],
-        params['total_supply'],
-        params['max_supply'],
-        params['inflation_rate'],
-        params['emission_years_left']
+        circulating_supply,
+        total_supply,
+        max_supply,
+        inflation_rate,
+        emission_years_left
     )
     
     distribution_score, distribution_comment = calculate_distribution_score(
-        params['team_allocation'],
-        params['vesting_years'],
-        params['top_10_concentration']
+        team_allocation,
+        vesting_years,
+        top_10_concentration
     )
     
     utility_score, utility_comment = calculate_utility_score(
-        params['utility_gas'],
-        params['utility_staking'],
-        params['utility_governance'],
-        params['utility_collateral'],
-        params['utility_discount']
+        utility_gas,
+        utility_staking,
+        utility_governance,
+        utility_collateral,
+        utility_discount
     )
     
     governance_score, governance_comment = calculate_governance_score(
-        params['gov_timelock'],
-        params['gov_multisig'],
-        params['gov_dao_active'],
-        params['top_10_concentration']
+        gov_timelock,
+        gov_multisig,
+        gov_dao_active,
+        top_10_concentration
     )
     
     incentives_score, incentives_comment = calculate_incentives_score(
-        params['incentive_lock'],
-        params['incentive_staking'],
-        params['incentive_burn'],
-        params['lock_duration_months'],
-        params['burn_rate'],
-        params['inflation_rate']
+        incentive_lock,
+        incentive_staking,
+        incentive_burn,
+        lock_duration_months,
+        burn_rate,
+        inflation_rate
     )
     
     # Nouveaux critères
     liquidity_score, liquidity_comment = calculate_liquidity_score(
-        params.get('volume_24h', 0),
-        params.get('market_cap_usd', 0),
-        params.get('volume_to_market_cap', 0),
-        params.get('market_cap_rank', 999)
+        volume_24h,
+        market_cap_usd,
+        volume_to_market_cap,
+        market_cap_rank
     )
     
     adoption_score, adoption_comment = calculate_adoption_score(
-        params.get('market_cap_usd', 0),
-        params.get('market_cap_rank', 999),
-        params.get('price_change_30d', 0)
+        market_cap_usd,
+        market_cap_rank,
+        price_change_30d
     )
     
     security_score, security_comment = calculate_security_score(
-        params.get('name', '').lower().replace(' ', '-'),
-        params.get('market_cap_rank', 999)
+        name.lower().replace(' ', '-'),
+        market_cap_rank
     )
     
     # Pondérations (total = 105% avec bonus sécurité)
-    weights = {
-        'inflation': 0.20,
-        'distribution': 0.15,
-        'utility': 0.20,
-        'governance': 0.10,
-        'incentives': 0.10,
-        'liquidity': 0.15,
-        'adoption': 0.10,
-        'security': 0.05  # Bonus
-    }
+    weights = dict(SCORE_WEIGHTS)
     
     # Calcul du score final (peut dépasser 100 avec bonus sécurité)
     final_score = (
@@ -515,6 +587,7 @@ def calculate_viability_index(params: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@timed("score.recommendations")
 def get_recommendations(score_data: Dict[str, Any]) -> list:
     """
     Génère des recommandations basées sur les scores.
@@ -716,27 +789,11 @@ def calculate_security_score(
     Returns:
         (score, commentaire)
     """
-    # Base de données des audits (à enrichir)
-    security_db = {
-        'ethereum': {'audits': 5, 'bug_bounty': True, 'bounty_amount': 10_000_000},
-        'bitcoin': {'audits': 10, 'bug_bounty': False, 'bounty_amount': 0},
-        'uniswap': {'audits': 4, 'bug_bounty': True, 'bounty_amount': 2_000_000},
-        'aave': {'audits': 6, 'bug_bounty': True, 'bounty_amount': 1_000_000},
-        'curve-dao-token': {'audits': 5, 'bug_bounty': True, 'bounty_amount': 500_000},
-        'maker': {'audits': 7, 'bug_bounty': True, 'bounty_amount': 10_000_000},
-        'chainlink': {'audits': 4, 'bug_bounty': True, 'bounty_amount': 1_000_000},
-        'lido-dao': {'audits': 4, 'bug_bounty': True, 'bounty_amount': 2_000_000},
-        'arbitrum': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 2_000_000},
-        'optimism': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 2_000_000},
-        'pendle': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 500_000},
-        'gmx': {'audits': 3, 'bug_bounty': True, 'bounty_amount': 500_000},
-    }
-    
     score = 50.0  # Score de base (neutre)
     comments = []
     
-    if coin_id in security_db:
-        data = security_db[coin_id]
+    if coin_id in SECURITY_DB:
+        data = SECURITY_DB[coin_id]
         
         # Audits (jusqu'à +30 points)
         audits = data['audits']
@@ -780,3 +837,176 @@ def calculate_security_score(
     
     return score, comment
 
+
+# ========== SCORING VECTORISÉ ==========
+
+def calculate_viability_index_vectorized(columns: Dict[str, Any]) -> Dict[str, 'np.ndarray']:
+    """
+    Version vectorisée de calculate_viability_index (scores uniquement).
+    
+    Chaque paramètre est un tableau NumPy (une valeur par point) ou un
+    scalaire commun à tous les points. Les seuils et pondérations sont ceux
+    de la version scalaire ; `name` (audits connus) doit être un scalaire.
+    
+    Args:
+        columns: Paramètres du schéma REQUIRED_PARAMS (+ OPTIONAL_PARAMS)
+        
+    Returns:
+        {'final_score', 'inflation_score', ..., 'security_score'} : tableaux float64
+    """
+    # NumPy n'est chargé que par le chemin vectorisé (import de scoring léger)
+    import numpy as np
+    
+    def col(key):
+        value = columns.get(key, OPTIONAL_PARAMS.get(key))
+        return np.asarray(value if value is not None else OPTIONAL_PARAMS.get(key, 0), dtype=float)
+    
+    def flag(key):
+        return np.asarray(columns[key], dtype=bool)
+    
+    circulating = col('circulating_supply')
+    total = col('total_supply')
+    max_supply = col('max_supply')
+    inflation = col('inflation_rate')
+    emission_years = col('emission_years_left')
+    team = col('team_allocation')
+    vesting = col('vesting_years')
+    concentration = col('top_10_concentration')
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dilution = (max_supply - circulating) / circulating * 100
+        supply_ratio = circulating / total * 100
+    
+    # Inflation
+    inflation_score = (
+        100.0
+        - np.where(
+            (max_supply > 0) & (circulating > 0),
+            np.select([dilution > 300, dilution > 150, dilution > 50, dilution > 20], [40, 30, 15, 5], 0),
+            0
+        )
+        + np.select(
+            [inflation < 0, inflation <= 2, inflation <= 5, inflation <= 10, inflation <= 20],
+            [10, 0, -5, -15, -25], -35
+        )
+        - np.select([emission_years > 10, emission_years > 5, emission_years > 0], [15, 8, 3], 0)
+        - np.where(
+            (total > 0) & (circulating > 0),
+            np.select([supply_ratio < 20, supply_ratio < 40], [10, 5], 0),
+            0
+        )
+    )
+    
+    # Distribution
+    distribution_score = (
+        100.0
+        - np.select([team > 30, team > 20, team > 15, team > 10], [30, 20, 10, 5], 0)
+        - np.where(team > 10, np.select([vesting < 2, vesting < 3, vesting < 4], [25, 15, 5], 0), 0)
+        - np.select(
+            [concentration > 60, concentration > 50, concentration > 40, concentration > 30, concentration > 20],
+            [45, 35, 25, 15, 5], 0
+        )
+    )
+    
+    # Utilité
+    utility_score = (
+        40.0 * flag('utility_gas') + 20.0 * flag('utility_staking') + 15.0 * flag('utility_governance')
+        + 20.0 * flag('utility_collateral') + 5.0 * flag('utility_discount')
+    )
+    
+    # Gouvernance
+    governance_score = (
+        100.0
+        - 30.0 * ~flag('gov_timelock') - 20.0 * ~flag('gov_multisig') - 25.0 * ~flag('gov_dao_active')
+        - np.select([concentration > 50, concentration > 35], [25, 15], 0)
+    )
+    
+    # Incitations
+    lock, staking, burn = flag('incentive_lock'), flag('incentive_staking'), flag('incentive_burn')
+    lock_months = col('lock_duration_months')
+    burn_rate = col('burn_rate')
+    mechanisms = lock.astype(int) + staking + burn
+    incentives_score = (
+        40.0
+        + np.where(lock, np.select([lock_months >= 24, lock_months >= 12, lock_months >= 6], [30, 20, 10], 5), 0)
+        + 20.0 * staking
+        + np.where(burn, np.select(
+            [(burn_rate > inflation) & (inflation > 0), burn_rate >= 1.0, burn_rate >= 0.5, burn_rate > 0],
+            [25, 20, 15, 10], 0
+        ), 0)
+        + np.select([mechanisms == 3, mechanisms == 0], [10, -20], 0)
+    )
+    
+    # Liquidité
+    volume = col('volume_24h')
+    volume_to_mcap = col('volume_to_market_cap')
+    rank = col('market_cap_rank')
+    liquidity_score = (
+        100.0
+        - np.select(
+            [volume_to_mcap >= 10, volume_to_mcap >= 5, volume_to_mcap >= 2, volume_to_mcap >= 1],
+            [0, 10, 20, 30], 40
+        )
+        - np.select(
+            [volume >= 100_000_000, volume >= 10_000_000, volume >= 1_000_000, volume >= 100_000],
+            [0, 5, 15, 25], 30
+        )
+        + np.select([rank <= 50, rank <= 100], [10, 5], 0)
+    )
+    
+    # Adoption
+    market_cap = col('market_cap_usd')
+    price_change = col('price_change_30d')
+    adoption_score = (
+        100.0
+        - np.select(
+            [market_cap >= 10_000_000_000, market_cap >= 1_000_000_000, market_cap >= 100_000_000, market_cap >= 10_000_000],
+            [0, 10, 20, 30], 40
+        )
+        + np.select([rank <= 20, rank <= 100, rank <= 500], [10, 5, -10], -20)
+        + np.select(
+            [price_change >= 50, price_change >= 20, price_change >= -10, price_change >= -30],
+            [10, 5, 0, -10], -20
+        )
+    )
+    
+    # Sécurité : audits connus (score constant) ou heuristique sur le rang
+    coin_id = str(columns.get('name', '')).lower().replace(' ', '-')
+    if coin_id in SECURITY_DB:
+        security_score = np.asarray(calculate_security_score(coin_id, 999)[0], dtype=float)
+    else:
+        security_score = np.select([rank <= 50, rank <= 200], [60.0, 50.0], 30.0)
+    
+    scores = {
+        'inflation_score': inflation_score,
+        'distribution_score': distribution_score,
+        'utility_score': utility_score,
+        'governance_score': governance_score,
+        'incentives_score': incentives_score,
+        'liquidity_score': liquidity_score,
+        'adoption_score': adoption_score,
+        'security_score': security_score,
+    }
+    shape = np.broadcast(*scores.values()).shape
+    
+    final_score = np.zeros(shape)
+    for key, score in scores.items():
+        scores[key] = np.broadcast_to(np.clip(score, 0, 100), shape)
+        final_score += scores[key] * SCORE_WEIGHTS[key[:-len('_score')]]
+    
+    result = {'final_score': _round1(np.minimum(final_score, 100))}
+    result.update({key: _round1(score) for key, score in scores.items()})
+    return result
+
+
+def _round1(values: 'np.ndarray') -> 'np.ndarray':
+    """Arrondi à 0.1 identique à round(x, 1) (np.round arrondit les demis au pair)."""
+    import numpy as np
+    
+    rounded = np.round(values, 1)
+    scaled = values * 10
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded = np.array(rounded)
+        rounded[near_half] = [round(float(v), 1) for v in values[near_half]]
+    return rounded
@@ -0,0 +1,424 @@
+"""
+Service HTTP (API JSON) pour obtenir des scores sans passer par Streamlit.
+
+Endpoints :
+    GET  /health          État du service
+    GET  /metrics         Durées par étape au format Prometheus
+    GET  /scenarios       Liste des scénarios préconfigurés (avec paramètres)
+    GET  /token/{id}      Données CoinGecko + score d'un token (id ou symbole)
+    GET  /scores/{id}     Scores précalculés d'un token (matrice TOKENOMICS_SCORE_MATRIX)
+    POST /score           Paramètres en JSON -> score_data + recommandations
+    POST /score/batch     Liste de paramètres -> liste de résultats
+
+Le serveur repose uniquement sur la bibliothèque standard : chaque processus
+traite les requêtes dans un pool de threads borné, et plusieurs processus
+peuvent partager le même socket d'écoute (pré-fork, POSIX uniquement).
+Au-delà de `workers + queue_size` connexions en cours, les nouvelles sont
+refusées immédiatement (503) au lieu de s'accumuler en mémoire.
+
+Chaque processus a son propre ScoringService : le cache des tokens CoinGecko
+(TTLCache) n'est pas partagé entre processus, un même token peut donc être
+récupéré une fois par processus pendant la durée de validité du cache.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit, unquote
+
+from tokenomics.api import (
+    fetch_coingecko_data,
+    parse_coingecko_to_params,
+    enhance_params_with_known_data,
+    normalize_coin_input
+)
+from tokenomics.instrumentation import span, render_prometheus
+from tokenomics.scenarios import get_registry
+from tokenomics.score_matrix import get_score_matrix
+from tokenomics.scoring import calculate_viability_index, get_recommendations, REQUIRED_PARAMS
+
+
+# Taille maximale d'un corps de requête (1 Mo)
+MAX_BODY_BYTES = 1_000_000
+
+# Nombre maximal d'éléments dans /score/batch
+MAX_BATCH_SIZE = 1000
+
+# Réponse envoyée sans passer par le pool quand le serveur est saturé
+_OVERLOADED_BODY = json.dumps({'error': "Service surchargé, réessayez plus tard"}).encode('utf-8')
+_OVERLOADED_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Type: application/json; charset=utf-8\r\n"
+    b"Content-Length: " + str(len(_OVERLOADED_BODY)).encode() + b"\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n\r\n" + _OVERLOADED_BODY
+)
+
+
+class ServiceError(Exception):
+    """Erreur renvoyée au client avec un code HTTP."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class TTLCache:
+    """
+    Cache LRU thread-safe avec expiration (partagé par tous les workers).
+
+    Args:
+        maxsize: Nombre maximal d'entrées
+        ttl_seconds: Durée de validité d'une entrée
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 300):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() > expires_at:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ScoringService:
+    """
+    Logique métier du service, indépendante du transport HTTP.
+
+    Args:
+        cache: Cache partagé des tokens CoinGecko
+    """
+
+    def __init__(self, cache: Optional[TTLCache] = None):
+        self.cache = cache if cache is not None else TTLCache()
+        self._scenarios = None
+
+    @staticmethod
+    def _validate_params(params: Any) -> Dict[str, Any]:
+        if not isinstance(params, dict):
+            raise ServiceError(400, "Les paramètres doivent être un objet JSON")
+        missing = [key for key in REQUIRED_PARAMS if key not in params]
+        if missing:
+            raise ServiceError(400, f"Paramètres manquants : {', '.join(missing)}")
+        return params
+
+    def score(self, params: Any) -> Dict[str, Any]:
+        """Score un jeu de paramètres."""
+        params = self._validate_params(params)
+        try:
+            score_data = calculate_viability_index(params)
+        except (TypeError, ValueError) as e:
+            raise ServiceError(400, f"Paramètres invalides : {e}")
+        return {
+            'score_data': score_data,
+            'recommendations': get_recommendations(score_data)
+        }
+
+    def score_batch(self, payload: Any) -> List[Dict[str, Any]]:
+        """Score une liste de paramètres (ou {"items": [...]})."""
+        items = payload.get('items') if isinstance(payload, dict) else payload
+        if not isinstance(items, list):
+            raise ServiceError(400, "Le corps doit être une liste de paramètres ou {\"items\": [...]}")
+        if len(items) > MAX_BATCH_SIZE:
+            raise ServiceError(413, f"Batch trop grand (max {MAX_BATCH_SIZE} éléments)")
+
+        results = []
+        for params in items:
+            try:
+                results.append(self.score(params))
+            except ServiceError as e:
+                results.append({'error': e.message})
+        return results
+
+    def token(self, coin_input: str) -> Dict[str, Any]:
+        """Récupère (via le cache) et score un token CoinGecko."""
+        coin_id = normalize_coin_input(coin_input)
+        cached = self.cache.get(coin_id)
+        if cached is not None:
+            return cached
+
+        data = fetch_coingecko_data(coin_id)
+        if data is None:
+            raise ServiceError(404, f"Token '{coin_input}' non trouvé sur CoinGecko")
+
+        params = parse_coingecko_to_params(data)
+        params = enhance_params_with_known_data(params, coin_id)
+        result = {'id': coin_id, 'params': params}
+        result.update(self.score(params))
+        self.cache.set(coin_id, result)
+        return result
+
+    def precomputed(self, token_id: str) -> Dict[str, Any]:
+        """Scores d'un token lus dans la matrice du job de rafraîchissement (sans recalcul)."""
+        matrix = get_score_matrix()
+        if matrix is None:
+            raise ServiceError(503, "Matrice de scores non configurée (TOKENOMICS_SCORE_MATRIX)")
+        scores = matrix.get(token_id)
+        if scores is None:
+            scores = matrix.get(normalize_coin_input(token_id))
+        if scores is None:
+            raise ServiceError(404, f"Token '{token_id}' absent de la matrice de scores")
+        return {
+            'id': token_id,
+            'scores': scores,
+            'updated_at': matrix.created_at,
+            'current': matrix.is_current(),
+        }
+
+    def scenarios(self) -> List[Dict[str, Any]]:
+        """Liste des scénarios préconfigurés (calculée une seule fois)."""
+        if self._scenarios is None:
+            self._scenarios = [
+                get_registry().get(name).to_dict()
+                for names in get_registry().categories().values()
+                for name in names
+            ]
+        return self._scenarios
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routage des requêtes HTTP vers le ScoringService du serveur."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "TokenomicsAnalyzer/1.0"
+    # Ferme les connexions keep-alive inactives pour libérer les workers
+    timeout = 5
+    # Évite la latence de ~40 ms due à Nagle + ACK retardé sur les connexions keep-alive
+    disable_nagle_algorithm = True
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send_body(status, body, "application/json; charset=utf-8")
+
+    def _send_body(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if not self._body_read and self._has_body():
+            # Corps non lu (erreur, route inconnue) : il serait lu comme la requête suivante
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _has_body(self) -> bool:
+        return bool(self.headers.get("Transfer-Encoding")) or (self.headers.get("Content-Length") or "0").strip() != "0"
+
+    def _read_json(self) -> Any:
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise ServiceError(400, "Content-Length invalide")
+        if length < 0:
+            raise ServiceError(400, "Content-Length invalide")
+        if length > MAX_BODY_BYTES:
+            raise ServiceError(413, "Corps de requête trop volumineux")
+        raw = self.rfile.read(length) if length else b""
+        self._body_read = True
+        try:
+            return json.loads(raw or b"null")
+        except ValueError:
+            raise ServiceError(400, "JSON invalide")
+
+    def _route(self, method: str) -> Tuple[int, Any]:
+        path = urlsplit(self.path).path.rstrip('/') or '/'
+        service = self.server.service
+
+        if method == "GET":
+            if path == "/health":
+                return 200, {'status': 'ok', 'cached_tokens': len(service.cache)}
+            if path == "/scenarios":
+                return 200, service.scenarios()
+            if path.startswith("/token/"):
+                return 200, service.token(unquote(path[len("/token/"):]))
+            if path.startswith("/scores/"):
+                return 200, service.precomputed(unquote(path[len("/scores/"):]))
+        elif method == "POST":
+            if path == "/score":
+                return 200, service.score(self._read_json())
+            if path == "/score/batch":
+                return 200, service.score_batch(self._read_json())
+
+        raise ServiceError(404, f"Route inconnue : {method} {path}")
+
+    def _handle(self, method: str) -> None:
+        self._body_read = False
+        if method == "GET" and self.path == "/metrics":
+            body = render_prometheus().encode('utf-8')
+            self._send_body(200, body, "text/plain; version=0.0.4; charset=utf-8")
+            return
+
+        try:
+            with span(f"http.{method.lower()}"):
+                status, payload = self._route(method)
+        except ServiceError as e:
+            status, payload = e.status, {'error': e.message}
+        except Exception as e:
+            status, payload = 500, {'error': f"Erreur interne : {e}"}
+        self._send_json(status, payload)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            sys.stderr.write(f"[{os.getpid()}] {self.address_string()} - {format % args}\n")
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    Serveur HTTP qui traite les connexions dans un pool de threads borné.
+
+    Args:
+        server_address: (hôte, port)
+        service: Instance de ScoringService partagée
+        workers: Taille du pool (défaut : nombre de cœurs × 4)
+        queue_size: Connexions acceptées en attente d'un worker avant de
+            répondre 503 (défaut : workers × 2)
+        quiet: Désactiver les logs d'accès
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, service: ScoringService, workers: Optional[int] = None,
+                 quiet: bool = False, bind_and_activate: bool = True, queue_size: Optional[int] = None):
+        super().__init__(server_address, _RequestHandler, bind_and_activate)
+        self.service = service
+        self.quiet = quiet
+        self.workers = workers or (os.cpu_count() or 1) * 4
+        self.queue_size = queue_size if queue_size is not None else self.workers * 2
+        self.rejected = 0
+        self._start_pool()
+
+    def _start_pool(self) -> None:
+        """Crée le pool de threads et les places de traitement (aussi après un fork)."""
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tokenomics-http")
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+
+    def _process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def _reject(self, request) -> None:
+        """Répond 503 depuis le thread d'acceptation et ferme la connexion."""
+        self.rejected += 1
+        try:
+            request.settimeout(1)
+            request.sendall(_OVERLOADED_RESPONSE)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            self._reject(request)
+            return
+        try:
+            self._executor.submit(self._process, request, client_address)
+        except RuntimeError:
+            # Pool arrêté (fermeture du serveur)
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._executor.shutdown(wait=False)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: Optional[int] = None,
+    processes: int = 1,
+    quiet: bool = False,
+    queue_size: Optional[int] = None
+) -> None:
+    """
+    Lance le service HTTP (bloquant).
+
+    Chaque processus a son propre cache de tokens (non partagé entre processus).
+
+    Args:
+        host: Adresse d'écoute
+        port: Port d'écoute
+        workers: Threads par processus (défaut : nombre de cœurs × 4)
+        processes: Nombre de processus partageant le socket (0 = nombre de cœurs)
+        quiet: Désactiver les logs d'accès
+        queue_size: Connexions en attente par processus avant de répondre 503
+            (défaut : workers × 2)
+    """
+    if processes == 0:
+        processes = os.cpu_count() or 1
+    if processes > 1 and not hasattr(os, "fork"):
+        print("⚠️ Mode multi-processus indisponible sur cette plateforme, 1 processus utilisé", file=sys.stderr)
+        processes = 1
+
+    server = PooledHTTPServer((host, port), ScoringService(), workers=workers, quiet=quiet, queue_size=queue_size)
+    print(
+        f"🚀 Service Tokenomics sur http://{host}:{server.server_address[1]} "
+        f"({processes} processus × {server.workers} workers)",
+        file=sys.stderr
+    )
+
+    children = []
+    if processes > 1:
+        for _ in range(processes - 1):
+            pid = os.fork()
+            if pid == 0:
+                # Processus enfant : son propre pool et son propre cache (non partagé)
+                server.service = ScoringService()
+                server._start_pool()
+                try:
+                    server.serve_forever()
+                finally:
+                    os._exit(0)
+            children.append(pid)
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for pid in children:
+            try:
+                os.kill(pid, 15)
+            except OSError:
+                pass
@@ -0,0 +1,105 @@
+"""
+Simulation stochastique de la supply : émissions contre burn piloté par le volume.
+
+Modèle mensuel, pour chaque trajectoire :
+- le log du volume suit un processus d'Ornstein-Uhlenbeck autour de son niveau
+  actuel (dérive annuelle, volatilité annuelle, force de rappel),
+- le burn du mois vaut `burn_rate` (% de la supply par an au volume actuel)
+  multiplié par le ratio volume simulé / volume actuel,
+- les émissions suivent `inflation_rate` (% par an), composées mensuellement.
+
+Supply(t) = Supply(0) × Π (1 + émission - burn(t)), calculée par produit
+cumulé sur un tableau (trajectoires × mois). Le résultat est résumé en
+quantiles pour un graphique en éventail.
+"""
+
+from typing import Dict, Any, Optional, Sequence
+
+import numpy as np
+
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Hypothèses de marché par défaut (annuelles)
+DEFAULT_VOLUME_VOLATILITY = 0.8
+DEFAULT_VOLUME_DRIFT = 0.0
+DEFAULT_MEAN_REVERSION = 1.0
+
+
+def simulate_burn(
+    params: Dict[str, Any],
+    years: int = 5,
+    paths: int = 10_000,
+    volume_volatility: float = DEFAULT_VOLUME_VOLATILITY,
+    volume_drift: float = DEFAULT_VOLUME_DRIFT,
+    mean_reversion: float = DEFAULT_MEAN_REVERSION,
+    quantiles: Sequence[float] = DEFAULT_QUANTILES,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Monte Carlo de la supply avec burn proportionnel au volume.
+
+    Args:
+        params: Paramètres du token (circulating_supply, inflation_rate,
+            burn_rate, volume_24h optionnel)
+        years: Horizon en années (pas mensuel)
+        paths: Nombre de trajectoires
+        volume_volatility: Volatilité annuelle du log-volume
+        volume_drift: Dérive annuelle du log-volume
+        mean_reversion: Force de rappel annuelle du log-volume (0 = marche aléatoire)
+        quantiles: Quantiles retournés (entre 0 et 1)
+        seed: Graine du générateur (résultats reproductibles)
+
+    Returns:
+        {
+            'months': (mois + 1,),
+            'quantiles': niveaux,
+            'supply': quantiles de la supply (q, mois + 1),
+            'burned': quantiles des tokens brûlés cumulés (q, mois + 1),
+            'volume': quantiles du volume 24h (q, mois + 1),
+            'net_inflation_pct': quantiles de l'inflation nette sur l'horizon (q,),
+            'prob_deflation': part des trajectoires finissant sous la supply initiale
+        }
+    """
+    months = years * 12
+    dt = 1.0 / 12
+    rng = np.random.default_rng(seed)
+
+    supply0 = float(params['circulating_supply'])
+    volume0 = float(params.get('volume_24h') or 0.0)
+    emission = (1.0 + params['inflation_rate'] / 100.0) ** dt - 1.0
+    base_burn = params.get('burn_rate', 0.0) / 100.0 * dt
+
+    # Log du ratio volume / volume actuel (AR(1) discrétisé, colonnes = mois)
+    shocks = rng.standard_normal((months, paths))
+    shocks *= volume_volatility * np.sqrt(dt)
+    shocks += (volume_drift - 0.5 * volume_volatility ** 2) * dt
+    keep = 1.0 - mean_reversion * dt
+    log_ratio = np.empty((months + 1, paths))
+    log_ratio[0] = 0.0
+    for t in range(months):
+        np.multiply(log_ratio[t], keep, out=log_ratio[t + 1])
+        log_ratio[t + 1] += shocks[t]
+    ratio = np.exp(log_ratio, out=log_ratio)
+
+    # Burn du mois t calculé sur le volume du début de mois
+    growth = 1.0 + emission - base_burn * ratio[:-1]
+    np.maximum(growth, 0.0, out=growth)
+    factors = np.empty((months + 1, paths))
+    factors[0] = 1.0
+    np.cumprod(growth, axis=0, out=factors[1:])
+
+    burned = np.zeros((months + 1, paths))
+    np.cumsum(factors[:-1] * (base_burn * ratio[:-1]), axis=0, out=burned[1:])
+
+    levels = np.asarray(quantiles, dtype=float)
+    supply_q = np.quantile(factors, levels, axis=1) * supply0
+    return {
+        'months': np.arange(months + 1),
+        'quantiles': tuple(levels.tolist()),
+        'supply': supply_q,
+        'burned': np.quantile(burned, levels, axis=1) * supply0,
+        'volume': np.quantile(ratio, levels, axis=1) * volume0,
+        'net_inflation_pct': (supply_q[:, -1] / supply0 - 1.0) * 100.0 if supply0 > 0 else np.zeros(len(levels)),
+        'prob_deflation': float(np.mean(factors[-1] < 1.0)),
+    }
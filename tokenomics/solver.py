@@ -0,0 +1,302 @@
+"""
+Solveur inverse : changement de paramètres le moins coûteux pour atteindre un score cible.
+
+Le score est constant par morceaux : il ne change qu'aux seuils des barèmes
+de scoring.py. Pour chaque paramètre ajustable, seules quelques valeurs
+candidates sont donc utiles : la valeur actuelle et les deux côtés de chaque
+seuil (le point de chaque intervalle le plus proche de la valeur actuelle).
+
+Le score final étant une somme pondérée de composantes, les paramètres sont
+regroupés en blocs indépendants (inflation + incitations, distribution +
+gouvernance, utilité). Chaque bloc est énuméré sur ses candidats avec le
+scoring vectorisé, réduit à sa frontière de Pareto (coût, contribution),
+puis les frontières sont combinées.
+
+Coût d'un changement : |nouvelle valeur - valeur actuelle| × coût unitaire du
+paramètre (DEFAULT_COSTS, ajustable), coût fixe pour basculer un booléen.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tokenomics.scoring import SCORE_WEIGHTS, calculate_viability_index, calculate_viability_index_vectorized
+from tokenomics.sweep import ParameterGrid
+
+
+# Seuils des barèmes (synchronisés avec scoring.py) :
+# (seuil, True si le seuil appartient à l'intervalle inférieur, ex : x <= 5 ou x > 10)
+BREAKPOINTS: Dict[str, List[Tuple[float, bool]]] = {
+    'inflation_rate': [(0, False), (0, True), (2, True), (5, True), (10, True), (20, True)],
+    'emission_years_left': [(0, True), (5, True), (10, True)],
+    'team_allocation': [(10, True), (15, True), (20, True), (30, True)],
+    'vesting_years': [(2, False), (3, False), (4, False)],
+    'top_10_concentration': [(20, True), (30, True), (35, True), (40, True), (50, True), (60, True)],
+    'lock_duration_months': [(6, False), (12, False), (24, False)],
+    'burn_rate': [(0, True), (0.5, False), (1.0, False)],
+}
+
+# Paramètres à valeurs entières (pas de 1 autour des seuils)
+INTEGER_PARAMS = ('emission_years_left', 'vesting_years', 'lock_duration_months')
+
+# Bornes de validité
+PARAM_BOUNDS = {
+    'inflation_rate': (-100.0, None),
+    'team_allocation': (0.0, 100.0),
+    'top_10_concentration': (0.0, 100.0),
+}
+
+# Coût unitaire de chaque changement (par point de %, par an, par mois ou par bascule)
+DEFAULT_COSTS = {
+    'inflation_rate': 1.0,
+    'emission_years_left': 1.0,
+    'team_allocation': 1.0,
+    'vesting_years': 2.0,
+    'top_10_concentration': 1.0,
+    'lock_duration_months': 0.25,
+    'burn_rate': 2.0,
+    'utility_gas': 10.0,
+    'utility_staking': 5.0,
+    'utility_governance': 5.0,
+    'utility_collateral': 5.0,
+    'utility_discount': 5.0,
+    'gov_timelock': 5.0,
+    'gov_multisig': 5.0,
+    'gov_dao_active': 5.0,
+    'incentive_lock': 5.0,
+    'incentive_staking': 5.0,
+    'incentive_burn': 5.0,
+}
+
+# Blocs de paramètres indépendants et composantes qu'ils déterminent
+BLOCKS = (
+    (
+        ('inflation', 'incentives'),
+        ('inflation_rate', 'emission_years_left', 'incentive_lock', 'incentive_staking',
+         'incentive_burn', 'lock_duration_months', 'burn_rate'),
+    ),
+    (
+        ('distribution', 'governance'),
+        ('team_allocation', 'vesting_years', 'top_10_concentration',
+         'gov_timelock', 'gov_multisig', 'gov_dao_active'),
+    ),
+    (
+        ('utility',),
+        ('utility_gas', 'utility_staking', 'utility_governance', 'utility_collateral', 'utility_discount'),
+    ),
+)
+
+# Écart autour d'un seuil pour les paramètres continus
+EPSILON = 0.01
+
+
+def _normalize(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copie des paramètres aux types attendus par le solveur.
+
+    Les drapeaux sont ramenés à des booléens (1, 0, "oui"... -> bool) et les
+    paramètres continus à des nombres.
+
+    Raises:
+        ValueError: Paramètre ajustable manquant, nul ou non numérique
+    """
+    missing = [name for name in DEFAULT_COSTS if params.get(name) is None]
+    if missing:
+        raise ValueError(f"Solveur : paramètres manquants ({', '.join(missing)})")
+
+    normalized = dict(params)
+    for name in DEFAULT_COSTS:
+        value = params[name]
+        if name not in BREAKPOINTS:
+            normalized[name] = bool(value)
+        elif not isinstance(value, (int, float)) or isinstance(value, bool):
+            try:
+                normalized[name] = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Solveur : '{name}' doit être numérique ({value!r})") from None
+    return normalized
+
+
+def _candidates(name: str, current: Any, params: Dict[str, Any]) -> np.ndarray:
+    """Valeurs candidates d'un paramètre ajustable."""
+    if name not in BREAKPOINTS:
+        return np.array([bool(current), not current], dtype=bool)
+
+    step = 1 if name in INTEGER_PARAMS else EPSILON
+    values = {float(current)}
+    for threshold, closed_upper in BREAKPOINTS[name]:
+        values.update((threshold, threshold + step) if closed_upper else (threshold - step, threshold))
+
+    # Condition croisée des incitations : burn_rate > inflation_rate
+    if name == 'burn_rate':
+        for threshold, _ in BREAKPOINTS['inflation_rate']:
+            values.add(max(threshold, params['inflation_rate']) + EPSILON)
+        values.add(params['inflation_rate'] + EPSILON)
+    elif name == 'inflation_rate':
+        values.add(params['burn_rate'] - EPSILON)
+
+    low, high = PARAM_BOUNDS.get(name, (0.0, None))
+    candidates = np.array(sorted(values))
+    candidates = candidates[candidates >= low]
+    if high is not None:
+        candidates = candidates[candidates <= high]
+    return np.unique(np.round(candidates, 6))
+
+
+def _change_cost(name: str, current: Any, values: np.ndarray, costs: Dict[str, float]) -> np.ndarray:
+    unit = costs.get(name, 1.0)
+    if values.dtype == bool:
+        return (values != bool(current)) * unit
+    return np.abs(values - float(current)) * unit
+
+
+def _block_frontier(
+    params: Dict[str, Any],
+    names: Sequence[str],
+    adjustable: set,
+    costs: Dict[str, float],
+    components: Sequence[str]
+) -> Dict[str, Any]:
+    """
+    Énumère les candidats d'un bloc et garde la frontière de Pareto.
+
+    Returns:
+        {'names', 'values': {nom: (k,)}, 'cost': (k,), 'contribution': (k,),
+         'components': {composante: (k,)}} triés par coût croissant
+    """
+    ranges = {
+        name: _candidates(name, params[name], params) if name in adjustable
+        else np.array([params[name]])
+        for name in names
+    }
+    grid = ParameterGrid(ranges)
+    columns = grid.chunk(0, grid.size)
+    scores = calculate_viability_index_vectorized({**params, **columns})
+
+    cost = np.zeros(grid.size)
+    for name in names:
+        cost += _change_cost(name, params[name], columns[name], costs)
+    contribution = sum(scores[f'{c}_score'] * SCORE_WEIGHTS[c] for c in components)
+
+    # Frontière : coût croissant, contribution strictement croissante
+    order = np.lexsort((-contribution, cost))
+    best_so_far = np.maximum.accumulate(contribution[order])
+    keep = np.ones(len(order), dtype=bool)
+    keep[1:] = best_so_far[1:] > best_so_far[:-1]
+    selected = order[keep]
+
+    return {
+        'names': list(names),
+        'values': {name: columns[name][selected] for name in names},
+        'cost': cost[selected],
+        'contribution': contribution[selected],
+        'components': {c: scores[f'{c}_score'][selected] for c in components},
+    }
+
+
+def solve_target(
+    params: Dict[str, Any],
+    target: float = 65.0,
+    metric: str = 'final_score',
+    adjustable: Optional[Sequence[str]] = None,
+    costs: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
+    """
+    Cherche le changement de paramètres le moins coûteux atteignant la cible.
+
+    Args:
+        params: Paramètres actuels du token
+        target: Score cible (ex : 65 pour "Bon")
+        metric: 'final_score' ou une composante ('distribution_score', ...)
+        adjustable: Paramètres modifiables (défaut : tous ceux de DEFAULT_COSTS)
+        costs: Coûts unitaires remplaçant ceux de DEFAULT_COSTS
+
+    Returns:
+        {
+            'reachable': bool,
+            'metric', 'target',
+            'current_score': score actuel,
+            'score': score obtenu (meilleur score atteignable si inaccessible),
+            'cost': coût total du changement,
+            'changes': {paramètre: {'from', 'to'}},
+            'params': paramètres modifiés
+        }
+
+    Raises:
+        ValueError: Paramètre ajustable manquant ou non numérique, métrique non ajustable
+    """
+    params = _normalize(params)
+    costs = {**DEFAULT_COSTS, **(costs or {})}
+    adjustable = set(DEFAULT_COSTS if adjustable is None else adjustable) & set(DEFAULT_COSTS)
+    current_score = calculate_viability_index(params)[metric]
+    result = {
+        'reachable': True,
+        'metric': metric,
+        'target': target,
+        'current_score': current_score,
+        'score': current_score,
+        'cost': 0.0,
+        'changes': {},
+        'params': dict(params),
+    }
+    if current_score >= target:
+        return result
+
+    if metric == 'final_score':
+        blocks = BLOCKS
+    else:
+        component = metric[:-len('_score')]
+        blocks = [((component,), names) for components, names in BLOCKS if component in components]
+        if not blocks:
+            raise ValueError(f"Métrique non ajustable : {metric}")
+
+    frontiers = [
+        _block_frontier(params, names, adjustable, costs, components)
+        for components, names in blocks
+    ]
+
+    if metric == 'final_score':
+        # Contribution des composantes de marché (non ajustables)
+        scores = calculate_viability_index_vectorized(params)
+        fixed = sum(float(scores[f'{c}_score']) * SCORE_WEIGHTS[c] for c in ('liquidity', 'adoption', 'security'))
+
+        cost = fixed_total = None
+        for frontier in frontiers:
+            if cost is None:
+                cost, fixed_total = frontier['cost'], frontier['contribution'] + fixed
+            else:
+                cost = np.add.outer(cost, frontier['cost'])
+                fixed_total = np.add.outer(fixed_total, frontier['contribution'])
+        achieved = np.round(np.minimum(fixed_total, 100), 1)
+    else:
+        frontier = frontiers[0]
+        cost = frontier['cost']
+        achieved = frontier['components'][component]
+
+    feasible = achieved >= target
+    if feasible.any():
+        masked = np.where(feasible, cost, np.inf)
+        flat = int(np.argmin(masked))
+    else:
+        flat = int(np.argmax(achieved))
+    indices = np.unravel_index(flat, achieved.shape)
+
+    new_params = dict(params)
+    changes = {}
+    for frontier, index in zip(frontiers, indices):
+        for name in frontier['names']:
+            value = frontier['values'][name][index].item()
+            if name in INTEGER_PARAMS:
+                value = int(round(value))
+            if value != params[name]:
+                new_params[name] = value
+                changes[name] = {'from': params[name], 'to': value}
+
+    result.update(
+        reachable=bool(feasible.any()),
+        score=calculate_viability_index(new_params)[metric],
+        cost=round(float(cost[indices]), 4),
+        changes=changes,
+        params=new_params,
+    )
+    return result
@@ -0,0 +1,272 @@
+"""
+Balayage de paramètres (grid sweep) sur le Tokenomics Viability Index.
+
+Exemple : quelles combinaisons d'inflation, d'allocation team, de vesting et
+de durée de lock gardent le score au-dessus de 65 ?
+
+    python -m tokenomics sweep --base "Projet early-stage" \
+        -p inflation_rate=0:30:0.5 -p team_allocation=0:40:1 \
+        -p vesting_years=0:6:1 -p lock_duration_months=0:48:3 \
+        --min-score 65 -o sweep.parquet
+
+La grille cartésienne n'est jamais matérialisée : chaque bloc de points est
+décodé à partir de son intervalle d'indices (`np.unravel_index`), scoré par
+`calculate_viability_index_vectorized` dans un pool de processus, puis écrit
+en flux (Parquet ou CSV). Le nombre de blocs en cours est borné, la mémoire
+reste donc proportionnelle à `chunk_size`, quelle que soit la taille de la
+grille (10^6 à 10^7 points et plus).
+"""
+
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from tokenomics.profiling import profiled
+from tokenomics.scenarios import get_scenario_params
+from tokenomics.scoring import REQUIRED_PARAMS, OPTIONAL_PARAMS, calculate_viability_index_vectorized
+
+
+SCORE_FIELDS = (
+    'final_score', 'inflation_score', 'distribution_score', 'utility_score', 'governance_score',
+    'incentives_score', 'liquidity_score', 'adoption_score', 'security_score',
+)
+
+SWEEP_FORMATS = ('parquet', 'csv')
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+_BOOL_PARAMS = {key for key in REQUIRED_PARAMS if key.startswith(('utility_', 'gov_', 'incentive_'))}
+
+
+def parse_range(spec: str) -> Tuple[str, np.ndarray]:
+    """
+    Lit une plage de la ligne de commande.
+
+    Formats acceptés :
+        nom=début:fin:pas   (fin incluse)
+        nom=v1,v2,v3
+        nom=true,false      (paramètres booléens)
+
+    Returns:
+        (nom du paramètre, valeurs)
+    """
+    if '=' not in spec:
+        raise ValueError(f"Plage invalide '{spec}' (attendu : nom=début:fin:pas ou nom=v1,v2,...)")
+    name, values = spec.split('=', 1)
+    name = name.strip()
+
+    if name in _BOOL_PARAMS:
+        flags = {'true': True, '1': True, 'oui': True, 'false': False, '0': False, 'non': False}
+        try:
+            return name, np.array([flags[v.strip().lower()] for v in values.split(',')], dtype=bool)
+        except KeyError as e:
+            raise ValueError(f"Valeur booléenne invalide pour {name} : {e}")
+
+    try:
+        if ':' in values:
+            start, stop, step = (float(v) for v in values.split(':'))
+            if step <= 0:
+                raise ValueError("le pas doit être > 0")
+            # Arrondi : évite les 0.30000000000000004 de np.arange
+            return name, np.round(np.arange(start, stop + step / 2, step), 10)
+        return name, np.array([float(v) for v in values.split(',')])
+    except ValueError as e:
+        raise ValueError(f"Plage invalide pour {name} : {e}")
+
+
+class ParameterGrid:
+    """
+    Grille cartésienne paresseuse sur des paramètres du schéma de scoring.
+
+    Le point d'indice i correspond à np.unravel_index(i, shape) : le dernier
+    paramètre varie le plus vite.
+    """
+
+    def __init__(self, ranges: Dict[str, Union[Sequence, np.ndarray]]):
+        allowed = set(REQUIRED_PARAMS) | set(OPTIONAL_PARAMS)
+        unknown = [name for name in ranges if name not in allowed]
+        if unknown:
+            raise ValueError(f"Paramètre(s) inconnu(s) : {', '.join(unknown)}")
+        if not ranges:
+            raise ValueError("Aucun paramètre à balayer")
+
+        self.names = list(ranges)
+        self.values = [np.asarray(values) for values in ranges.values()]
+        empty = [name for name, values in zip(self.names, self.values) if values.size == 0]
+        if empty:
+            raise ValueError(f"Plage vide : {', '.join(empty)}")
+        self.shape = tuple(len(values) for values in self.values)
+        self.size = int(np.prod(self.shape, dtype=np.int64))
+
+    def chunk(self, start: int, stop: int) -> Dict[str, np.ndarray]:
+        """Colonnes des points [start, stop) de la grille."""
+        indices = np.unravel_index(np.arange(start, min(stop, self.size), dtype=np.int64), self.shape)
+        return {name: values[idx] for name, values, idx in zip(self.names, self.values, indices)}
+
+
+def _score_chunk(
+    base_params: Dict[str, Any],
+    grid: ParameterGrid,
+    start: int,
+    stop: int,
+    min_score: Optional[float]
+) -> Dict[str, np.ndarray]:
+    """Scorer un bloc (exécuté dans un processus du pool)."""
+    columns = grid.chunk(start, stop)
+    scores = calculate_viability_index_vectorized({**base_params, **columns})
+
+    result = dict(columns)
+    for field in SCORE_FIELDS:
+        result[field] = scores[field].astype(np.float32)
+
+    if min_score is not None:
+        keep = scores['final_score'] >= min_score
+        result = {key: values[keep] for key, values in result.items()}
+    return result
+
+
+class _ColumnWriter:
+    """Écriture en flux de blocs de colonnes (Parquet ou CSV), via un fichier temporaire."""
+
+    def __init__(self, output_path: str, fmt: str, grid: ParameterGrid):
+        self.output_path = output_path
+        self.tmp_path = f"{output_path}.tmp"
+        self.fmt = fmt
+        self.fields = grid.names + list(SCORE_FIELDS)
+
+        try:
+            import pyarrow as pa
+        except ImportError:
+            pa = None
+        if fmt == 'parquet' and pa is None:
+            raise ImportError("L'export Parquet nécessite pyarrow : pip install pyarrow")
+
+        self._pa = pa
+        self._file = None
+        if pa is not None:
+            types = [pa.from_numpy_dtype(values.dtype) for values in grid.values]
+            self.schema = pa.schema(
+                list(zip(grid.names, types)) + [(field, pa.float32()) for field in SCORE_FIELDS]
+            )
+            if fmt == 'parquet':
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.tmp_path, self.schema)
+            else:
+                import pyarrow.csv as pa_csv
+                self._writer = pa_csv.CSVWriter(self.tmp_path, self.schema)
+        else:
+            # CSV sans pyarrow : pandas (plus lent)
+            self._file = open(self.tmp_path, 'w', encoding='utf-8', newline='')
+            self._file.write(",".join(self.fields) + "\n")
+
+    def write(self, columns: Dict[str, np.ndarray]) -> None:
+        if self._file is None:
+            self._writer.write_table(self._pa.table(
+                [columns[field] for field in self.fields], schema=self.schema
+            ))
+        else:
+            import pandas as pd
+            pd.DataFrame({field: columns[field] for field in self.fields}).to_csv(
+                self._file, header=False, index=False
+            )
+
+    def close(self, commit: bool = True) -> None:
+        if self._file is None:
+            self._writer.close()
+        else:
+            self._file.close()
+        if commit:
+            os.replace(self.tmp_path, self.output_path)
+        else:
+            os.remove(self.tmp_path)
+
+
+@profiled("sweep.run_sweep")
+def run_sweep(
+    ranges: Dict[str, Union[Sequence, np.ndarray]],
+    output_path: str,
+    base: Union[str, Dict[str, Any], None] = None,
+    fmt: Optional[str] = None,
+    min_score: Optional[float] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    processes: Optional[int] = None,
+    progress: bool = True
+) -> Dict[str, Any]:
+    """
+    Score toute la grille et écrit les points retenus dans un fichier colonnaire.
+
+    Args:
+        ranges: {paramètre: valeurs} à combiner
+        output_path: Fichier de sortie (.parquet ou .csv)
+        base: Nom/id de scénario ou dictionnaire fournissant les autres paramètres
+            (défaut : scénario par défaut)
+        fmt: "parquet" ou "csv" (défaut : déduit de l'extension)
+        min_score: N'écrire que les points avec final_score >= min_score
+        chunk_size: Nombre de points par bloc
+        processes: Taille du pool (défaut : nombre de cœurs, 1 = sans pool)
+        progress: Afficher l'avancement sur stderr
+
+    Returns:
+        {'points', 'written', 'best_score', 'best': paramètres du meilleur point}
+    """
+    grid = ParameterGrid(ranges)
+    base_params = dict(base) if isinstance(base, dict) else get_scenario_params(base or "")
+    base_params = {key: value for key, value in base_params.items() if key not in grid.names}
+
+    fmt = fmt or os.path.splitext(output_path)[1].lstrip('.').lower()
+    if fmt not in SWEEP_FORMATS:
+        raise ValueError(f"Format non supporté : {fmt} (formats : {', '.join(SWEEP_FORMATS)})")
+
+    processes = processes or os.cpu_count() or 1
+    starts = range(0, grid.size, chunk_size)
+    stats = {'points': grid.size, 'written': 0, 'best_score': None, 'best': None}
+    started = time.time()
+    done = 0
+
+    def consume(columns: Dict[str, np.ndarray]) -> None:
+        nonlocal done
+        writer.write(columns)
+        stats['written'] += len(columns['final_score'])
+        if len(columns['final_score']):
+            i = int(np.argmax(columns['final_score']))
+            if stats['best_score'] is None or columns['final_score'][i] > stats['best_score']:
+                stats['best_score'] = round(float(columns['final_score'][i]), 1)
+                stats['best'] = {name: columns[name][i].item() for name in grid.names}
+        done += 1
+        if progress:
+            elapsed = time.time() - started
+            points = min(done * chunk_size, grid.size)
+            print(
+                f"[{points}/{grid.size}] {points / grid.size * 100:.1f}% - "
+                f"{points / elapsed if elapsed > 0 else 0:,.0f} points/s - {stats['written']} retenu(s)",
+                file=sys.stderr
+            )
+
+    writer = _ColumnWriter(output_path, fmt, grid)
+    try:
+        if processes == 1:
+            for start in starts:
+                consume(_score_chunk(base_params, grid, start, start + chunk_size, min_score))
+        else:
+            # Au plus 2 blocs en attente par processus : mémoire bornée
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                pending = deque()
+                for start in starts:
+                    pending.append(executor.submit(
+                        _score_chunk, base_params, grid, start, start + chunk_size, min_score
+                    ))
+                    if len(pending) >= processes * 2:
+                        consume(pending.popleft().result())
+                while pending:
+                    consume(pending.popleft().result())
+    except BaseException:
+        writer.close(commit=False)
+        raise
+    writer.close()
+
+    return stats
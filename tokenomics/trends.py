@@ -0,0 +1,408 @@
+"""
+Historique des scores par token : backfill et stockage colonnaire.
+
+Le backfill relit des snapshots journaliers (fichiers JSONL, une ligne par
+token et par jour) et les fait passer dans le scoring vectorisé :
+
+    {"date": "2024-03-01", "id": "ethereum", "data": {... réponse CoinGecko ...}}
+    {"date": "2024-03-01", "id": "mon-token", "params": {... paramètres ...}}
+
+Les scores par composante sont ajoutés au `TrendStore`, un stockage
+colonnaire en ajout seul :
+
+    store/
+      tokens.json                 # ids des tokens (index = code entier)
+      segments/000001/
+        meta.json                 # lignes, jours min/max
+        key.npy                   # code token × 2^32 + jour (trié)
+        final_score.npy, ...      # une colonne float32 par score
+
+Chaque segment est trié par (token, jour) : une requête sur un token et une
+plage de dates se résout par recherche dichotomique (`np.searchsorted`) dans
+les colonnes ouvertes en mmap, sans lire le reste du segment. En cas de
+doublon (token, jour), la ligne du segment le plus récent l'emporte ;
+`compact()` fusionne les segments.
+
+L'application affiche l'historique d'un token analysé si la variable
+TOKENOMICS_TREND_STORE désigne un stockage le contenant.
+"""
+
+import json
+import os
+import sys
+import threading
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from tokenomics.api import parse_coingecko_to_params, enhance_params_with_known_data
+from tokenomics.params import FIELDS, TokenParams
+from tokenomics.scoring import REQUIRED_PARAMS, OPTIONAL_PARAMS, SECURITY_DB, calculate_viability_index_vectorized
+from tokenomics.sweep import SCORE_FIELDS
+
+
+# Lignes scorées et écrites par segment lors d'un backfill
+DEFAULT_SEGMENT_ROWS = 500_000
+
+_DAY_BITS = 32
+_DAY_OFFSET = 1 << 31
+
+
+def to_day(value: Any) -> int:
+    """Convertit une date ('2024-03-01', datetime, np.datetime64) en jours depuis 1970."""
+    return int(np.datetime64(value, 'D').astype(np.int64))
+
+
+def from_days(days: np.ndarray) -> np.ndarray:
+    """Jours depuis 1970 → tableau datetime64[D]."""
+    return np.asarray(days, dtype=np.int64).astype('datetime64[D]')
+
+
+def _encode(tokens: np.ndarray, days: np.ndarray) -> np.ndarray:
+    return (tokens.astype(np.int64) << _DAY_BITS) | (days.astype(np.int64) + _DAY_OFFSET)
+
+
+def _decode_days(keys: np.ndarray) -> np.ndarray:
+    return (keys & ((1 << _DAY_BITS) - 1)) - _DAY_OFFSET
+
+
+class TrendStore:
+    """
+    Stockage colonnaire en ajout seul des scores journaliers par token.
+
+    Args:
+        directory: Répertoire du stockage (créé si absent)
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._segments_dir = os.path.join(directory, "segments")
+        os.makedirs(self._segments_dir, exist_ok=True)
+
+        self._tokens_path = os.path.join(directory, "tokens.json")
+        self.tokens: List[str] = []
+        self._codes: Dict[str, int] = {}
+        self._tokens_mtime = None
+        self._segments = {}
+        self._refresh_tokens()
+
+    def _refresh_tokens(self) -> None:
+        """Relit tokens.json s'il a été modifié (backfill d'un autre processus)."""
+        try:
+            mtime = os.stat(self._tokens_path).st_mtime_ns
+        except OSError:
+            return
+        if mtime != self._tokens_mtime:
+            with open(self._tokens_path, 'r', encoding='utf-8') as f:
+                self.tokens = json.load(f)
+            self._codes = {token: code for code, token in enumerate(self.tokens)}
+            self._tokens_mtime = mtime
+
+    def __contains__(self, token: str) -> bool:
+        self._refresh_tokens()
+        return token in self._codes
+
+    def _segment_names(self) -> List[str]:
+        return sorted(name for name in os.listdir(self._segments_dir) if name.isdigit())
+
+    def _segment(self, name: str) -> Dict[str, Any]:
+        """Métadonnées et colonnes (mmap) d'un segment, ouvertes une seule fois."""
+        segment = self._segments.get(name)
+        if segment is None:
+            path = os.path.join(self._segments_dir, name)
+            with open(os.path.join(path, "meta.json"), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            columns = {
+                field: np.load(os.path.join(path, f"{field}.npy"), mmap_mode='r')
+                for field in ('key',) + SCORE_FIELDS
+            }
+            segment = self._segments[name] = {'meta': meta, 'columns': columns}
+        return segment
+
+    def _encode_tokens(self, token_ids: Sequence[str]) -> np.ndarray:
+        """Codes entiers des tokens (les nouveaux sont ajoutés à tokens.json)."""
+        self._refresh_tokens()
+        added = False
+        codes = np.empty(len(token_ids), dtype=np.int64)
+        for i, token in enumerate(token_ids):
+            code = self._codes.get(token)
+            if code is None:
+                code = self._codes[token] = len(self.tokens)
+                self.tokens.append(token)
+                added = True
+            codes[i] = code
+        if added:
+            tmp_path = f"{self._tokens_path}.tmp{os.getpid()}"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.tokens, f)
+            os.replace(tmp_path, self._tokens_path)
+            self._tokens_mtime = os.stat(self._tokens_path).st_mtime_ns
+        return codes
+
+    def append(self, token_ids: Sequence[str], days: Sequence[int], scores: Dict[str, np.ndarray]) -> int:
+        """
+        Ajoute un segment de lignes (token, jour, scores).
+
+        Args:
+            token_ids: Id du token de chaque ligne
+            days: Jour de chaque ligne (jours depuis 1970, voir `to_day`)
+            scores: {champ de SCORE_FIELDS: valeurs}
+
+        Returns:
+            Nombre de lignes écrites
+        """
+        if not len(token_ids):
+            return 0
+        days = np.asarray(days, dtype=np.int64)
+        keys = _encode(self._encode_tokens(token_ids), days)
+        order = np.argsort(keys, kind='stable')
+
+        # Doublons dans le lot : la dernière ligne l'emporte
+        keys = keys[order]
+        last = np.ones(len(keys), dtype=bool)
+        last[:-1] = keys[1:] != keys[:-1]
+        order, keys = order[last], keys[last]
+
+        names = self._segment_names()
+        name = f"{int(names[-1]) + 1 if names else 1:06d}"
+        path = os.path.join(self._segments_dir, name)
+        tmp_path = f"{path}.tmp"
+        os.makedirs(tmp_path, exist_ok=True)
+
+        np.save(os.path.join(tmp_path, "key.npy"), keys)
+        for field in SCORE_FIELDS:
+            np.save(os.path.join(tmp_path, f"{field}.npy"), np.asarray(scores[field], dtype=np.float32)[order])
+        with open(os.path.join(tmp_path, "meta.json"), 'w', encoding='utf-8') as f:
+            json.dump({'rows': len(keys), 'day_min': int(days.min()), 'day_max': int(days.max())}, f)
+        # Le segment n'apparaît qu'une fois complet
+        os.replace(tmp_path, path)
+        return len(keys)
+
+    def query(
+        self,
+        token: str,
+        start: Any = None,
+        end: Any = None,
+        fields: Sequence[str] = SCORE_FIELDS
+    ) -> Dict[str, np.ndarray]:
+        """
+        Scores journaliers d'un token sur une plage de dates.
+
+        Args:
+            token: Id du token
+            start: Premier jour inclus (date ISO, datetime ou jours ; None = début)
+            end: Dernier jour inclus (None = fin)
+            fields: Scores à retourner
+
+        Returns:
+            {'date': datetime64[D], champ: float32} triés par date
+        """
+        result = {'date': from_days(np.empty(0))}
+        result.update({field: np.empty(0, dtype=np.float32) for field in fields})
+        self._refresh_tokens()
+        code = self._codes.get(token)
+        if code is None:
+            return result
+
+        day_min = -_DAY_OFFSET if start is None else (start if isinstance(start, (int, np.integer)) else to_day(start))
+        day_max = _DAY_OFFSET - 1 if end is None else (end if isinstance(end, (int, np.integer)) else to_day(end))
+        low, high = _encode(np.array([code, code]), np.array([day_min, day_max]))
+
+        keys, parts = [], {field: [] for field in fields}
+        for name in self._segment_names():
+            segment = self._segment(name)
+            meta = segment['meta']
+            if meta['day_max'] < day_min or meta['day_min'] > day_max:
+                continue
+            columns = segment['columns']
+            i, j = np.searchsorted(columns['key'], [low, high + 1])
+            if i < j:
+                keys.append(np.asarray(columns['key'][i:j]))
+                for field in fields:
+                    parts[field].append(np.asarray(columns[field][i:j]))
+
+        if not keys:
+            return result
+        keys = np.concatenate(keys)
+        # Tri stable par jour, puis dernière occurrence (segment le plus récent)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = sorted_keys[1:] != sorted_keys[:-1]
+        order = order[last]
+
+        result['date'] = from_days(_decode_days(keys[order]))
+        for field in fields:
+            result[field] = np.concatenate(parts[field])[order]
+        return result
+
+    def compact(self) -> int:
+        """
+        Fusionne tous les segments en un seul (doublons résolus).
+
+        Returns:
+            Nombre de lignes du segment fusionné
+        """
+        names = self._segment_names()
+        if len(names) < 2:
+            return self._segment(names[0])['meta']['rows'] if names else 0
+
+        segments = [self._segment(name) for name in names]
+        keys = np.concatenate([np.asarray(s['columns']['key']) for s in segments])
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = sorted_keys[1:] != sorted_keys[:-1]
+        order = order[last]
+        scores = {
+            field: np.concatenate([np.asarray(s['columns'][field]) for s in segments])[order]
+            for field in SCORE_FIELDS
+        }
+        keys = keys[order]
+
+        # Le segment fusionné prend un numéro plus récent que les anciens
+        rows = self._append_encoded(keys, scores)
+        self._segments.clear()
+        for name in names:
+            path = os.path.join(self._segments_dir, name)
+            for filename in os.listdir(path):
+                os.remove(os.path.join(path, filename))
+            os.rmdir(path)
+        return rows
+
+    def _append_encoded(self, keys: np.ndarray, scores: Dict[str, np.ndarray]) -> int:
+        tokens = [self.tokens[code] for code in (keys >> _DAY_BITS).tolist()]
+        return self.append(tokens, _decode_days(keys), scores)
+
+
+_store: Optional[TrendStore] = None
+_store_lock = threading.Lock()
+
+
+def get_trend_store() -> Optional[TrendStore]:
+    """Stockage désigné par TOKENOMICS_TREND_STORE (None si la variable est absente)."""
+    global _store
+    directory = os.environ.get("TOKENOMICS_TREND_STORE")
+    if not directory:
+        return None
+    if _store is None or _store.directory != directory:
+        with _store_lock:
+            if _store is None or _store.directory != directory:
+                _store = TrendStore(directory)
+    return _store
+
+
+def iter_snapshots(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Lit les snapshots JSONL (fichiers ou répertoires de fichiers .jsonl).
+
+    Les lignes illisibles ou sans date/id sont ignorées avec un message.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            files = [os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith('.jsonl')]
+        else:
+            files = [path]
+        for file_path in files:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        snapshot = json.loads(line)
+                        if 'date' not in snapshot or 'id' not in snapshot:
+                            raise ValueError("champs 'date' et 'id' requis")
+                    except ValueError as e:
+                        print(f"Snapshot ignoré ({file_path}:{line_number}) : {e}", file=sys.stderr)
+                        continue
+                    yield snapshot
+
+
+def snapshot_to_params(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Paramètres de scoring d'un snapshot (réponse CoinGecko brute ou paramètres).
+
+    Les paramètres sont validés et typés par TokenParams : une valeur nulle,
+    non numérique ou hors bornes rend le snapshot inexploitable (ValueError)
+    au lieu d'interrompre le scoring du segment.
+    """
+    if 'params' in snapshot:
+        params = snapshot['params']
+    else:
+        params = enhance_params_with_known_data(parse_coingecko_to_params(snapshot['data']), snapshot['id'])
+    return TokenParams.from_dict(params).to_dict()
+
+
+# Paramètres booléens (colonnes bool, les autres en float)
+_FLAGS = frozenset(name for name, kind, _ in FIELDS if kind is bool)
+
+
+def _score_rows(rows: List[Tuple[str, int, Dict[str, Any]]]) -> Dict[str, np.ndarray]:
+    """Score vectorisé d'un lot de snapshots hétérogènes."""
+    # Le score de sécurité dépend du nom du token (base d'audits) : les tokens
+    # audités sont scorés par groupe de même nom, tous les autres ensemble
+    groups: Dict[Optional[str], List[int]] = {}
+    for i, (_, _, params) in enumerate(rows):
+        coin_id = str(params.get('name', '')).lower().replace(' ', '-')
+        groups.setdefault(coin_id if coin_id in SECURITY_DB else None, []).append(i)
+
+    scores = {field: np.empty(len(rows), dtype=np.float32) for field in SCORE_FIELDS}
+    for coin_id, indices in groups.items():
+        group = [rows[i][2] for i in indices]
+        columns = {
+            key: np.array([params[key] for params in group], dtype=bool if key in _FLAGS else float)
+            for key in REQUIRED_PARAMS
+        }
+        for key, default in OPTIONAL_PARAMS.items():
+            values = [params.get(key) for params in group]
+            columns[key] = np.array([default if v is None else v for v in values], dtype=float)
+        if coin_id is not None:
+            columns['name'] = group[0]['name']
+        group_scores = calculate_viability_index_vectorized(columns)
+        for field in SCORE_FIELDS:
+            scores[field][indices] = group_scores[field]
+    return scores
+
+
+def backfill(
+    snapshot_paths: Iterable[str],
+    store: TrendStore,
+    segment_rows: int = DEFAULT_SEGMENT_ROWS,
+    progress: bool = True
+) -> Dict[str, int]:
+    """
+    Rejoue des snapshots journaliers dans le scoring et les ajoute au stockage.
+
+    Args:
+        snapshot_paths: Fichiers JSONL ou répertoires de snapshots
+        store: Stockage de destination
+        segment_rows: Lignes scorées et écrites par segment (mémoire bornée)
+        progress: Afficher l'avancement sur stderr
+
+    Returns:
+        {'written', 'failed'}
+    """
+    stats = {'written': 0, 'failed': 0}
+    rows: List[Tuple[str, int, Dict[str, Any]]] = []
+
+    def flush() -> None:
+        if not rows:
+            return
+        scores = _score_rows(rows)
+        stats['written'] += store.append([r[0] for r in rows], [r[1] for r in rows], scores)
+        rows.clear()
+        if progress:
+            print(f"{stats['written']} ligne(s) écrite(s), {stats['failed']} échec(s)", file=sys.stderr)
+
+    for snapshot in iter_snapshots(snapshot_paths):
+        try:
+            params = snapshot_to_params(snapshot)
+            rows.append((str(snapshot['id']), to_day(snapshot['date']), params))
+        except (KeyError, TypeError, ValueError, ZeroDivisionError) as e:
+            print(f"Snapshot inexploitable '{snapshot.get('id')}' ({snapshot.get('date')}) : {e}", file=sys.stderr)
+            stats['failed'] += 1
+            continue
+        if len(rows) >= segment_rows:
+            flush()
+    flush()
+    return stats
@@ -0,0 +1,422 @@
+"""
+Univers de tokens en colonnes : paramètres, métadonnées de collecte et scores.
+
+`TokenUniverse` regroupe N tokens dans des tableaux structurés NumPy (une
+ligne par token) au lieu de N dictionnaires :
+
+- `params` : paramètres de scoring (schéma de `tokenomics.params`)
+- `info` : date de collecte, source, données enrichies, catégorie
+- `scores` : scores par composante (float32, après `score()`)
+
+Filtres, tri et regroupement par catégorie (catégories de
+get_enriched_tokens_list) sont vectorisés ; `universe['final_score']`
+renvoie une vue sans copie de la colonne.
+
+Sur disque, un univers est un répertoire de fichiers `.npy` :
+
+    universe/
+      meta.json         # version, lignes, catégories, sources
+      ids.npy           # ids des tokens
+      params.npy        # tableau structuré des paramètres
+      info.npy          # métadonnées de collecte
+      scores.npy        # scores (absent si l'univers n'est pas scoré)
+
+`TokenUniverse.load()` les ouvre en mmap : l'ouverture ne lit que les
+en-têtes, quel que soit le nombre de tokens, et les pages ne sont chargées
+qu'à l'accès.
+"""
+
+import json
+import os
+import shutil
+import time
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from tokenomics.api import get_enriched_tokens_list
+from tokenomics.params import TokenParams, records_dtype, to_records, from_records, as_columns
+from tokenomics.scoring import SECURITY_DB, calculate_viability_index_vectorized
+from tokenomics.sweep import SCORE_FIELDS
+
+
+UNIVERSE_VERSION = 1
+
+# Provenance des paramètres (colonne 'source' : index dans ce tuple)
+SOURCES = ('manual', 'scenario', 'coingecko')
+
+# Catégorie des tokens absents de get_enriched_tokens_list (code -1)
+UNCATEGORIZED = "Autres"
+
+INFO_DTYPE = np.dtype([
+    ('fetched_at', '<f8'),   # timestamp Unix de la collecte (NaN si inconnu)
+    ('source', 'u1'),        # index dans SOURCES
+    ('is_enriched', '?'),    # paramètres complétés par enhance_params_with_known_data
+    ('category', '<i2'),     # index dans categories (-1 : UNCATEGORIZED)
+])
+
+SCORES_DTYPE = np.dtype([(field, '<f4') for field in SCORE_FIELDS])
+
+_FILES = ('ids', 'params', 'info', 'scores')
+
+
+@lru_cache(maxsize=1)
+def _enriched_categories() -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """Catégories de get_enriched_tokens_list et index id → catégorie."""
+    tokens_by_category = get_enriched_tokens_list()
+    categories = tuple(tokens_by_category)
+    index = {
+        coin_id: code
+        for code, category in enumerate(categories)
+        for coin_id in tokens_by_category[category]
+    }
+    return categories, index
+
+
+class TokenUniverse:
+    """
+    Ensemble de tokens stocké par colonnes.
+
+    Args:
+        ids: Identifiants des tokens (n,)
+        params: Tableau structuré de type records_dtype() (n,)
+        info: Tableau structuré de type INFO_DTYPE (n,)
+        scores: Tableau structuré de type SCORES_DTYPE (n,), None si non scoré
+        categories: Noms des catégories référencées par info['category']
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        params: np.ndarray,
+        info: np.ndarray,
+        scores: Optional[np.ndarray] = None,
+        categories: Optional[Sequence[str]] = None
+    ):
+        sizes = {len(ids), len(params), len(info)} | ({len(scores)} if scores is not None else set())
+        if len(sizes) > 1:
+            raise ValueError(f"TokenUniverse : colonnes de tailles différentes ({sorted(sizes)})")
+        if params.dtype != records_dtype() or info.dtype != INFO_DTYPE:
+            raise ValueError("TokenUniverse : schéma des paramètres ou des métadonnées différent")
+        if scores is not None and scores.dtype != SCORES_DTYPE:
+            raise ValueError("TokenUniverse : schéma des scores différent")
+        self.ids = ids
+        self.params = params
+        self.info = info
+        self.scores = scores
+        self.categories = tuple(categories if categories is not None else _enriched_categories()[0])
+
+    @classmethod
+    def from_params(
+        cls,
+        tokens: Union[Mapping[str, Any], Iterable[Tuple[str, Any]]],
+        source: str = 'manual',
+        fetched_at: Optional[float] = None
+    ) -> 'TokenUniverse':
+        """
+        Construit un univers à partir de paramètres.
+
+        Args:
+            tokens: {id: paramètres} ou paires (id, paramètres) ; dicts ou TokenParams
+            source: Provenance commune (SOURCES)
+            fetched_at: Timestamp de collecte (défaut : maintenant pour 'coingecko', NaN sinon)
+
+        Returns:
+            Univers non scoré ; catégorie déduite de l'id (get_enriched_tokens_list)
+        """
+        if source not in SOURCES:
+            raise ValueError(f"Source inconnue : {source} (attendu : {', '.join(SOURCES)})")
+        if fetched_at is None:
+            fetched_at = time.time() if source == 'coingecko' else float('nan')
+
+        items = list(tokens.items() if isinstance(tokens, Mapping) else tokens)
+        categories, category_index = _enriched_categories()
+        ids = np.array([str(token_id) for token_id, _ in items], dtype=str)
+        info = np.zeros(len(items), dtype=INFO_DTYPE)
+        info['fetched_at'] = fetched_at
+        info['source'] = SOURCES.index(source)
+        info['is_enriched'] = [bool(params.get('is_enriched', False)) for _, params in items]
+        info['category'] = [category_index.get(str(token_id), -1) for token_id, _ in items]
+        params = to_records(params for _, params in items)
+        return cls(ids, params, info, categories=categories)
+
+    @classmethod
+    def concat(cls, universes: Sequence['TokenUniverse']) -> 'TokenUniverse':
+        """
+        Met bout à bout plusieurs univers (mêmes catégories).
+
+        Les scores ne sont conservés que si tous les univers sont scorés.
+        """
+        if not universes:
+            raise ValueError("TokenUniverse.concat : aucun univers")
+        categories = universes[0].categories
+        if any(universe.categories != categories for universe in universes):
+            raise ValueError("TokenUniverse.concat : catégories différentes")
+        scored = all(universe.scores is not None for universe in universes)
+        return cls(
+            np.concatenate([universe.ids for universe in universes]),
+            np.concatenate([universe.params for universe in universes]),
+            np.concatenate([universe.info for universe in universes]),
+            np.concatenate([universe.scores for universe in universes]) if scored else None,
+            categories
+        )
+
+    # ========== ACCÈS ==========
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, key: Any) -> Union[np.ndarray, 'TokenUniverse']:
+        """
+        `universe['inflation_rate']` : vue sans copie d'une colonne
+        (paramètre, métadonnée, score ou 'id') ; sinon sous-univers
+        (tranche, masque booléen ou indices).
+        """
+        if isinstance(key, str):
+            return self.column(key)
+        return self.subset(key)
+
+    def column(self, name: str) -> np.ndarray:
+        """Vue sans copie d'une colonne."""
+        if name == 'id':
+            return self.ids
+        for table in (self.params, self.info, self.scores):
+            if table is not None and name in table.dtype.names:
+                return table[name]
+        if name in SCORES_DTYPE.names:
+            raise KeyError(f"Colonne '{name}' indisponible : univers non scoré (appeler score())")
+        raise KeyError(f"Colonne inconnue : {name}")
+
+    @property
+    def columns(self) -> List[str]:
+        """Noms des colonnes disponibles."""
+        names = ['id'] + list(self.params.dtype.names) + list(INFO_DTYPE.names)
+        return names + (list(SCORES_DTYPE.names) if self.scores is not None else [])
+
+    @property
+    def nbytes(self) -> int:
+        """Taille des colonnes en octets."""
+        return sum(table.nbytes for table in (self.ids, self.params, self.info, self.scores) if table is not None)
+
+    def category_names(self) -> np.ndarray:
+        """Nom de catégorie de chaque token."""
+        names = np.array(self.categories + (UNCATEGORIZED,), dtype=object)
+        return names[self.info['category']]
+
+    def token(self, index: int) -> TokenParams:
+        """Paramètres d'un token (description vide, cf. to_records)."""
+        return from_records(self.params[index:index + 1])[0]
+
+    def find(self, token_id: str) -> Optional[int]:
+        """Position d'un token (None si absent)."""
+        positions = np.flatnonzero(self.ids == token_id)
+        return int(positions[0]) if len(positions) else None
+
+    # ========== FILTRES, TRI, REGROUPEMENT ==========
+
+    def subset(self, index: Any) -> 'TokenUniverse':
+        """Sous-univers (une tranche reste une vue ; masque et indices copient)."""
+        return TokenUniverse(
+            self.ids[index],
+            self.params[index],
+            self.info[index],
+            self.scores[index] if self.scores is not None else None,
+            self.categories
+        )
+
+    def filter(
+        self,
+        mask: Optional[np.ndarray] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        enriched: Optional[bool] = None
+    ) -> 'TokenUniverse':
+        """
+        Tokens vérifiant toutes les conditions.
+
+        Args:
+            mask: Masque booléen (ex : universe['final_score'] >= 65)
+            category: Nom de catégorie (UNCATEGORIZED pour les autres)
+            source: Provenance (SOURCES)
+            enriched: Données enrichies ou non
+
+        Returns:
+            Sous-univers
+        """
+        keep = np.ones(len(self), dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        if category is not None:
+            code = -1 if category == UNCATEGORIZED else self.categories.index(category)
+            keep = keep & (self.info['category'] == code)
+        if source is not None:
+            keep = keep & (self.info['source'] == SOURCES.index(source))
+        if enriched is not None:
+            keep = keep & (self.info['is_enriched'] == enriched)
+        return self.subset(keep)
+
+    def sort(self, by: str, descending: bool = False) -> 'TokenUniverse':
+        """Tri stable sur une colonne."""
+        values = self.column(by)
+        if descending and values.dtype.kind in 'iuf':
+            order = np.argsort(-values.astype(np.float64), kind='stable')
+        else:
+            order = np.argsort(values, kind='stable')
+            if descending:
+                order = order[::-1]
+        return self.subset(order)
+
+    def deduplicate(self) -> 'TokenUniverse':
+        """Une ligne par id (la dernière occurrence l'emporte), ordre conservé."""
+        _, last = np.unique(self.ids[::-1], return_index=True)
+        if len(last) == len(self):
+            return self
+        return self.subset(np.sort(len(self) - 1 - last))
+
+    def head(self, n: int = 10) -> 'TokenUniverse':
+        return self.subset(slice(0, n))
+
+    def groupby_category(self) -> Dict[str, 'TokenUniverse']:
+        """Sous-univers par catégorie (ordre de get_enriched_tokens_list, puis UNCATEGORIZED)."""
+        codes = self.info['category']
+        order = np.argsort(np.where(codes < 0, len(self.categories), codes), kind='stable')
+        sorted_codes = codes[order]
+        bounds = np.flatnonzero(np.diff(sorted_codes)) + 1
+        groups = {}
+        for indices in np.split(order, bounds):
+            if len(indices):
+                code = int(codes[indices[0]])
+                groups[self.categories[code] if code >= 0 else UNCATEGORIZED] = self.subset(indices)
+        return groups
+
+    def category_stats(self, field: str = 'final_score') -> Dict[str, Dict[str, float]]:
+        """
+        Statistiques d'une colonne par catégorie.
+
+        Returns:
+            {catégorie: {'count', 'mean', 'min', 'max'}}
+        """
+        values = self.column(field).astype(np.float64)
+        codes = self.info['category'].astype(np.int64)
+        slots = np.where(codes < 0, len(self.categories), codes)
+        size = len(self.categories) + 1
+        counts = np.bincount(slots, minlength=size)
+        sums = np.bincount(slots, weights=values, minlength=size)
+        minimums = np.full(size, np.inf)
+        maximums = np.full(size, -np.inf)
+        np.minimum.at(minimums, slots, values)
+        np.maximum.at(maximums, slots, values)
+        names = self.categories + (UNCATEGORIZED,)
+        return {
+            names[slot]: {
+                'count': int(counts[slot]),
+                'mean': float(sums[slot] / counts[slot]),
+                'min': float(minimums[slot]),
+                'max': float(maximums[slot]),
+            }
+            for slot in np.flatnonzero(counts)
+        }
+
+    # ========== SCORING ==========
+
+    def score(self) -> 'TokenUniverse':
+        """
+        Calcule les scores de tous les tokens (scoring vectorisé).
+
+        Le score de sécurité dépend du nom du token (base d'audits) : les
+        tokens audités sont rescorés par groupe de même nom.
+
+        Returns:
+            L'univers lui-même (scores renseignés)
+        """
+        scores = np.empty(len(self), dtype=SCORES_DTYPE)
+        if len(self):
+            columns = as_columns(self.params)
+            computed = calculate_viability_index_vectorized(columns)
+            for field in SCORE_FIELDS:
+                scores[field] = computed[field]
+
+            names, inverse = np.unique(self.params['name'], return_inverse=True)
+            for code, name in enumerate(names.tolist()):
+                coin_id = name.lower().replace(' ', '-')
+                if coin_id not in SECURITY_DB:
+                    continue
+                rows = np.flatnonzero(inverse == code)
+                group = {key: values[rows] for key, values in columns.items()}
+                group['name'] = name
+                computed = calculate_viability_index_vectorized(group)
+                for field in SCORE_FIELDS:
+                    scores[field][rows] = computed[field]
+        self.scores = scores
+        return self
+
+    # ========== PERSISTANCE ==========
+
+    def save(self, path: str) -> str:
+        """
+        Enregistre l'univers dans le répertoire `path` (remplacé d'un bloc).
+
+        Returns:
+            Chemin du répertoire
+        """
+        tmp_path = f"{path}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        try:
+            for name in _FILES:
+                table = getattr(self, name)
+                if table is not None:
+                    np.save(os.path.join(tmp_path, f"{name}.npy"), np.ascontiguousarray(table))
+            meta = {
+                'version': UNIVERSE_VERSION,
+                'rows': len(self),
+                'categories': list(self.categories),
+                'sources': list(SOURCES),
+                'scored': self.scores is not None,
+                'saved_at': time.time(),
+            }
+            with open(os.path.join(tmp_path, "meta.json"), 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
+        # Un répertoire ne peut pas être remplacé atomiquement s'il n'est pas vide
+        previous = None
+        if os.path.exists(path):
+            previous = f"{tmp_path}.old"
+            os.replace(path, previous)
+        os.replace(tmp_path, path)
+        if previous:
+            # Les univers déjà ouverts en mmap gardent leurs pages (fichiers supprimés mais ouverts)
+            shutil.rmtree(previous, ignore_errors=True)
+        return path
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'TokenUniverse':
+        """
+        Ouvre un univers enregistré.
+
+        Args:
+            path: Répertoire écrit par save()
+            mmap: Colonnes ouvertes en mmap, en lecture seule (sinon chargées en mémoire)
+
+        Raises:
+            ValueError: Version ou schéma incompatible
+        """
+        with open(os.path.join(path, "meta.json"), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != UNIVERSE_VERSION:
+            raise ValueError(f"Univers {path} : version {meta.get('version')} (attendu : {UNIVERSE_VERSION})")
+        if meta.get('sources') != list(SOURCES):
+            raise ValueError(f"Univers {path} : sources différentes ({meta.get('sources')})")
+
+        mode = 'r' if mmap else None
+        tables = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode)
+            for name in _FILES
+            if name != 'scores' or meta.get('scored')
+        }
+        return cls(
+            tables['ids'], tables['params'], tables['info'], tables.get('scores'),
+            categories=meta['categories']
+        )
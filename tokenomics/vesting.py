@@ -0,0 +1,264 @@
+"""
+Simulation des calendriers de vesting / unlock.
+
+Chaque token est décrit par une liste de buckets d'allocation (team,
+investisseurs, écosystème, communauté...) :
+
+    {
+        'name': 'team',
+        'amount': 150_000_000,      # tokens alloués au bucket
+        'start_month': 0,           # début du vesting (négatif = déjà commencé)
+        'cliff_months': 12,         # rien n'est libéré avant la fin du cliff
+        'vesting_months': 36,       # durée totale depuis le début du vesting
+        'release': 'linear',        # 'linear' (mensuel) ou 'step'
+        'step_months': 3,           # pas de libération pour 'step'
+        'tge_pct': 0.0              # % libéré immédiatement au début
+    }
+
+À la fin du cliff, la part acquise depuis le début est libérée d'un coup, puis
+la libération suit le rythme du bucket jusqu'à `vesting_months`.
+
+Tous les buckets de tous les tokens sont aplatis dans des tableaux NumPy et
+évalués en une seule passe sur la grille mensuelle (par blocs pour borner la
+mémoire), puis agrégés par token avec `np.add.reduceat`.
+"""
+
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+
+RELEASE_TYPES = ('linear', 'step')
+
+# Nombre maximal de cellules bucket × mois évaluées en une fois
+CHUNK_CELLS = 2_000_000
+
+# Seuil par défaut d'un événement d'unlock (% de la supply en circulation)
+DEFAULT_EVENT_THRESHOLD_PCT = 2.0
+
+
+def _normalize_bucket(bucket: Dict[str, Any]) -> Dict[str, Any]:
+    name = bucket.get('name', 'bucket')
+    release = bucket.get('release', 'linear')
+    if release not in RELEASE_TYPES:
+        raise ValueError(f"Bucket '{name}' : release inconnu ({release})")
+
+    try:
+        normalized = {
+            'name': str(name),
+            'amount': float(bucket['amount']),
+            'start_month': int(bucket.get('start_month', 0)),
+            'cliff_months': int(bucket.get('cliff_months', 0)),
+            'vesting_months': int(bucket.get('vesting_months', 0)),
+            'release': release,
+            'step_months': int(bucket.get('step_months', 1)) if release == 'step' else 1,
+            'tge_pct': float(bucket.get('tge_pct', 0.0)),
+        }
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Bucket '{name}' invalide : {e}")
+
+    if normalized['amount'] < 0 or normalized['cliff_months'] < 0 or normalized['vesting_months'] < 0:
+        raise ValueError(f"Bucket '{name}' : montants et durées doivent être positifs")
+    if normalized['step_months'] < 1:
+        raise ValueError(f"Bucket '{name}' : step_months doit être >= 1")
+    if not 0 <= normalized['tge_pct'] <= 100:
+        raise ValueError(f"Bucket '{name}' : tge_pct doit être entre 0 et 100")
+    return normalized
+
+
+def buckets_from_params(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Construit des buckets approximatifs à partir des paramètres scalaires.
+
+    La part team (team_allocation % de la supply totale, cliff de 12 mois,
+    vesting linéaire sur vesting_years) est bornée par la supply non circulante ;
+    le reste est libéré linéairement sur emission_years_left.
+
+    Args:
+        params: Paramètres du token
+
+    Returns:
+        Liste de buckets
+    """
+    locked = max(0.0, params['total_supply'] - params['circulating_supply'])
+    team = min(locked, params['total_supply'] * params['team_allocation'] / 100)
+    buckets = []
+    if team > 0:
+        buckets.append({
+            'name': 'team',
+            'amount': team,
+            'cliff_months': 12,
+            'vesting_months': max(12, int(params['vesting_years'] * 12)),
+        })
+    if locked - team > 0:
+        buckets.append({
+            'name': 'ecosystem',
+            'amount': locked - team,
+            'vesting_months': max(1, int(params['emission_years_left'] * 12)),
+        })
+    return buckets
+
+
+def _flatten(schedules: Sequence[Sequence[Dict[str, Any]]]) -> Dict[str, np.ndarray]:
+    buckets = [_normalize_bucket(b) for schedule in schedules for b in schedule]
+    counts = np.fromiter((len(schedule) for schedule in schedules), dtype=np.int64, count=len(schedules))
+
+    def column(key, dtype=float):
+        return np.fromiter((b[key] for b in buckets), dtype=dtype, count=len(buckets))
+
+    return {
+        'counts': counts,
+        'amount': column('amount'),
+        'start': column('start_month'),
+        'cliff': column('cliff_months'),
+        'duration': column('vesting_months'),
+        'step': column('step_months'),
+        'tge': column('tge_pct') / 100,
+    }
+
+
+def _unlocked_fraction(flat: Dict[str, np.ndarray], rows: slice, months: np.ndarray) -> np.ndarray:
+    """Fraction libérée (buckets de `rows` × mois)."""
+    start = flat['start'][rows, np.newaxis]
+    cliff = flat['cliff'][rows, np.newaxis]
+    duration = flat['duration'][rows, np.newaxis]
+    step = flat['step'][rows, np.newaxis]
+    tge = flat['tge'][rows, np.newaxis]
+
+    elapsed = months[np.newaxis, :] - start
+    released = np.floor(elapsed / step) * step
+    vested = np.divide(released, duration, out=np.ones_like(released), where=duration > 0)
+    np.clip(vested, 0.0, 1.0, out=vested)
+    vested[elapsed < cliff] = 0.0
+
+    fraction = tge + (1.0 - tge) * vested
+    fraction[elapsed < 0] = 0.0
+    return fraction
+
+
+def bucket_schedule(buckets: Sequence[Dict[str, Any]], months: int = 48) -> Dict[str, Any]:
+    """
+    Calendrier d'un token, détaillé par bucket.
+
+    Args:
+        buckets: Buckets du token
+        months: Horizon en mois
+
+    Returns:
+        {'months': (mois + 1,), 'names': [...], 'unlocked': (buckets, mois + 1)}
+        (tokens cumulés libérés, mois 0 = aujourd'hui)
+    """
+    flat = _flatten([buckets])
+    grid = np.arange(months + 1, dtype=float)
+    unlocked = flat['amount'][:, np.newaxis] * _unlocked_fraction(flat, slice(None), grid)
+    return {
+        'months': grid,
+        'names': [str(b.get('name', 'bucket')) for b in buckets],
+        'unlocked': unlocked,
+    }
+
+
+def locked_breakdown(buckets: Sequence[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Supply encore bloquée aujourd'hui, par bucket.
+
+    Returns:
+        {nom du bucket: tokens non libérés au mois 0}
+    """
+    flat = _flatten([buckets])
+    remaining = flat['amount'] * (1.0 - _unlocked_fraction(flat, slice(None), np.zeros(1))[:, 0])
+    breakdown = {}
+    for name, amount in zip((str(b.get('name', 'bucket')) for b in buckets), remaining.tolist()):
+        breakdown[name] = breakdown.get(name, 0.0) + amount
+    return breakdown
+
+
+def simulate_vesting(
+    schedules: Sequence[Sequence[Dict[str, Any]]],
+    months: int = 48,
+    circulating_supply: Optional[Sequence[float]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Simule les unlocks mensuels de plusieurs tokens.
+
+    Args:
+        schedules: Une liste de buckets par token
+        months: Horizon en mois
+        circulating_supply: Supply en circulation aujourd'hui, par token
+            (défaut : tokens déjà libérés par les buckets au mois 0)
+
+    Returns:
+        {
+            'months': (mois + 1,),
+            'unlocked': tokens cumulés libérés par les buckets (tokens, mois + 1),
+            'circulating': supply en circulation projetée (tokens, mois + 1),
+            'monthly_unlock': tokens libérés chaque mois (tokens, mois)
+        }
+    """
+    flat = _flatten(schedules)
+    grid = np.arange(months + 1, dtype=float)
+    unlocked = np.zeros((len(schedules), months + 1))
+
+    # Les buckets sont contigus par token : agrégation par reduceat sur les
+    # offsets des tokens non vides, par blocs de tokens
+    offsets = np.concatenate(([0], np.cumsum(flat['counts'])))
+    max_buckets = max(1, CHUNK_CELLS // (months + 1))
+    token = 0
+    while token < len(schedules):
+        end = int(np.searchsorted(offsets, offsets[token] + max_buckets, side='right')) - 1
+        end = min(len(schedules), max(end, token + 1))
+        rows = slice(offsets[token], offsets[end])
+
+        if rows.stop > rows.start:
+            values = flat['amount'][rows, np.newaxis] * _unlocked_fraction(flat, rows, grid)
+            non_empty = np.nonzero(flat['counts'][token:end])[0]
+            local_offsets = offsets[token:end][non_empty] - offsets[token]
+            unlocked[token + non_empty] = np.add.reduceat(values, local_offsets, axis=0)
+        token = end
+
+    if circulating_supply is None:
+        circulating = unlocked
+    else:
+        initial = np.asarray(circulating_supply, dtype=float)[:, np.newaxis]
+        circulating = initial + (unlocked - unlocked[:, :1])
+
+    return {
+        'months': grid,
+        'unlocked': unlocked,
+        'circulating': circulating,
+        'monthly_unlock': np.diff(unlocked, axis=1),
+    }
+
+
+def find_unlock_events(
+    simulation: Dict[str, np.ndarray],
+    threshold_pct: float = DEFAULT_EVENT_THRESHOLD_PCT
+) -> List[Dict[str, Any]]:
+    """
+    Repère les mois où les unlocks dépassent un % de la supply en circulation.
+
+    Args:
+        simulation: Résultat de `simulate_vesting`
+        threshold_pct: Seuil en % de la supply en circulation le mois précédent
+
+    Returns:
+        Liste triée par pression décroissante :
+        {'token': index, 'month', 'amount', 'pct_of_circulating'}
+    """
+    previous = simulation['circulating'][:, :-1]
+    pressure = np.divide(
+        simulation['monthly_unlock'] * 100, previous,
+        out=np.zeros_like(previous), where=previous > 0
+    )
+    tokens, months = np.nonzero(pressure >= threshold_pct)
+    order = np.argsort(-pressure[tokens, months], kind='stable')
+
+    return [
+        {
+            'token': int(tokens[i]),
+            'month': int(months[i]) + 1,
+            'amount': float(simulation['monthly_unlock'][tokens[i], months[i]]),
+            'pct_of_circulating': round(float(pressure[tokens[i], months[i]]), 2),
+        }
+        for i in order
+    ]
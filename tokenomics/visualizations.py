@@ -1,180 +1,380 @@
 """
 Module de visualisations pour l'analyse de tokenomics.
 Utilise Plotly pour des graphiques interactifs.
+
+Chaque graphique existe sous deux formes : `*_spec` construit directement le
+dictionnaire JSON Plotly (sans validation, pour générer des milliers de
+figures dans les rapports ou l'API) et `create_*` retourne la `go.Figure`
+validée correspondante, au rendu identique.
+
+Les graphiques passent par un cache LRU de figures sérialisées (JSON),
+indexé par les entrées du graphique et partagé par toutes les sessions du
+processus : un graphique inchangé est reconstruit depuis son JSON sans
+repasser par les validateurs Plotly.
 """
 
+import functools
+import inspect
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, List, Optional
+
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
-from typing import Dict, Any, List
-from tokenomics.scenarios import get_inflation_projection
+from tokenomics.downsampling import lttb_indices
+from tokenomics.instrumentation import timed
+from tokenomics.scenarios import get_scenario, project_rates, project_supply, project_scenarios
 
 
-def create_supply_distribution_chart(
-    circulating_supply: float,
-    total_supply: float,
-    max_supply: float
-) -> go.Figure:
+# Teintes ambrées pour les buckets de vesting du camembert (réutilisées en boucle au-delà)
+LOCKED_BUCKET_COLORS = ['#f59e0b', '#fbbf24', '#d97706', '#fcd34d', '#b45309', '#fde68a', '#92400e', '#fef3c7']
+
+# Nombre de figures conservées dans le cache (0 = cache désactivé)
+FIGURE_CACHE_SIZE = 128
+
+# Points envoyés au navigateur par trace (au-delà : réduction LTTB côté serveur)
+MAX_TRACE_POINTS = 2000
+
+# Au-delà de ce nombre de points par trace, rendu WebGL (scattergl) au lieu de SVG
+WEBGL_THRESHOLD = 1000
+
+
+def _freeze(value: Any) -> Any:
+    """Forme hashable des entrées d'un graphique."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class FigureCache:
     """
-    Crée un camembert de distribution de la supply.
-    
+    Cache LRU de figures Plotly stockées en JSON.
+
+    Une figure servie depuis le cache est un nouvel objet : la modifier ne
+    modifie pas l'entrée en cache.
+    """
+
+    def __init__(self, maxsize: int = FIGURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Any, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Optional[go.Figure]:
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Entrée déjà validée à sa construction
+        return go.Figure(json.loads(payload), _validate=False)
+
+    def put(self, key: Any, fig: go.Figure) -> None:
+        if self.maxsize <= 0:
+            return
+        payload = fig.to_json()
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+
+_figure_cache = FigureCache()
+
+
+def clear_figure_cache() -> None:
+    """Vide le cache de figures."""
+    _figure_cache.clear()
+
+
+def figure_cache_info() -> Dict[str, int]:
+    """Statistiques du cache de figures : {'hits', 'misses', 'size', 'maxsize'}."""
+    return _figure_cache.info()
+
+
+def cached_figure(extra_key: Optional[Callable[..., Any]] = None):
+    """
+    Décorateur : sert la figure depuis le cache si les entrées sont inchangées.
+
     Args:
-        circulating_supply: Supply en circulation
-        total_supply: Supply totale actuelle
-        max_supply: Supply maximale
-        
+        extra_key: Fonction recevant les arguments liés (dict) et retournant
+            les données externes dont dépend la figure (ex : projection d'un scénario)
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _figure_cache.maxsize <= 0:
+                return fn(*args, **kwargs)
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = dict(bound.arguments)
+                key = (fn.__name__, _freeze(arguments), _freeze(extra_key(arguments)) if extra_key else None)
+                hash(key)
+            except TypeError:
+                # Entrées non hashables : pas de cache
+                return fn(*args, **kwargs)
+
+            fig = _figure_cache.get(key)
+            if fig is None:
+                fig = fn(*args, **kwargs)
+                _figure_cache.put(key, fig)
+            return fig
+        return wrapper
+    return decorator
+
+
+def _scenario_projection_key(arguments: Dict[str, Any]) -> Any:
+    scenario = get_scenario(arguments['scenario_name']) if arguments.get('scenario_name') else None
+    return scenario.projection if scenario else None
+
+
+def _scenarios_projection_key(arguments: Dict[str, Any]) -> Any:
+    return tuple(_scenario_projection_key({'scenario_name': name}) for name in arguments['scenarios'])
+
+
+# ========== SPÉCIFICATIONS (dict Plotly, sans validation) ==========
+#
+# Chaque graphique est décrit par une fonction `*_spec` qui retourne
+# directement le dictionnaire JSON Plotly {'data', 'layout'}, sous sa forme
+# canonique (celle produite par `go.Figure(spec).to_plotly_json()`).
+# Les fonctions `create_*` valident cette spécification via `go.Figure` ;
+# les rapports batch et l'API peuvent sérialiser la spécification directement.
+
+_template_spec: Optional[Dict[str, Any]] = None
+
+
+def _layout_template() -> Dict[str, Any]:
+    """Template Plotly par défaut (partagé entre les spécifications, ne pas modifier)."""
+    global _template_spec
+    if _template_spec is None:
+        import plotly.io as pio
+        _template_spec = pio.templates[pio.templates.default].to_plotly_json()
+    return _template_spec
+
+
+def _figure_spec(data: List[Dict[str, Any]], layout: Dict[str, Any]) -> Dict[str, Any]:
+    layout['template'] = _layout_template()
+    return {'data': data, 'layout': layout}
+
+
+def spec_to_json(spec: Dict[str, Any]) -> str:
+    """Sérialise une spécification en JSON Plotly (sans validation)."""
+    import plotly.io as pio
+    return pio.to_json(spec, validate=False)
+
+
+def _to_figure(spec: Dict[str, Any]) -> go.Figure:
+    """Figure validée d'une spécification (Plotly applique lui-même le template par défaut)."""
+    layout = {key: value for key, value in spec['layout'].items() if key != 'template'}
+    return go.Figure({'data': spec['data'], 'layout': layout})
+
+
+def _centered_title(text: str) -> Dict[str, Any]:
+    return {'text': text, 'x': 0.5, 'xanchor': 'center'}
+
+
+_colorscales: Dict[str, List[List[Any]]] = {}
+
+
+def _colorscale(name: str) -> List[List[Any]]:
+    """Échelle de couleurs nommée, sous la forme produite par la validation Plotly."""
+    scale = _colorscales.get(name)
+    if scale is None:
+        from plotly.colors import get_colorscale
+        scale = _colorscales[name] = [list(step) for step in get_colorscale(name)]
+    return scale
+
+
+_TOP_LEGEND = {'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'right', 'x': 1}
+
+
+def _reduce_series(x: np.ndarray, reference: np.ndarray, *series: np.ndarray):
+    """
+    Réduit des séries partageant le même axe X pour l'affichage.
+
+    Les indices LTTB sont calculés sur `reference` et appliqués à toutes les
+    séries, qui restent ainsi alignées point à point (hover unifié).
+
     Returns:
-        Figure Plotly
+        (x, [séries...], type de trace) : listes prêtes pour la
+        spécification, 'scattergl' si le nombre de points dépasse WEBGL_THRESHOLD
     """
+    x = np.asarray(x)
+    if len(x) > MAX_TRACE_POINTS:
+        indices = lttb_indices(x, reference, MAX_TRACE_POINTS)
+        x = x[indices]
+        series = tuple(np.asarray(values)[indices] for values in series)
+    trace_type = 'scattergl' if len(x) > WEBGL_THRESHOLD else 'scatter'
+    return x.tolist(), [np.asarray(values).tolist() for values in series], trace_type
+
+
+def supply_distribution_spec(
+    circulating_supply: float,
+    total_supply: float,
+    max_supply: float,
+    locked_breakdown: Optional[Dict[str, float]] = None
+) -> Dict[str, Any]:
+    """Spécification du camembert de distribution (voir create_supply_distribution_chart)."""
     # Calcul des différentes parts
+    locked_supply = total_supply - circulating_supply
+    if locked_breakdown:
+        labels = [f'Locked ({name})' for name in locked_breakdown]
+        values = list(locked_breakdown.values())
+        colors = [LOCKED_BUCKET_COLORS[i % len(LOCKED_BUCKET_COLORS)] for i in range(len(labels))]
+    else:
+        labels = ['Locked/Vested']
+        values = [locked_supply]
+        colors = ['#f59e0b']
+    
+    labels = ['En circulation'] + labels
+    values = [circulating_supply] + values
+    colors = ['#10b981'] + colors
+    
     if max_supply > 0:
-        locked_supply = total_supply - circulating_supply
         future_supply = max_supply - total_supply
         
-        labels = ['En circulation', 'Locked/Vested', 'Non émise']
-        values = [circulating_supply, locked_supply, future_supply]
-        colors = ['#10b981', '#f59e0b', '#ef4444']
-    else:
-        # Pas de max supply définie
-        locked_supply = total_supply - circulating_supply
-        
-        labels = ['En circulation', 'Locked/Vested']
-        values = [circulating_supply, locked_supply]
-        colors = ['#10b981', '#f59e0b']
-    
-    fig = go.Figure(data=[go.Pie(
-        labels=labels,
-        values=values,
-        marker=dict(colors=colors),
-        hole=0.3,
-        textinfo='label+percent',
-        textposition='outside',
-        hovertemplate='<b>%{label}</b><br>%{value:,.0f}<br>%{percent}<extra></extra>'
-    )])
+        labels.append('Non émise')
+        values.append(future_supply)
+        colors.append('#ef4444')
     
-    fig.update_layout(
-        title={
-            'text': "Distribution de la Supply",
-            'x': 0.5,
-            'xanchor': 'center'
-        },
-        showlegend=True,
-        height=400,
-        margin=dict(t=80, b=20, l=20, r=20)
+    return _figure_spec(
+        [{
+            'hole': 0.3,
+            'hovertemplate': '<b>%{label}</b><br>%{value:,.0f}<br>%{percent}<extra></extra>',
+            'labels': labels,
+            'marker': {'colors': colors},
+            'textinfo': 'label+percent',
+            'textposition': 'outside',
+            'values': values,
+            'type': 'pie'
+        }],
+        {
+            'title': _centered_title("Distribution de la Supply"),
+            'showlegend': True,
+            'height': 400,
+            'margin': {'t': 80, 'b': 20, 'l': 20, 'r': 20}
+        }
     )
-    
-    return fig
 
 
-def create_dilution_projection(
+def dilution_projection_spec(
     circulating_supply: float,
     scenario_name: str = None,
     inflation_rate: float = 5.0,
-    years: int = 5
-) -> go.Figure:
-    """
-    Crée une projection de dilution sur X années.
-    
-    Args:
-        circulating_supply: Supply actuelle en circulation
-        scenario_name: Nom du scénario (pour projection spécifique)
-        inflation_rate: Taux d'inflation annuel par défaut (%)
-        years: Nombre d'années à projeter
+    years: int = 5,
+    granularity: str = 'yearly',
+    projection: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Spécification de la projection de dilution (voir create_dilution_projection)."""
+    if projection is None:
+        # Obtenir les taux d'inflation par année
+        scenario = get_scenario(scenario_name) if scenario_name else None
+        if scenario:
+            inflation_rates = project_rates(scenario.projection, years)
+        else:
+            inflation_rates = [inflation_rate] * years
         
-    Returns:
-        Figure Plotly
-    """
-    # Obtenir les taux d'inflation par année
-    if scenario_name:
-        inflation_rates = get_inflation_projection(scenario_name, years)
+        # Calculer la supply cumulée et le % de dilution depuis le début
+        projection = project_supply(circulating_supply, inflation_rates, granularity)
+    yearly = granularity == 'yearly'
+    if yearly:
+        supply_values = projection['supply'].tolist()
+        dilution_pct = projection['dilution_pct'].tolist()
+        # Libellés tirés de la projection (qui peut être fournie pour un autre horizon que `years`)
+        year_labels = [f'Année {t:g}' for t in np.asarray(projection['time']).tolist()]
+        trace_type = 'scatter'
     else:
-        inflation_rates = [inflation_rate] * years
-    
-    # Calculer la supply cumulée
-    year_labels = ['Année 0'] + [f'Année {i+1}' for i in range(years)]
-    supply_values = [circulating_supply]
-    
-    current_supply = circulating_supply
-    for rate in inflation_rates:
-        current_supply = current_supply * (1 + rate / 100)
-        supply_values.append(current_supply)
-    
-    # Calculer le % de dilution depuis le début
-    dilution_pct = [(s / circulating_supply - 1) * 100 for s in supply_values]
-    
-    # Créer le graphique avec deux axes Y
-    fig = go.Figure()
+        # Pas fins : réduction LTTB sur la supply et rendu WebGL des longues séries
+        year_labels, (supply_values, dilution_pct), trace_type = _reduce_series(
+            projection['time'], projection['supply'], projection['supply'], projection['dilution_pct']
+        )
     
     # Ligne de supply (axe Y gauche)
-    fig.add_trace(go.Scatter(
-        x=year_labels,
-        y=supply_values,
-        name='Supply totale',
-        mode='lines+markers',
-        line=dict(color='#6366f1', width=3),
-        marker=dict(size=8),
-        hovertemplate='<b>%{x}</b><br>Supply: %{y:,.0f}<extra></extra>'
-    ))
+    data = [{
+        'hovertemplate': '<b>%{x}</b><br>Supply: %{y:,.0f}<extra></extra>',
+        'line': {'color': '#6366f1', 'width': 3},
+        'marker': {'size': 8},
+        'mode': 'lines+markers' if yearly else 'lines',
+        'name': 'Supply totale',
+        'x': year_labels,
+        'y': supply_values,
+        'type': trace_type
+    }]
     
-    # Barres de dilution (axe Y droit)
-    fig.add_trace(go.Bar(
-        x=year_labels,
-        y=dilution_pct,
-        name='Dilution cumulée',
-        marker=dict(
-            color=dilution_pct,
-            colorscale='Reds',
-            showscale=False
-        ),
-        yaxis='y2',
-        hovertemplate='<b>%{x}</b><br>Dilution: %{y:.1f}%<extra></extra>',
-        opacity=0.6
-    ))
+    # Dilution (axe Y droit) : barres par année, aire pour les pas fins
+    if yearly:
+        data.append({
+            'hovertemplate': '<b>%{x}</b><br>Dilution: %{y:.1f}%<extra></extra>',
+            'marker': {'color': dilution_pct, 'colorscale': _colorscale('Reds'), 'showscale': False},
+            'name': 'Dilution cumulée',
+            'opacity': 0.6,
+            'x': year_labels,
+            'y': dilution_pct,
+            'yaxis': 'y2',
+            'type': 'bar'
+        })
+    else:
+        data.append({
+            'fill': 'tozeroy',
+            'hovertemplate': 'Année %{x:.2f}<br>Dilution: %{y:.1f}%<extra></extra>',
+            'line': {'color': '#ef4444', 'width': 1},
+            'mode': 'lines',
+            'name': 'Dilution cumulée',
+            'opacity': 0.6,
+            'x': year_labels,
+            'y': dilution_pct,
+            'yaxis': 'y2',
+            'type': trace_type
+        })
     
-    fig.update_layout(
-        title={
-            'text': "Projection de Dilution",
-            'x': 0.5,
-            'xanchor': 'center'
+    return _figure_spec(data, {
+        'title': _centered_title("Projection de Dilution"),
+        'xaxis': {'title': {'text': 'Période' if yearly else 'Années'}},
+        'yaxis': {
+            'title': {'text': 'Supply', 'font': {'color': '#6366f1'}},
+            'tickfont': {'color': '#6366f1'}
         },
-        xaxis=dict(title='Période'),
-        yaxis=dict(
-            title='Supply',
-            titlefont=dict(color='#6366f1'),
-            tickfont=dict(color='#6366f1')
-        ),
-        yaxis2=dict(
-            title='Dilution cumulée (%)',
-            titlefont=dict(color='#ef4444'),
-            tickfont=dict(color='#ef4444'),
-            overlaying='y',
-            side='right'
-        ),
-        hovermode='x unified',
-        height=450,
-        showlegend=True,
-        legend=dict(
-            orientation='h',
-            yanchor='bottom',
-            y=1.02,
-            xanchor='right',
-            x=1
-        ),
-        margin=dict(t=100, b=60, l=60, r=60)
-    )
-    
-    return fig
+        'yaxis2': {
+            'title': {'text': 'Dilution cumulée (%)', 'font': {'color': '#ef4444'}},
+            'tickfont': {'color': '#ef4444'},
+            'overlaying': 'y',
+            'side': 'right'
+        },
+        'hovermode': 'x unified',
+        'height': 450,
+        'showlegend': True,
+        'legend': dict(_TOP_LEGEND),
+        'margin': {'t': 100, 'b': 60, 'l': 60, 'r': 60}
+    })
 
 
-def create_score_breakdown_chart(score_data: Dict[str, Any]) -> go.Figure:
-    """
-    Crée un graphique en barres des scores par catégorie.
-    
-    Args:
-        score_data: Résultats de calculate_viability_index()
-        
-    Returns:
-        Figure Plotly
-    """
+def score_breakdown_spec(score_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Spécification des barres de scores (voir create_score_breakdown_chart)."""
     categories = ['Inflation', 'Distribution', 'Utilité', 'Gouvernance', 'Incitations', 'Liquidité', 'Adoption', 'Sécurité']
     scores = [
         score_data['inflation_score'],
@@ -209,56 +409,42 @@ def create_score_breakdown_chart(score_data: Dict[str, Any]) -> go.Figure:
         else:
             colors.append('#ef4444')  # Rouge
     
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        x=categories,
-        y=scores,
-        marker=dict(color=colors),
-        text=[f"{s:.1f}<br>({w:.0f}%)" for s, w in zip(scores, weights)],
-        textposition='outside',
-        hovertemplate='<b>%{x}</b><br>Score: %{y:.1f}/100<extra></extra>'
-    ))
-    
-    # Ligne de référence à 50
-    fig.add_hline(
-        y=50,
-        line_dash="dash",
-        line_color="gray",
-        annotation_text="Seuil minimal",
-        annotation_position="right"
-    )
-    
-    fig.update_layout(
-        title={
-            'text': "Scores par Composante (pondération entre parenthèses)",
-            'x': 0.5,
-            'xanchor': 'center'
-        },
-        yaxis=dict(
-            title='Score / 100',
-            range=[0, 105]
-        ),
-        xaxis=dict(title=''),
-        height=400,
-        showlegend=False,
-        margin=dict(t=80, b=60, l=60, r=40)
+    return _figure_spec(
+        [{
+            'hovertemplate': '<b>%{x}</b><br>Score: %{y:.1f}/100<extra></extra>',
+            'marker': {'color': colors},
+            'text': [f"{s:.1f}<br>({w:.0f}%)" for s, w in zip(scores, weights)],
+            'textposition': 'outside',
+            'x': categories,
+            'y': scores,
+            'type': 'bar'
+        }],
+        {
+            # Ligne de référence à 50
+            'shapes': [{
+                'line': {'color': 'gray', 'dash': 'dash'},
+                'type': 'line',
+                'x0': 0, 'x1': 1, 'xref': 'x domain',
+                'y0': 50, 'y1': 50, 'yref': 'y'
+            }],
+            'annotations': [{
+                'showarrow': False,
+                'text': 'Seuil minimal',
+                'x': 1, 'xanchor': 'left', 'xref': 'x domain',
+                'y': 50, 'yanchor': 'middle', 'yref': 'y'
+            }],
+            'title': _centered_title("Scores par Composante (pondération entre parenthèses)"),
+            'yaxis': {'title': {'text': 'Score / 100'}, 'range': [0, 105]},
+            'xaxis': {'title': {'text': ''}},
+            'height': 400,
+            'showlegend': False,
+            'margin': {'t': 80, 'b': 60, 'l': 60, 'r': 40}
+        }
     )
-    
-    return fig
 
 
-def create_gauge_chart(score: float, title: str = "Tokenomics Viability Index") -> go.Figure:
-    """
-    Crée une jauge circulaire pour le score final.
-    
-    Args:
-        score: Score final (0-100)
-        title: Titre du graphique
-        
-    Returns:
-        Figure Plotly
-    """
+def gauge_chart_spec(score: float, title: str = "Tokenomics Viability Index") -> Dict[str, Any]:
+    """Spécification de la jauge du score final (voir create_gauge_chart)."""
     # Déterminer la couleur selon le score
     if score >= 80:
         color = '#10b981'  # Vert
@@ -271,87 +457,343 @@ def create_gauge_chart(score: float, title: str = "Tokenomics Viability Index")
     else:
         color = '#ef4444'  # Rouge
     
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number+delta",
-        value=score,
-        domain={'x': [0, 1], 'y': [0, 1]},
-        title={'text': title, 'font': {'size': 24}},
-        number={'suffix': "/100", 'font': {'size': 48}},
-        gauge={
-            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkgray"},
-            'bar': {'color': color, 'thickness': 0.75},
-            'bgcolor': "white",
-            'borderwidth': 2,
-            'bordercolor': "gray",
-            'steps': [
-                {'range': [0, 35], 'color': '#fee2e2'},
-                {'range': [35, 50], 'color': '#fed7aa'},
-                {'range': [50, 65], 'color': '#fef3c7'},
-                {'range': [65, 80], 'color': '#d9f99d'},
-                {'range': [80, 100], 'color': '#d1fae5'}
-            ],
-            'threshold': {
-                'line': {'color': "red", 'width': 4},
-                'thickness': 0.75,
-                'value': 50
-            }
+    return _figure_spec(
+        [{
+            'domain': {'x': [0, 1], 'y': [0, 1]},
+            'gauge': {
+                'axis': {'range': [None, 100], 'tickcolor': 'darkgray', 'tickwidth': 1},
+                'bar': {'color': color, 'thickness': 0.75},
+                'bgcolor': 'white',
+                'bordercolor': 'gray',
+                'borderwidth': 2,
+                'steps': [
+                    {'color': '#fee2e2', 'range': [0, 35]},
+                    {'color': '#fed7aa', 'range': [35, 50]},
+                    {'color': '#fef3c7', 'range': [50, 65]},
+                    {'color': '#d9f99d', 'range': [65, 80]},
+                    {'color': '#d1fae5', 'range': [80, 100]}
+                ],
+                'threshold': {'line': {'color': 'red', 'width': 4}, 'thickness': 0.75, 'value': 50}
+            },
+            'mode': 'gauge+number+delta',
+            'number': {'font': {'size': 48}, 'suffix': '/100'},
+            'title': {'font': {'size': 24}, 'text': title},
+            'value': score,
+            'type': 'indicator'
+        }],
+        {
+            'margin': {'t': 80, 'b': 20, 'l': 40, 'r': 40},
+            'height': 350
         }
+    )
+
+
+def inflation_comparison_spec(scenarios: List[str], years: int = 5, granularity: str = 'yearly') -> Dict[str, Any]:
+    """Spécification de la comparaison d'inflation (voir create_inflation_comparison)."""
+    projection = project_scenarios(scenarios, years, granularity)
+    yearly = granularity == 'yearly'
+    
+    data = []
+    for scenario, rates in zip(scenarios, projection['inflation_rate']):
+        if yearly:
+            x, y, trace_type = [f'An {i+1}' for i in range(years)], rates.tolist(), 'scatter'
+        else:
+            # Taux en vigueur au début de chaque pas, réduits par LTTB au-delà de MAX_TRACE_POINTS
+            x, (y,), trace_type = _reduce_series(projection['time'][:-1], rates, rates)
+        data.append({
+            'line': {'width': 2},
+            'marker': {'size': 8},
+            'mode': 'lines+markers' if yearly else 'lines',
+            'name': scenario,
+            'x': x,
+            'y': y,
+            'type': trace_type
+        })
+    
+    return _figure_spec(data, {
+        'title': _centered_title("Comparaison des Taux d'Inflation Annuels"),
+        'xaxis': {'title': {'text': 'Année' if yearly else 'Années'}},
+        'yaxis': {'title': {'text': 'Taux d\'inflation (%)'}},
+        'hovermode': 'x unified',
+        'height': 450,
+        'showlegend': True,
+        'legend': {'orientation': 'v', 'yanchor': 'top', 'y': 0.99, 'xanchor': 'left', 'x': 0.01},
+        'margin': {'t': 80, 'b': 60, 'l': 60, 'r': 40}
+    })
+
+
+def supply_fan_spec(simulation: Dict[str, Any]) -> Dict[str, Any]:
+    """Spécification du graphique en éventail (voir create_supply_fan_chart)."""
+    months = simulation['months'].tolist()
+    levels = simulation['quantiles']
+    supply = simulation['supply'].tolist()
+    
+    data = []
+    # Bandes du plus large au plus étroit, chacune remplie jusqu'à sa borne basse
+    for i in range(len(levels) // 2):
+        low, high = levels[i], levels[-1 - i]
+        data.append({
+            'hoverinfo': 'skip',
+            'line': {'width': 0},
+            'mode': 'lines',
+            'showlegend': False,
+            'x': months,
+            'y': supply[i],
+            'type': 'scatter'
+        })
+        data.append({
+            'fill': 'tonexty',
+            'fillcolor': f'rgba(99, 102, 241, {0.15 + 0.15 * i:.2f})',
+            'hoverinfo': 'skip',
+            'line': {'width': 0},
+            'mode': 'lines',
+            'name': f'P{low * 100:.0f} – P{high * 100:.0f}',
+            'x': months,
+            'y': supply[-1 - i],
+            'type': 'scatter'
+        })
+    
+    if len(levels) % 2:
+        data.append({
+            'hovertemplate': 'Mois %{x}<br>Supply: %{y:,.0f}<extra></extra>',
+            'line': {'color': '#6366f1', 'width': 3},
+            'mode': 'lines',
+            'name': 'Médiane',
+            'x': months,
+            'y': supply[len(levels) // 2],
+            'type': 'scatter'
+        })
+    
+    return _figure_spec(data, {
+        'title': _centered_title("Supply simulée (émissions vs burn)"),
+        'xaxis': {'title': {'text': 'Mois'}},
+        'yaxis': {'title': {'text': 'Supply'}},
+        'hovermode': 'x unified',
+        'height': 450,
+        'showlegend': True,
+        'legend': dict(_TOP_LEGEND),
+        'margin': {'t': 80, 'b': 60, 'l': 60, 'r': 40}
+    })
+
+
+def score_trend_spec(trend: Dict[str, Any], components: bool = True) -> Dict[str, Any]:
+    """Spécification de l'historique du score (voir create_score_trend_chart)."""
+    dates = trend['date'].astype(str).tolist()
+    
+    data = [{
+        'hovertemplate': '%{x}<br>Score: %{y:.1f}<extra></extra>',
+        'line': {'color': '#6366f1', 'width': 3},
+        'mode': 'lines',
+        'name': 'Score final',
+        'x': dates,
+        'y': trend['final_score'].tolist(),
+        'type': 'scatter'
+    }]
+    
+    if components:
+        for field in ('inflation_score', 'distribution_score', 'utility_score', 'governance_score', 'incentives_score'):
+            if field in trend:
+                data.append({
+                    'line': {'width': 1},
+                    'mode': 'lines',
+                    'name': field.replace('_score', '').capitalize(),
+                    'visible': 'legendonly',
+                    'x': dates,
+                    'y': trend[field].tolist(),
+                    'type': 'scatter'
+                })
+    
+    return _figure_spec(data, {
+        'title': _centered_title("Historique du score"),
+        'xaxis': {'title': {'text': 'Date'}},
+        'yaxis': {'title': {'text': 'Score'}, 'range': [0, 100]},
+        'hovermode': 'x unified',
+        'height': 400,
+        'showlegend': True,
+        'legend': dict(_TOP_LEGEND),
+        'margin': {'t': 80, 'b': 60, 'l': 60, 'r': 40}
+    })
+
+
+def score_histogram_spec(scores: List[float], bin_size: float = 5.0) -> Dict[str, Any]:
+    """Spécification de la répartition des scores d'un portefeuille (voir create_score_histogram)."""
+    edges = np.arange(0.0, 100.0 + bin_size, bin_size)
+    counts, _ = np.histogram(np.clip(scores, 0, 100), bins=edges)
+    lows = edges[:-1]
+    # Couleurs des seuils de verdict (vert >= 65, orange >= 35, rouge en dessous)
+    colors = ['#10b981' if low >= 65 else '#f59e0b' if low >= 35 else '#ef4444' for low in lows]
+    
+    return _figure_spec([{
+        'hovertemplate': '%{customdata}<br>%{y} token(s)<extra></extra>',
+        'customdata': [f'{low:g}–{low + bin_size:g}' for low in lows],
+        'marker': {'color': colors},
+        'width': bin_size * 0.9,
+        'x': (lows + bin_size / 2).tolist(),
+        'y': counts.tolist(),
+        'type': 'bar'
+    }], {
+        'title': _centered_title(f"Répartition des scores ({len(scores)} tokens)"),
+        'xaxis': {'title': {'text': 'Score'}, 'range': [0, 100]},
+        'yaxis': {'title': {'text': 'Tokens'}},
+        'height': 350,
+        'showlegend': False,
+        'margin': {'t': 80, 'b': 60, 'l': 60, 'r': 40}
+    })
+
+
+# ========== FIGURES (validées) ==========
+
+
+@timed("chart.supply_distribution")
+@cached_figure()
+def create_supply_distribution_chart(
+    circulating_supply: float,
+    total_supply: float,
+    max_supply: float,
+    locked_breakdown: Optional[Dict[str, float]] = None
+) -> go.Figure:
+    """
+    Crée un camembert de distribution de la supply.
+    
+    Args:
+        circulating_supply: Supply en circulation
+        total_supply: Supply totale actuelle
+        max_supply: Supply maximale
+        locked_breakdown: Supply bloquée par bucket de vesting
+            (voir tokenomics.vesting.locked_breakdown), remplace la part "Locked/Vested"
+        
+    Returns:
+        Figure Plotly
+    """
+    return _to_figure(supply_distribution_spec(circulating_supply, total_supply, max_supply, locked_breakdown))
+
+
+@timed("chart.dilution_projection")
+@cached_figure(_scenario_projection_key)
+def create_dilution_projection(
+    circulating_supply: float,
+    scenario_name: str = None,
+    inflation_rate: float = 5.0,
+    years: int = 5,
+    granularity: str = 'yearly',
+    projection: Optional[Dict[str, Any]] = None
+) -> go.Figure:
+    """
+    Crée une projection de dilution sur X années.
+    
+    Args:
+        circulating_supply: Supply actuelle en circulation
+        scenario_name: Nom du scénario (pour projection spécifique)
+        inflation_rate: Taux d'inflation annuel si le scénario est absent ou inconnu (%)
+        years: Nombre d'années à projeter
+        granularity: Pas de la projection ('yearly', 'monthly' ou 'daily') ;
+            au-delà de MAX_TRACE_POINTS points, la série est réduite par LTTB
+            et tracée en WebGL (scattergl)
+        projection: Projection déjà calculée (résultat de `project_supply`,
+            ex : cache des scénarios), utilisée telle quelle
+        
+    Returns:
+        Figure Plotly
+    """
+    return _to_figure(dilution_projection_spec(
+        circulating_supply, scenario_name, inflation_rate, years, granularity, projection
     ))
+
+
+@timed("chart.score_breakdown")
+@cached_figure()
+def create_score_breakdown_chart(score_data: Dict[str, Any]) -> go.Figure:
+    """
+    Crée un graphique en barres des scores par catégorie.
     
-    fig.update_layout(
-        height=350,
-        margin=dict(t=80, b=20, l=40, r=40)
-    )
+    Args:
+        score_data: Résultats de calculate_viability_index()
+        
+    Returns:
+        Figure Plotly
+    """
+    return _to_figure(score_breakdown_spec(score_data))
+
+
+@timed("chart.gauge")
+@cached_figure()
+def create_gauge_chart(score: float, title: str = "Tokenomics Viability Index") -> go.Figure:
+    """
+    Crée une jauge circulaire pour le score final.
     
-    return fig
+    Args:
+        score: Score final (0-100)
+        title: Titre du graphique
+        
+    Returns:
+        Figure Plotly
+    """
+    return _to_figure(gauge_chart_spec(score, title))
 
 
-def create_inflation_comparison(scenarios: List[str], years: int = 5) -> go.Figure:
+@timed("chart.inflation_comparison")
+@cached_figure(_scenarios_projection_key)
+def create_inflation_comparison(scenarios: List[str], years: int = 5, granularity: str = 'yearly') -> go.Figure:
     """
     Compare les projections d'inflation de plusieurs scénarios.
     
+    Aux pas fins, chaque série est réduite par LTTB à MAX_TRACE_POINTS points
+    et tracée en WebGL au-delà de WEBGL_THRESHOLD points.
+    
     Args:
         scenarios: Liste des noms de scénarios à comparer
         years: Nombre d'années
+        granularity: Pas de la projection ('yearly', 'monthly' ou 'daily')
         
     Returns:
         Figure Plotly
     """
-    fig = go.Figure()
+    return _to_figure(inflation_comparison_spec(scenarios, years, granularity))
+
+
+@timed("chart.supply_fan")
+@cached_figure()
+def create_supply_fan_chart(simulation: Dict[str, Any]) -> go.Figure:
+    """
+    Graphique en éventail des quantiles de supply d'une simulation Monte Carlo.
     
-    for scenario in scenarios:
-        inflation_rates = get_inflation_projection(scenario, years)
-        year_labels = [f'An {i+1}' for i in range(years)]
+    Args:
+        simulation: Résultat de tokenomics.simulation.simulate_burn
+            (quantiles symétriques autour de la médiane)
         
-        fig.add_trace(go.Scatter(
-            x=year_labels,
-            y=inflation_rates,
-            name=scenario,
-            mode='lines+markers',
-            line=dict(width=2),
-            marker=dict(size=8)
-        ))
-    
-    fig.update_layout(
-        title={
-            'text': "Comparaison des Taux d'Inflation Annuels",
-            'x': 0.5,
-            'xanchor': 'center'
-        },
-        xaxis=dict(title='Année'),
-        yaxis=dict(title='Taux d\'inflation (%)'),
-        hovermode='x unified',
-        height=450,
-        showlegend=True,
-        legend=dict(
-            orientation='v',
-            yanchor='top',
-            y=0.99,
-            xanchor='left',
-            x=0.01
-        ),
-        margin=dict(t=80, b=60, l=60, r=40)
-    )
+    Returns:
+        Figure Plotly
+    """
+    return _to_figure(supply_fan_spec(simulation))
+
+
+@timed("chart.score_trend")
+@cached_figure()
+def create_score_trend_chart(trend: Dict[str, Any], components: bool = True) -> go.Figure:
+    """
+    Évolution journalière du score d'un token.
     
-    return fig
+    Args:
+        trend: Résultat de tokenomics.trends.TrendStore.query
+        components: Afficher aussi les scores par composante
+        
+    Returns:
+        Figure Plotly
+    """
+    return _to_figure(score_trend_spec(trend, components))
+
 
+@timed("chart.score_histogram")
+@cached_figure()
+def create_score_histogram(scores: List[float], bin_size: float = 5.0) -> go.Figure:
+    """
+    Histogramme des scores finaux d'un portefeuille.
+    
+    Args:
+        scores: Scores finaux (0-100)
+        bin_size: Largeur des classes en points de score
+        
+    Returns:
+        Figure Plotly
+    """
+    return _to_figure(score_histogram_spec(scores, bin_size))